@@ -1 +1,37 @@
-from pyzayo.client import ZayoClient  # noqa
+"""
+The client classes are imported on first use (PEP 562), so that the modules
+that do not access the API, such as `pyzayo.completion` used by the zayocli
+shell completion, can be imported without the HTTP stack.
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from importlib import import_module
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["ZayoClient", "ZayoClientPool"]
+
+# the module of each lazily imported name.
+_LAZY_IMPORTS = {"ZayoClient": "pyzayo.client", "ZayoClientPool": "pyzayo.pool"}
+
+
+def __getattr__(name: str):
+    """ import the client class on first use """
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """ includes the lazily imported names """
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
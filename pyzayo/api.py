@@ -1,18 +1,39 @@
 """
 This module contains the class used to access the ZAYO API via asyncio.
+
+The response content encoding is negotiated: the Accept-Encoding header lists
+the encodings the installed httpx can decode, the most compact first; "br"
+and "zstd" are available when the brotli and zstandard packages are installed.
+The transferred (compressed) and decoded bytes are counted per API route.
 """
 
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, Dict
+import time
+import re
+
 # -----------------------------------------------------------------------------
 # Public Imports
 # -----------------------------------------------------------------------------
 
-from httpx import AsyncClient
+from httpx import AsyncClient, Request, Response, ResponseNotRead
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo import consts
+from pyzayo.ratelimit import TokenBucket
+from pyzayo import profiling
 
 # -----------------------------------------------------------------------------
 # Module Exports
 # -----------------------------------------------------------------------------
 
-__all__ = ["ZayoAPI"]
+__all__ = ["ZayoAPI", "ENCODING_PREFERENCE"]
 
 
 # -----------------------------------------------------------------------------
@@ -21,6 +42,20 @@ __all__ = ["ZayoAPI"]
 #
 # -----------------------------------------------------------------------------
 
+# The response content encodings, in order of preference; only those that
+# httpx can decode are requested.
+ENCODING_PREFERENCE = ("zstd", "br", "gzip", "deflate")
+
+# The route templates used to count the transferred bytes per route, in place
+# of the request paths that include a case number or notification name.
+_ROUTE_PATTERNS = [
+    (route, re.compile(re.sub(r"\\{\w+\\}", "[^/]+", re.escape(route)) + "$"))
+    for route in (
+        consts.ZAYO_SM_ROUTE_MTC_NOTIFS_BY_CASE,
+        consts.ZAYO_SM_ROUTE_MTC_NOTIFS_BY_NAME,
+    )
+]
+
 
 class ZayoAPI(AsyncClient):
     """
@@ -29,8 +64,107 @@ class ZayoAPI(AsyncClient):
     uses this class to access the Zayo API system.
     """
 
-    def __init__(self, base_url, access_token, **kwargs):
-        """ init the client with the acess token and set content for JSON """
+    def __init__(
+        self,
+        base_url,
+        access_token: Optional[str] = None,
+        rate_limit: Optional[TokenBucket] = None,
+        **kwargs,
+    ):
+        """
+        Init the client with the acess token and set content for JSON.  When the
+        `rate_limit` is provided each request first acquires a token from it.
+        The token may instead be provided by the `auth`, a
+        `pyzayo.auth.TokenAuth`, that refreshes it as needed.
+        """
         super().__init__(base_url=base_url, **kwargs)
-        self.headers["Authorization"] = access_token
+        self.rate_limit = rate_limit
+        if access_token:
+            self.headers["Authorization"] = access_token
         self.headers["content-type"] = "application/json"
+        self.headers["accept-encoding"] = _accept_encoding(
+            self.headers.get("accept-encoding", "")
+        )
+
+        # per route: the number of responses, the bytes transferred, and the
+        # decoded content bytes.
+        self.transfer_stats: Dict[str, Dict[str, int]] = dict()
+
+    async def send(self, request: Request, **kwargs) -> Response:
+        """
+        Send the request, subject to the rate limit.  The request is timed
+        while profiling is enabled, see `pyzayo.profiling`.
+        """
+        if self.rate_limit:
+            with profiling.phase("ratelimit"):
+                await self.rate_limit.acquire()
+
+        profiler = profiling.active()
+        start = time.perf_counter()
+        res = None
+        try:
+            res = await super().send(request, **kwargs)
+            self._add_transfer(request, res)
+            return res
+
+        finally:
+            if profiler:
+                elapsed = time.perf_counter() - start
+                profiler.add_phase("http", elapsed)
+                profiler.add_request(
+                    request.method,
+                    self._path(request),
+                    res.status_code if res is not None else None,
+                    start,
+                    elapsed,
+                    _response_size(res) if res is not None else 0,
+                )
+
+    def _path(self, request: Request) -> str:
+        """ returns the request path relative to the base URL """
+        return request.url.path[len(self.base_url.path) :]
+
+    def _add_transfer(self, request: Request, res: Response):
+        """ count the transferred and decoded bytes of the response route """
+        try:
+            content_bytes = len(res.content)
+        except ResponseNotRead:
+            return
+
+        # the bytes received, or the Content-Length when the response content
+        # was provided by the transport rather than received.
+
+        wire_bytes = res.num_bytes_downloaded or int(
+            res.headers.get("content-length", 0)
+        )
+        path = self._path(request)
+        route = next(
+            (route for route, pattern in _ROUTE_PATTERNS if pattern.match(path)), path
+        )
+        stats = self.transfer_stats.setdefault(
+            route, {"responses": 0, "wire_bytes": 0, "content_bytes": 0}
+        )
+        stats["responses"] += 1
+        stats["wire_bytes"] += wire_bytes
+        stats["content_bytes"] += content_bytes
+
+        profiling.count("bytes.wire", wire_bytes)
+        profiling.count("bytes.content", content_bytes)
+
+
+def _accept_encoding(supported: str) -> str:
+    """
+    Returns the Accept-Encoding value listing the `supported` encodings, the
+    httpx default value, in the order of ENCODING_PREFERENCE.
+    """
+    supported = {enc.strip() for enc in supported.split(",") if enc.strip()}
+    ordered = [enc for enc in ENCODING_PREFERENCE if enc in supported]
+    return ", ".join(ordered + sorted(supported - set(ordered)))
+
+
+def _response_size(res: Response) -> int:
+    """ returns the response content size, if read, or its content-length """
+    try:
+        return len(res.content)
+    except ResponseNotRead:
+        return int(res.headers.get("content-length", 0))
@@ -0,0 +1,156 @@
+"""
+This module contains the TokenAuth used by the client to authorize each API
+request with the current access token.
+
+The token is shared by all of the threads, and coroutines, using a client.
+It is refreshed ahead of its expiry, and when a request is rejected with "401
+Unauthorized"; the refresh is synchronized so that concurrent requests that
+find the token stale cause a single authentication request.  From the client
+loop thread the refresh runs in the default executor, so that the loop
+continues to serve the other requests.
+
+Examples
+--------
+    auth = TokenAuth(fetch_token=request_token)
+    auth.refresh()
+
+    api = ZayoAPI(base_url=consts.ZAYO_URL_SM, auth=auth)
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, Optional, Callable, Generator, AsyncGenerator
+from http import HTTPStatus
+import asyncio
+import threading
+import time
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import httpx
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo import consts
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["TokenAuth"]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class TokenAuth(httpx.Auth):
+    """
+    Thread-safe access token authorization of the API requests.
+
+    Parameters
+    ----------
+    fetch_token: Callable[[], Dict]
+        Requests a new token and returns the authentication response payload,
+        with the "access_token" and "expires_in" values.
+
+    margin: float, optional
+        The number of seconds before its expiry that the token is refreshed,
+        `consts.AUTH_REFRESH_MARGIN` by default.
+
+    Notes
+    -----
+    Until the first `refresh`, requests are sent without a token; as by the
+    offline transports that do not require authentication.
+    """
+
+    def __init__(
+        self, fetch_token: Callable[[], Dict], margin: Optional[float] = None
+    ):
+        """ no token until the first refresh """
+        self.margin = consts.AUTH_REFRESH_MARGIN if margin is None else margin
+        self.payload: Optional[Dict] = None
+        self.refreshes = 0
+        self._fetch_token = fetch_token
+        self._expires = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def token(self) -> Optional[str]:
+        """ the current access token value, None if not authenticated """
+        payload = self.payload
+        return payload["access_token"] if payload else None
+
+    @property
+    def expired(self) -> bool:
+        """ True when the token is within the margin of its expiry """
+        return time.monotonic() >= self._expires
+
+    def refresh(self, stale: Optional[str] = None) -> str:
+        """
+        Returns a valid token.  A new token is requested unless the current
+        token is valid and is not the `stale` token, that is unless another
+        caller has already refreshed it.
+        """
+        with self._lock:
+            token = self.token
+            if token and token != stale and not self.expired:
+                return token
+
+            payload = self._fetch_token()
+            lifetime = float(payload.get("expires_in") or consts.AUTH_TOKEN_LIFETIME)
+            self._expires = time.monotonic() + lifetime - self.margin
+            self.payload = payload
+            self.refreshes += 1
+            return payload["access_token"]
+
+    def sync_auth_flow(
+        self, request: httpx.Request
+    ) -> Generator[httpx.Request, httpx.Response, None]:
+        """ authorize the request, retrying once if the token is rejected """
+        token = self.token
+        if token and self.expired:
+            token = self.refresh(stale=token)
+
+        if not token:
+            yield request
+            return
+
+        request.headers["Authorization"] = token
+        response = yield request
+
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            request.headers["Authorization"] = self.refresh(stale=token)
+            yield request
+
+    async def async_auth_flow(
+        self, request: httpx.Request
+    ) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        """ authorize the request, retrying once if the token is rejected """
+        token = self.token
+        if token and self.expired:
+            token = await self._arefresh(token)
+
+        if not token:
+            yield request
+            return
+
+        request.headers["Authorization"] = token
+        response = yield request
+
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            request.headers["Authorization"] = await self._arefresh(token)
+            yield request
+
+    async def _arefresh(self, stale: str) -> str:
+        """ refresh in the default executor, so as not to block the loop """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.refresh, stale)
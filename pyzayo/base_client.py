@@ -6,18 +6,29 @@ specific API functional areas, such as maintenance.
 # System Imports
 # -----------------------------------------------------------------------------
 
-from typing import Optional, List, Dict
+from typing import (
+    Optional,
+    List,
+    Dict,
+    Set,
+    Iterable,
+    Iterator,
+    AsyncIterator,
+    Tuple,
+)
 import math
 from os import getenv
 import asyncio
-from itertools import chain
+import time
+from collections import deque, defaultdict
+from copy import deepcopy
 
 # -----------------------------------------------------------------------------
 # Public Imports
 # -----------------------------------------------------------------------------
 
 import httpx
-from tenacity import retry, wait_random_exponential, retry_if_exception
+from tenacity import retry, wait_random_exponential, retry_if_exception_type
 
 # -----------------------------------------------------------------------------
 # Private Imports
@@ -25,6 +36,14 @@ from tenacity import retry, wait_random_exponential, retry_if_exception
 
 from pyzayo import consts
 from pyzayo.api import ZayoAPI
+from pyzayo.auth import TokenAuth
+from pyzayo.loop_thread import LoopThread
+from pyzayo.ratelimit import TokenBucket
+from pyzayo.paging import PageSizer, PAGE_SIZE_REJECT_STATUSES
+from pyzayo.projection import make_projection, Projection
+from pyzayo import completion
+from pyzayo import parsing
+from pyzayo import profiling
 
 # -----------------------------------------------------------------------------
 # Module Exports
@@ -44,43 +63,236 @@ class ZayoClientBase(object):
     This is a base class for any Zayo Client.  This class provides the common
     functionality that would be used by subclassed clients such as the Zayo
     maintenance client, ZayoMatenanceMixin.
+
+    A client instance may be shared by many threads, for example the workers
+    of a ThreadPoolExecutor: the requests of all threads run on the client
+    loop thread and share its connection pool, the access token is refreshed
+    once for all threads, see `pyzayo.auth.TokenAuth`, and the request params
+    of each call are copied rather than modified.
     """
 
-    def __init__(self):
-        """ authorize to the ZAYO API and setup for the mainteance functioanl area """
-        self._auth_payload: Optional[dict] = None
-        self.authenticate()
-        self.api = ZayoAPI(base_url=consts.ZAYO_URL_SM, access_token=self.access_token)
+    def __init__(
+        self,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        credentials: Optional[Dict[str, str]] = None,
+        loop_thread: Optional[LoopThread] = None,
+        rate_limit: Optional[float] = None,
+        page_buffer: Optional[int] = None,
+        projections: Optional[Dict[str, Iterable[str]]] = None,
+        base_url: Optional[str] = None,
+        auth_url: Optional[str] = None,
+        completion_index: Optional[bool] = False,
+    ):
+        """
+        Authorize to the ZAYO API and setup for the mainteance functioanl area.
+
+        Parameters
+        ----------
+        transport: httpx.AsyncBaseTransport, optional
+            The transport used by the ZayoAPI instance in place of the default
+            network transport.  Offline transports, such as the
+            `pyzayo.snapshot.SnapshotTransport`, set the attribute
+            `requires_auth` to False so that authentication is not performed.
+
+        credentials: Dict[str, str], optional
+            The "client_id" and "client_secret" values used to authenticate, in
+            place of the values from the environment.
+
+        loop_thread: LoopThread, optional
+            The background loop thread shared with other clients, for example
+            those of a `pyzayo.pool.ZayoClientPool`; by default the client
+            creates, and closes, its own.
+
+        rate_limit: float, optional
+            The maximum number of API requests per second sent by this client,
+            unlimited by default.
+
+        page_buffer: int, optional
+            The maximum number of pages fetched ahead of the consumer of the
+            records, `consts.PAGE_PREFETCH_COUNT` by default; this bounds the
+            memory used by the paging methods whatever the result size.
+
+        projections: Dict[str, Iterable[str]], optional
+            The fields dropped from the records of an API route, by route, as
+            soon as the records are decoded; see `set_projection`.
+
+        base_url: str, optional
+            The Zayo API service-management URL, `consts.ZAYO_URL_SM` by
+            default; for example the URL of a mock server, see
+            `pyzayo.loadtest`.
+
+        auth_url: str, optional
+            The Zayo API authentication URL, `consts.ZAYO_URL_AUTH` by default.
+
+        completion_index: bool, optional
+            When True the case numbers, notification names, and circuit IDs
+            of the records received are added to the shell completion index
+            when the client is closed; see `pyzayo.completion`.
+
+        Notes
+        -----
+        Unless the paging "top" count is provided by the Caller, the page size
+        of each route is negotiated, see `pyzayo.paging.PageSizer`.  Offline
+        transports that must repeat the recorded paging, such as the
+        `pyzayo.cassette.ReplayTransport`, set the attribute `adaptive_paging`
+        to False so that the fixed `consts.MAX_TOP_COUNT` is used.
+        """
+        self.page_buffer = page_buffer or consts.PAGE_PREFETCH_COUNT
+        self.page_sizer: Optional[PageSizer] = (
+            PageSizer() if getattr(transport, "adaptive_paging", True) else None
+        )
+        self.projections: Dict[str, Projection] = dict()
+        for route, exclude in (projections or {}).items():
+            self.set_projection(route, exclude)
+
+        self._completion_ids: Optional[Dict[str, Set[str]]] = (
+            defaultdict(set) if completion_index else None
+        )
+
+        self._auth_url = auth_url or consts.ZAYO_URL_AUTH
+        self._credentials = credentials
+        self._token_auth = TokenAuth(fetch_token=self._request_token)
+        if getattr(transport, "requires_auth", True):
+            self.authenticate()
+
+        # the sync facade runs all API coroutines on a single background event
+        # loop thread; that loop owns the ZayoAPI connection pool so that any
+        # number of caller threads share the same warm connections.
+
+        self._owns_loop_thread = loop_thread is None
+        self._loop_thread = loop_thread or LoopThread()
+        self.api = ZayoAPI(
+            base_url=base_url or consts.ZAYO_URL_SM,
+            auth=self._token_auth,
+            transport=transport,
+            rate_limit=TokenBucket(rate_limit) if rate_limit else None,
+        )
+
+    def __enter__(self):
+        """ context manager support; the client is closed on exit """
+        return self
+
+    def __exit__(self, *exc_info):
+        """ close the client on context manager exit """
+        self.close()
+
+    def close(self):
+        """
+        Close the API connection pool and stop the background loop thread, when
+        the loop thread is not shared.
+        """
+        if not self._loop_thread.is_running:
+            return
+
+        self._run(self.api.aclose())
+        if self._owns_loop_thread:
+            self._loop_thread.close()
+
+        if self._completion_ids:
+            self._update_completion_index()
+
+    def _update_completion_index(self):
+        """ add the IDs of the records received to the completion index """
+        index = completion.CompletionIndex()
+        try:
+            for kind, ids in self._completion_ids.items():
+                index.update(kind, ids)
+        except OSError:
+            # the index is a convenience; it must not fail the client.
+            pass
+
+        self._completion_ids.clear()
+
+    def set_projection(self, route: str, exclude: Optional[Iterable[str]] = None):
+        """
+        Drop the `exclude` fields, dotted paths, from the records of the API
+        route as soon as they are decoded, for example "emailBody" from the
+        `consts.ZAYO_SM_ROUTE_MTC_NOTIFS_BY_NAME` records; see
+        `pyzayo.projection`.  No `exclude` fields removes the projection.
+        """
+        if exclude:
+            self.projections[route] = make_projection(exclude)
+        else:
+            self.projections.pop(route, None)
+
+    def _project(self, route: str, records: List[Dict]) -> List[Dict]:
+        """
+        apply the route projection, if any, to the records; their IDs are
+        first collected for the completion index when enabled.
+        """
+        if self._completion_ids is not None:
+            completion.collect_ids(route, records, self._completion_ids)
+
+        project = self.projections.get(route)
+        if project:
+            for rec in records:
+                project(rec)
+        return records
+
+    def _run(self, coro):
+        """
+        Run the coroutine on the client background loop thread and return the
+        result.  This method is safe to call from any thread other than the
+        loop thread itself.
+        """
+        return self._loop_thread.run(coro)
+
+    async def _arun(self, coro):
+        """
+        Await the coroutine, run on the client background loop thread, from a
+        coroutine executing on any event loop.
+        """
+        if self._loop_thread.in_loop_thread():
+            return await coro
+
+        return await asyncio.wrap_future(self._loop_thread.submit(coro))
 
     @property
     def access_token(self):
-        """ returns the current access token value """
-        return self._auth_payload["access_token"]
+        """ returns the current access token value, None if not authenticated """
+        return self._token_auth.token
 
-    def authenticate(self):
+    def authenticate(self, credentials: Optional[Dict[str, str]] = None):
         """
         This method is used to authenticate to the Zayo API system using the
-        client-id and client-secret values obtained from the environment.
+        client-id and client-secret values of the `credentials`, the client
+        credentials, or, when neither is provided, obtained from the
+        environment.
 
         This method is called during instance initialization and the access
         token can be obtained via the `access_token` property.
 
         Notes
         -----
-        According to the Zayo API documentation, a token is valid for 1hr. Plan
-        accordingly.
+        According to the Zayo API documentation, a token is valid for 1hr.  The
+        token is refreshed, with the same credentials, ahead of its expiry and
+        when a request is rejected as unauthorized; see `pyzayo.auth`.
         """
-        client_id = getenv("ZAYO_CLIENT_ID")
-        client_secret = getenv("ZAYO_CLIENT_SECRET")
+        if credentials:
+            self._credentials = credentials
+
+        self._token_auth.refresh(stale=self._token_auth.token)
+
+    def _request_token(self) -> Dict:
+        """ request a new access token, returning the authentication payload """
+        credentials = self._credentials
+        if credentials:
+            client_id = credentials["client_id"]
+            client_secret = credentials["client_secret"]
+        else:
+            client_id = getenv(consts.Env["client_id"])
+            client_secret = getenv(consts.Env["client_secret"])
+
         payload = {
             "client_id": client_id,
             "client_secret": client_secret,
             "grant_type": "client_credentials",
             "scope": "openid",
         }
-        res = httpx.post(url=consts.ZAYO_URL_AUTH, data=payload)
-        res.raise_for_status()
-        self._auth_payload = res.json()
+        with profiling.phase("auth"):
+            res = httpx.post(url=self._auth_url, data=payload)
+            res.raise_for_status()
+            return res.json()
 
     def get_records_count(self, url, **params) -> int:
         """
@@ -103,16 +315,20 @@ class ZayoClientBase(object):
         -------
         The number of records matching the criterial (or all)
         """
-        loop = asyncio.get_event_loop()
+        return self._run(self._fetch_records_count(url, **params))
+
+    async def _fetch_records_count(self, url, **params) -> int:
+        """ coroutine that implements `get_records_count` """
 
         # do not request any records to be returned, just need the record count
         # from the metadata response.
 
         payload = params.copy()
         payload["paging"] = {"top": 0}
-        res = loop.run_until_complete(self.api.post(url, json=payload))
-        res.raise_for_status()
-        return res.json()["data"]["metadata"]["totalRecordCount"]
+        with profiling.phase("count"):
+            res = await self.api.post(url, json=payload)
+            res.raise_for_status()
+            return res.json()["data"]["metadata"]["totalRecordCount"]
 
     def paginate_records(self, url, **params) -> List[Dict]:
         """
@@ -131,56 +347,268 @@ class ZayoClientBase(object):
 
         Notes
         -----
-        The API is limited to return a maximum of 100 records per the "top" and
-        "step" fields of the paging criteria.  In the event there are more than
-        100 records, only the first 100 records will be returned.  The Caller
-        could use the `get_records_count` to determine the total value before
-        calling this function to create a better `params` criterial (perhaps by
-        date range) to avoid > 100 records.
+        The API limits the number of records per page, the "top" field of the
+        paging criteria, and the limit differs per route.  Unless the Caller
+        provides the "top" value, the page size is negotiated per route, see
+        `pyzayo.paging.PageSizer`, and all of the matching records are
+        returned in as many pages as needed.
+
+        The pages are requested through the same bounded pipeline as
+        `iter_pages`, so that the memory used is that of the records plus at
+        most `page_buffer` pages, whatever the result size.
 
         Returns
         -------
         List of records, each dict schema is specific to the url.
+
+        Raises
+        ------
+        httpx.HTTPStatusError
+            When the request of any page fails, for example when throttled, so
+            that an incomplete result is not mistaken for the complete one.
+        """
+        return self._run(self._fetch_records(url, **params))
+
+    def iter_pages(self, url, **params) -> Iterator[List[Dict]]:
+        """
+        This function is a generator that yields each page of records, in
+        order, as it arrives.  Up to `page_buffer` pages are requested ahead
+        of the page being consumed, so the Caller can process (or write out) a
+        page while the next ones are in flight without holding the full
+        result set in memory.  A slow Caller pauses the page requests, and
+        closing the generator early cancels those in flight.
+
+        Parameters
+        ----------
+        url: str
+            The API route endpoint
+
+        Other Parameters
+        ----------------
+        Same as `paginate_records`.
+
+        Yields
+        ------
+        List of records in each page, each dict schema is specific to the url.
+        """
+        pages = self._aiter_pages(url, params)
+        try:
+            while True:
+                try:
+                    with profiling.phase("pages.wait"):
+                        page = self._run(_anext(pages))
+                except StopAsyncIteration:
+                    return
+                yield page
+        finally:
+            if self._loop_thread.is_running:
+                self._run(pages.aclose())
+
+    def parse_records(
+        self, url, model, processes: Optional[int] = None, **params
+    ) -> List:
+        """
+        Returns all of the records, as `paginate_records`, parsed into the
+        pydantic `model`; in the order of the pages.  Each page is parsed as it
+        arrives while the following pages are requested, so the parsing
+        overlaps the network time; see `pyzayo.parsing`.
+
+        Parameters
+        ----------
+        url: str
+            The API route endpoint
+
+        model: Type[pydantic.BaseModel]
+            The record model, for example `pyzayo.mtc_models.CaseRecord`.
+
+        processes: int, optional
+            The number of worker processes parsing the pages, for very large
+            pulls; by default the pages are parsed in the calling thread.
+
+        Other Parameters
+        ----------------
+        Same as `paginate_records`.
+        """
+        return parsing.parse_records(
+            model, self.iter_pages(url, **params), processes=processes
+        )
+
+    async def _aiter_pages(self, url, params: Dict) -> AsyncIterator[List[Dict]]:
+        """
+        Async generator that implements the bounded page pipeline: each page
+        is yielded in order, with at most `page_buffer` pages requested ahead
+        of the consumer.  A new page is requested only as one is consumed, so
+        a slow consumer pauses the requests; only the decoded records of the
+        buffered pages are held.  The exception of a failed page is raised,
+        and the pages in flight are cancelled.
+        """
+        negotiate = self.page_sizer and "top" not in params.get("paging", {})
+        params, page_sz = self._paging_params(params)
+        total_recs = await self._fetch_records_count(url, **params)
+
+        if negotiate:
+            page_sz = await self.page_sizer.page_size(
+                url,
+                total=total_recs,
+                concurrency=self.page_buffer,
+                probe=lambda top: self._probe_page_size(url, params, top, total_recs),
+            )
+
+        total_pages = math.ceil(total_recs / page_sz)
+        pages = iter(range(total_pages))
+        pending = deque()
+
+        def fill():
+            for page in pages:
+                pending.append(
+                    asyncio.ensure_future(
+                        self._fetch_sized_page(url, params, page, page_sz, total_recs)
+                    )
+                )
+                if len(pending) == self.page_buffer:
+                    return
+
+        try:
+            fill()
+            while pending:
+                task = pending.popleft()
+                page = await task
+
+                # the next page is requested only once this one is consumed.
+                del task
+                yield page
+                fill()
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _paging_params(params: Dict) -> Tuple[Dict, int]:
+        """
+        returns a copy of the request params with paging criteria, and the page
+        size; the Caller's params, which may be shared by other threads, are
+        not modified.
         """
         if params:
+            params = deepcopy(params)
             paging = params.setdefault("paging", {})
             page_sz = paging.setdefault("top", consts.MAX_TOP_COUNT)
         else:
             page_sz = consts.MAX_TOP_COUNT
             params = dict(paging=dict(top=page_sz, skip=0))
 
-        loop = asyncio.get_event_loop()
-        total_recs = self.get_records_count(url=url, **params)
+        return params, page_sz
 
-        # TODO: limit to 100?  API seems to allow to page beyond skip=50 ...
-        # max_recs = min(total_recs, consts.MAX_PAGED_RECORDS)
+    @staticmethod
+    def _page_payload(params: Dict, page: int, page_sz: int) -> Dict:
+        """ returns the request payload for the given page number """
+        payload = params.copy()
+        payload["paging"] = {"top": page_sz, "skip": (page * page_sz)}
+        return payload
 
-        max_recs = total_recs
-        total_pages = math.ceil(max_recs / page_sz)
+    async def _probe_page_size(self, url, params: Dict, top: int, total: int) -> bool:
+        """
+        Returns True if the route accepts the page size, False if the request
+        is rejected.  Only the last record is requested so that the probe is
+        cheap whatever the page size.  Any other error, for example when
+        throttled, is raised so that no route limit is concluded.
+        """
+        payload = params.copy()
+        payload["paging"] = {"top": top, "skip": max(0, total - 1)}
+        res = await self.api.post(url, json=payload)
+        if res.status_code in PAGE_SIZE_REJECT_STATUSES:
+            return False
 
-        tasks = list()
-        # print(f"paging total records {max_recs} pages {total_pages} of size {page_sz}")
+        res.raise_for_status()
+        return True
 
-        @retry(
-            retry=retry_if_exception(httpx.ReadTimeout),
-            wait=wait_random_exponential(multiplier=1, max=10),
-        )
-        async def get_page(payload):
-            """ get a page and retry if exception """
-            return await self.api.post(url, json=payload)
+    async def _fetch_sized_page(
+        self, url, params: Dict, page: int, page_sz: int, total: int
+    ) -> List[Dict]:
+        """
+        Get the records of the page number.  When the page size was negotiated
+        and the route rejects, or truncates, the page, the route limit is
+        lowered and the rest of the page is requested using the page size
+        accepted by every route.
+        """
+        payload = self._page_payload(params, page, page_sz)
+        if page_sz <= consts.MAX_TOP_COUNT or not self.page_sizer:
+            return await self._fetch_page(url, payload)
+
+        try:
+            records = await self._fetch_page(url, payload)
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code not in PAGE_SIZE_REJECT_STATUSES:
+                raise
+            records = list()
+
+        skip = payload["paging"]["skip"]
+        expected = min(page_sz, total - skip)
+        if len(records) < expected:
+            self.page_sizer.reject(url, page_sz, returned=len(records))
+
+        while len(records) < expected:
+            payload = params.copy()
+            payload["paging"] = {
+                "top": consts.MAX_TOP_COUNT,
+                "skip": skip + len(records),
+            }
+            more = await self._fetch_page(url, payload)
+            if not more:
+                break
+            records.extend(more)
+
+        return records[:expected]
+
+    @retry(
+        retry=retry_if_exception_type(httpx.ReadTimeout),
+        wait=wait_random_exponential(multiplier=1, max=10),
+        before_sleep=lambda retry_state: profiling.count("retries"),
+    )
+    async def _fetch_page(self, url, payload: Dict) -> List[Dict]:
+        """
+        Get a page of records and retry if the read times out.  Only the
+        decoded records are returned so that the HTTP response is released
+        as soon as the page is decoded.  The page response time is observed
+        by the page sizer, if any.
+        """
+        start = time.monotonic()
+        records = (await self._fetch_page_data(url, payload))["records"]
+        if self.page_sizer:
+            self.page_sizer.observe(url, len(records), time.monotonic() - start)
+        return records
+
+    async def _fetch_page_data(self, url, payload: Dict) -> Dict:
+        """ get a page, returning the response data: records and metadata """
+        res = await self.api.post(url, json=payload)
+        res.raise_for_status()
+        with profiling.phase("decode"):
+            data = res.json()["data"]
 
-        for page in range(total_pages):
-            task_params = params.copy()
-            task_params["paging"] = {"top": page_sz, "skip": (page * page_sz)}
-            tasks.append(get_page(task_params))
+        self._project(url, data["records"])
+        return data
 
-        http_res_list = loop.run_until_complete(
-            asyncio.gather(*tasks, return_exceptions=True)
-        )
-        return list(
-            chain.from_iterable(
-                resp.json()["data"]["records"]
-                for resp in http_res_list
-                if resp.is_error is False
-            )
-        )
+    async def _fetch_records(self, url, **params) -> List[Dict]:
+        """ coroutine that implements `paginate_records` """
+
+        # the pages are consumed from the bounded pipeline as they arrive, so
+        # that at most `page_buffer` pages are held in addition to the records.
+        # A page that fails fails the request.
+
+        records = list()
+        async for page in self._aiter_pages(url, params):
+            records.extend(page)
+        return records
+
+
+# -----------------------------------------------------------------------------
+#
+#                               MODULE FUNCTIONS
+#
+# -----------------------------------------------------------------------------
+
+
+async def _anext(agen: AsyncIterator):
+    """ coroutine that returns the next item of the async iterator """
+    return await agen.__anext__()
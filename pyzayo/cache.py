@@ -0,0 +1,172 @@
+"""
+This module contains the TTLCache, an in-memory response cache whose entries
+expire after a time-to-live, used by the caching proxy service.
+
+The `get_or_fetch` coroutine coalesces requests: while the value of a key is
+being fetched, any other request for the same key awaits that one fetch rather
+than starting its own.  The cache is used from a single event loop.
+
+Examples
+--------
+    cache = TTLCache(ttl=300)
+
+    async def get_cases(payload):
+        key = ("maintenance-cases", json.dumps(payload, sort_keys=True))
+        return await cache.get_or_fetch(key, lambda: fetch_cases(payload))
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from collections import OrderedDict
+import asyncio
+import time
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["TTLCache"]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# sentinel designating a key not in the cache, since None is a valid value.
+_MISSING = object()
+
+
+class TTLCache(object):
+    """
+    In-memory cache of values that expire after a time-to-live.  When the
+    cache is full the least recently used entries are evicted.
+
+    Parameters
+    ----------
+    ttl: float
+        The default number of seconds an entry remains valid.
+
+    max_entries: int
+        The maximum number of entries.
+    """
+
+    def __init__(
+        self, ttl: Optional[float] = 300.0, max_entries: Optional[int] = 4096
+    ):
+        """ create the empty cache """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0}
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = dict()
+
+    def __len__(self) -> int:
+        """ the number of entries, including any expired but not yet evicted """
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """ True if the key has an unexpired entry """
+        return self.expires_in(key) is not None
+
+    def get(self, key: Hashable, default=None) -> Any:
+        """ returns the unexpired value of the key, or `default` """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """ store the value of the key for `ttl` seconds, the default TTL if None """
+        ttl = self.ttl if ttl is None else ttl
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def expires_in(self, key: Hashable) -> Optional[float]:
+        """ returns the seconds until the key entry expires, None if not cached """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        remaining = entry[0] - time.monotonic()
+        return remaining if remaining > 0 else None
+
+    def pop(self, key: Hashable, default=None) -> Any:
+        """ remove the key entry, returning its value or `default` """
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        """ remove all entries """
+        self._entries.clear()
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable],
+        ttl: Optional[float] = None,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Returns the cached value of the key; or awaits `fetch()` to obtain the
+        value, caches it, and returns it.  Concurrent calls for the same key
+        share the one fetch.
+
+        Parameters
+        ----------
+        key: Hashable
+            The cache key
+
+        fetch: Callable
+            Returns the awaitable that obtains the value.
+
+        ttl: float, optional
+            The entry time-to-live, the cache default if not provided.
+
+        cacheable: Callable, optional
+            When provided, a value is cached only if `cacheable(value)` is
+            True; for example to not cache error responses.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            self.stats["hits"] += 1
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(inflight)
+
+        self.stats["misses"] += 1
+        future = self._inflight[key] = asyncio.get_running_loop().create_future()
+
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # the exception is re-raised here, the waiters retrieve it as well.
+            future.exception()
+            raise
+        else:
+            if cacheable is None or cacheable(value):
+                self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
@@ -0,0 +1,202 @@
+"""
+This module contains the record and replay transports used to reproduce a
+client session deterministically, for example to measure the performance of
+pagination, retries, and CLI rendering without access to the Zayo API.
+
+The `RecordingTransport` captures each request and response pair, together
+with its timing, into a cassette file.  The `ReplayTransport` serves the
+responses from the cassette file with the original latencies, or with the
+latencies scaled or zeroed.
+
+The cassette file is JSONL, one request/response entry per line.
+
+Examples
+--------
+    from pyzayo import ZayoClient
+    from pyzayo.cassette import RecordingTransport, ReplayTransport
+
+    zapi = ZayoClient(transport=RecordingTransport("session.jsonl"))
+    zapi.get_cases()
+    zapi.close()
+
+    zapi = ZayoClient(transport=ReplayTransport("session.jsonl", latency_scale=0))
+    zapi.get_cases()
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, Dict, Tuple
+from collections import defaultdict, deque
+import asyncio
+import json
+import time
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import httpx
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["RecordingTransport", "ReplayTransport", "CassetteMissError"]
+
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# response headers that no longer apply once the recorded content is decoded.
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class CassetteMissError(LookupError):
+    """ The replayed request is not in the cassette """
+
+    pass
+
+
+def _request_key(request: httpx.Request) -> Tuple[str, str, str]:
+    """ returns the key used to match a replayed request to a recorded entry """
+    return request.method, request.url.raw_path.decode(), _canonical_body(request)
+
+
+def _canonical_body(request: httpx.Request) -> str:
+    """ the request body with JSON content in canonical form """
+    content = request.content
+    if not content:
+        return ""
+
+    try:
+        return json.dumps(json.loads(content), sort_keys=True)
+    except ValueError:
+        return content.decode(errors="replace")
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """
+    HTTPx transport that records each request and response, with timing, into
+    a cassette file.  The requests are sent via the wrapped transport.  The
+    page sizes are not negotiated, as when replayed, so that the recorded
+    paging requests are those repeated by the replay.
+
+    Parameters
+    ----------
+    filepath: str
+        The cassette file path; the file is created or truncated.
+
+    transport: httpx.AsyncBaseTransport, optional
+        The transport used to send the requests, the default network
+        transport when not provided.
+    """
+
+    adaptive_paging = False
+
+    def __init__(
+        self, filepath: str, transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """ create the cassette file """
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._ofile = open(filepath, "w")
+        self._t0 = time.monotonic()
+
+    @property
+    def requires_auth(self) -> bool:
+        """ authentication is required by the wrapped transport """
+        return getattr(self._transport, "requires_auth", True)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """ send the request, record the response and its timing """
+        started = time.monotonic()
+        response = await self._transport.handle_async_request(request)
+        content = await response.aread()
+        elapsed = time.monotonic() - started
+
+        method, path, body = _request_key(request)
+        entry = {
+            "method": method,
+            "path": path,
+            "body": body,
+            "started": round(started - self._t0, 6),
+            "elapsed": round(elapsed, 6),
+            "status": response.status_code,
+            "headers": {
+                key: value
+                for key, value in response.headers.items()
+                if key.lower() not in _DROP_HEADERS
+            },
+            "content": content.decode("utf-8", errors="replace"),
+        }
+        self._ofile.write(json.dumps(entry) + "\n")
+        self._ofile.flush()
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=entry["headers"],
+            content=content,
+            request=request,
+        )
+
+    async def aclose(self):
+        """ close the wrapped transport and the cassette file """
+        await self._transport.aclose()
+        self._ofile.close()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    HTTPx transport that serves the responses recorded in a cassette file.
+    Requests are matched by method, path, and body.  When the same request
+    was recorded more than once, the responses are served in the recorded
+    order, the last one being repeated thereafter.  Since no network is
+    used, the transport does not require authentication, and the page sizes
+    are not negotiated so that the recorded paging requests are repeated.
+
+    Parameters
+    ----------
+    filepath: str
+        The cassette file path
+
+    latency_scale: float
+        Each response is delayed by its recorded latency multiplied by this
+        value; 1.0 replays the original latencies, 0 disables the delays.
+    """
+
+    requires_auth = False
+    adaptive_paging = False
+
+    def __init__(self, filepath: str, latency_scale: Optional[float] = 1.0):
+        """ load the cassette entries """
+        self.latency_scale = latency_scale
+        self._entries: Dict[Tuple[str, str, str], deque] = defaultdict(deque)
+
+        with open(filepath) as ifile:
+            for line in ifile:
+                entry = json.loads(line)
+                key = entry["method"], entry["path"], entry["body"]
+                self._entries[key].append(entry)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """ serve the recorded response after the (scaled) recorded latency """
+        key = _request_key(request)
+        entries = self._entries.get(key)
+        if not entries:
+            raise CassetteMissError(f"Request not in cassette: {key[0]} {key[1]}")
+
+        entry = entries.popleft() if len(entries) > 1 else entries[0]
+
+        if self.latency_scale:
+            await asyncio.sleep(entry["elapsed"] * self.latency_scale)
+
+        return httpx.Response(
+            status_code=entry["status"],
+            headers=entry["headers"],
+            content=entry["content"].encode(),
+            request=request,
+        )
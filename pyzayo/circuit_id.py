@@ -0,0 +1,267 @@
+"""
+This module contains the circuit ID normalization and resolution functions,
+used to convert the circuit IDs found in tickets, CMDB exports, and emails into
+the /4/6/3/4/ form expected by the Zayo API.
+
+The parsing tolerates the common variants: surrounding spaces, lowercase, and
+missing leading or trailing delimiters.  When the value contains "/" delimiters
+the fields are taken by position, so that an empty or space padded field keeps
+its place and a suffix may contain dashes.  Otherwise spaces or dashes are
+taken in place of the "/" delimiters.  The patterns are compiled once and the
+results are memoized, since the same circuit IDs recur throughout the input
+data.
+
+A CircuitIdResolver resolves circuit IDs against a set of known circuit IDs,
+for example the service inventory, with optional fuzzy matching of the IDs
+that are not found, such as those with a mistyped character.
+
+Examples
+--------
+    from pyzayo.circuit_id import format_circuit_id, CircuitIdResolver
+
+    format_circuit_id("ogyx 123456 zyo")
+    # '/OGYX/123456/ZYO/    /'
+
+    format_circuit_id("/OGYX/123456//ZYO/")
+    # '/OGYX/123456/   /ZYO /'
+
+    resolver = CircuitIdResolver.from_inventory(zapi.get_service_inventory())
+    resolver.resolve("OGYX/123465/ZYO", fuzzy=True)
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, List, Iterable, Optional
+from collections import defaultdict
+from functools import lru_cache
+import difflib
+import re
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "CircuitIdError",
+    "CircuitIdResolver",
+    "format_circuit_id",
+    "normalize_circuit_id",
+    "normalize_circuit_ids",
+]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# The circuit ID fields are: a 4 character prefix, a 6 digit number, a suffix
+# of up to 3 characters, and a suffix of up to 4 characters.  The input is
+# upper-cased before it is matched.
+
+# the pattern of each field of the "/" delimited form, by position.
+_CIRCUIT_ID_FIELDS_RE = (
+    re.compile(r"\w{4}"),
+    re.compile(r"\d{6}"),
+    re.compile(r"[\w-]{0,3}"),
+    re.compile(r"[\w-]{0,4}"),
+)
+
+# the pattern of the form without "/" delimiters.
+_CIRCUIT_ID_RE = re.compile(
+    r"\s*(\w{4})[\s-]*(\d{6})(?:[\s-]*(\w{0,3}))(?:[\s-]*(\w{0,4}))\s*"
+)
+
+# The number of distinct circuit IDs for which the results are memoized.
+CIRCUIT_ID_CACHE_SIZE = 1 << 16
+
+
+class CircuitIdError(ValueError):
+    """
+    The circuit ID is not in a recognized form.
+
+    Attributes
+    ----------
+    circuit_id: str
+        The circuit ID value as given
+
+    reason: str
+        The reason the value was not recognized.
+    """
+
+    def __init__(self, circuit_id, reason: str):
+        self.circuit_id = circuit_id
+        self.reason = reason
+        super().__init__(f"{reason}: {circuit_id!r}")
+
+
+@lru_cache(maxsize=CIRCUIT_ID_CACHE_SIZE)
+def format_circuit_id(circuit_id: str) -> str:
+    """
+    Returns the circuit ID in the Zayo API /4/6/3/4/ form; each field padded
+    to its width.
+
+    Parameters
+    ----------
+    circuit_id: str
+        The circuit ID in any of the tolerated forms.
+
+    Raises
+    ------
+    CircuitIdError
+        When the value is not a recognized circuit ID.
+    """
+    if not isinstance(circuit_id, str):
+        raise CircuitIdError(circuit_id, "circuit ID is not a string")
+
+    if not circuit_id.strip():
+        raise CircuitIdError(circuit_id, "circuit ID is empty")
+
+    value = circuit_id.strip().upper()
+
+    if "/" in value:
+        fields = [field.strip() for field in value.strip("/").split("/")]
+        fields += [""] * (len(_CIRCUIT_ID_FIELDS_RE) - len(fields))
+        if len(fields) != len(_CIRCUIT_ID_FIELDS_RE) or not all(
+            field_re.fullmatch(field)
+            for field_re, field in zip(_CIRCUIT_ID_FIELDS_RE, fields)
+        ):
+            raise CircuitIdError(circuit_id, "circuit ID is not in the /4/6/3/4/ form")
+
+    else:
+        mo = _CIRCUIT_ID_RE.fullmatch(value)
+        if not mo:
+            raise CircuitIdError(circuit_id, "circuit ID is not in the /4/6/3/4/ form")
+        fields = mo.groups()
+
+    prefix, number, suffix_3, suffix_4 = fields
+    return f"/{prefix:4}/{number:6}/{suffix_3:3}/{suffix_4:4}/"
+
+
+def normalize_circuit_id(circuit_id: str) -> str:
+    """
+    Returns the circuit ID in the API form per `format_circuit_id`; or, when
+    the value is not a recognized circuit ID, the value stripped as-is.
+    """
+    try:
+        return format_circuit_id(circuit_id)
+    except CircuitIdError:
+        return circuit_id.strip()
+
+
+def normalize_circuit_ids(
+    circuit_ids: Iterable[str], errors: Optional[str] = "raise"
+) -> List[Optional[str]]:
+    """
+    Returns the circuit IDs in the API form, in the given order.
+
+    Parameters
+    ----------
+    circuit_ids: Iterable[str]
+        The circuit IDs in any of the tolerated forms.
+
+    errors: str
+        How unrecognized values are handled: "raise" raises CircuitIdError;
+        "keep" keeps the value stripped as-is; "none" returns None in its
+        place.
+    """
+    if errors == "raise":
+        return list(map(format_circuit_id, circuit_ids))
+
+    if errors == "keep":
+        return list(map(normalize_circuit_id, circuit_ids))
+
+    if errors != "none":
+        raise ValueError(f"Invalid errors option: {errors!r}")
+
+    normalized = list()
+    for circuit_id in circuit_ids:
+        try:
+            normalized.append(format_circuit_id(circuit_id))
+        except CircuitIdError:
+            normalized.append(None)
+    return normalized
+
+
+class CircuitIdResolver(object):
+    """
+    Resolves circuit IDs to the known circuit IDs, for example those of the
+    service inventory.
+
+    Parameters
+    ----------
+    known_ids: Iterable[str]
+        The known circuit IDs, in any of the tolerated forms.
+
+    cutoff: float
+        The minimum similarity ratio, between 0 and 1, of a fuzzy match.
+    """
+
+    def __init__(self, known_ids: Iterable[str], cutoff: Optional[float] = 0.8):
+        """ index the known circuit IDs by normalized ID and by number """
+        self.cutoff = cutoff
+        self._known: Dict[str, str] = dict()
+        self._by_number: Dict[str, List[str]] = defaultdict(list)
+
+        for circuit_id in known_ids:
+            if not circuit_id:
+                continue
+            norm_id = normalize_circuit_id(circuit_id)
+            if norm_id not in self._known:
+                self._known[norm_id] = circuit_id
+                self._by_number[norm_id[6:12]].append(norm_id)
+
+    @classmethod
+    def from_inventory(cls, inventory, **kwargs) -> "CircuitIdResolver":
+        """ returns the resolver of the ServiceInventory circuit IDs """
+        return cls(inventory.distinct("circuit_id"), **kwargs)
+
+    def __len__(self) -> int:
+        """ the number of known circuit IDs """
+        return len(self._known)
+
+    def __contains__(self, circuit_id: str) -> bool:
+        """ True when the circuit ID is known """
+        return normalize_circuit_id(circuit_id) in self._known
+
+    def resolve(self, circuit_id: str, fuzzy: Optional[bool] = False) -> Optional[str]:
+        """
+        Returns the known circuit ID, in its original form, matching the given
+        circuit ID; or None if not found.
+
+        When `fuzzy` is True and there is no exact match, the most similar
+        known circuit ID is returned, provided its similarity is at least the
+        `cutoff`.  The known IDs with the same 6 digit number are compared
+        first, and only if none are similar enough are all known IDs compared.
+        """
+        norm_id = normalize_circuit_id(circuit_id)
+        found = self._known.get(norm_id)
+        if found is not None or not fuzzy:
+            return found
+
+        match = self._closest(norm_id, self._by_number.get(norm_id[6:12], ()))
+        if match is None:
+            match = self._closest(norm_id, self._known)
+
+        return None if match is None else self._known[match]
+
+    def resolve_many(
+        self, circuit_ids: Iterable[str], fuzzy: Optional[bool] = False
+    ) -> Dict[str, Optional[str]]:
+        """
+        Returns the dictionary of each given circuit ID to its resolved known
+        circuit ID, or None; see `resolve`.
+        """
+        return {
+            circuit_id: self.resolve(circuit_id, fuzzy=fuzzy)
+            for circuit_id in circuit_ids
+        }
+
+    def _closest(self, norm_id: str, candidates: Iterable[str]) -> Optional[str]:
+        """ returns the most similar candidate above the cutoff, if any """
+        matches = difflib.get_close_matches(
+            norm_id, candidates, n=1, cutoff=self.cutoff
+        )
+        return matches[0] if matches else None
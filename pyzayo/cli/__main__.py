@@ -9,6 +9,10 @@ from .cli_root import cli
 
 from . import cli_cases  # noqa
 from . import cli_services  # noqa
+from . import cli_mirror  # noqa
+from . import cli_snapshot  # noqa
+from . import cli_serve  # noqa
+from . import cli_completion  # noqa
 
 
 def main():
@@ -11,8 +11,11 @@ References
 # System Imports
 # -----------------------------------------------------------------------------
 
-from typing import List, Dict
+from typing import List, Dict, Tuple, Optional, Iterable
+from datetime import datetime, timedelta
+from functools import partial
 from operator import attrgetter
+from itertools import chain
 
 # -----------------------------------------------------------------------------
 # Public Imports
@@ -23,17 +26,32 @@ from rich.console import Console
 from rich.table import Table, Text
 
 # from rich.console import TerminalTheme
-import maya
 
 # -----------------------------------------------------------------------------
 # Private Imports
 # -----------------------------------------------------------------------------
 
-from pyzayo import ZayoClient
-from .cli_root import cli
+from .cli_root import cli, make_client
+from .cli_completion import (
+    complete_case_num,
+    complete_notification,
+    complete_circuit_id,
+)
+from .cli_render import TableColumns, make_table, limit_records, print_rows, opt_output
+from .cli_timefmt import TimeFormatter
 from pyzayo import consts
 from pyzayo.mtc_models import CaseRecord, ImpactRecord, NotificationDetailRecord
 from pyzayo.consts import CaseStatusOptions
+from pyzayo import export
+from pyzayo import mtc_analysis
+from pyzayo.mtc_index import MaintenanceIndex
+from pyzayo.circuit_id import normalize_circuit_id
+from pyzayo.svcinv_join import ServiceJoin
+from pyzayo import mtc_watch
+from pyzayo import profiling
+from pyzayo.mtc_archive import EmailArchive
+from pyzayo.parsing import parse_pages
+from pyzayo.svcinv_store import ServiceRow
 
 # -----------------------------------------------------------------------------
 #
@@ -77,6 +95,99 @@ def colorize_impact(impact):
     return Text("\n".join(impact.split()), style=style)
 
 
+CASES_TABLE_COLUMNS: TableColumns = (
+    ("Case #", {}),
+    ("Urgency", {}),
+    ("Status", {}),
+    ("Impact", {}),
+    ("Date(s)", {}),
+    ("Location", dict(width=12, overflow="fold")),
+    ("Start Time", {}),
+    ("End Time", {}),
+    ("Reason", {}),
+)
+
+IMPACTS_TABLE_COLUMNS: TableColumns = (
+    ("Case #", {}),
+    ("Circuit Id", {}),
+    ("Expected Impact", {}),
+    ("CLLI A", {}),
+    ("CLLI Z", {}),
+)
+
+# the columns added by the --with-services option
+IMPACT_SERVICES_TABLE_COLUMNS: TableColumns = (
+    ("Service", {}),
+    ("Product", {}),
+    ("Bandwidth", {}),
+    ("A Location", {}),
+    ("Z Location", {}),
+)
+
+CASE_SERVICES_TABLE_COLUMNS: TableColumns = (("Services", {}),)
+
+NOTIFS_TABLE_COLUMNS: TableColumns = (
+    ("#", {}),
+    ("Type", {}),
+    ("Email Sent", {}),
+    ("Email Subject", {}),
+    ("Email To", {}),
+)
+
+CONFLICTS_TABLE_COLUMNS: TableColumns = (
+    ("Group", {}),
+    ("Case # A", {}),
+    ("Circuit Id A", {}),
+    ("Case # B", {}),
+    ("Circuit Id B", {}),
+    ("Overlap Start", {}),
+    ("Overlap End", {}),
+)
+
+BY_CIRCUITS_TABLE_COLUMNS: TableColumns = (
+    ("Circuit Id", {}),
+    ("Case #", {}),
+    ("Urgency", {}),
+    ("Status", {}),
+    ("Window Start", {}),
+    ("Window End", {}),
+    ("Reason", {}),
+)
+
+_case_pdates = attrgetter("primary_date", "primary_date_2", "primary_date_3")
+
+
+@profiling.timed("rows.case")
+def make_case_row(
+    row_obj: CaseRecord, timefmt: Optional[TimeFormatter] = None
+) -> Tuple:
+    """
+    Returns the cases table row for the case record.  The `timefmt` should be
+    shared by all rows of a table, so that "now" is computed once per render.
+    """
+    timefmt = timefmt or TimeFormatter()
+
+    if row_obj.status != consts.CaseStatusOptions.closed:
+        row_obj.urgency = colorize_urgency(row_obj.urgency)  # noqa
+        row_obj.impact = colorize_impact(row_obj.impact)
+        row_obj.status = colorize_status(row_obj.status)
+
+    dstr = timefmt.dates_cell(pd for pd in _case_pdates(row_obj) if pd)
+
+    return (
+        row_obj.case_num,
+        row_obj.urgency,
+        row_obj.status,
+        row_obj.impact,
+        dstr,
+        row_obj.location,
+        str(row_obj.from_time),
+        str(row_obj.to_time),
+        row_obj.reason,
+    )
+
+
+@profiling.timed("table.cases")
 def make_cases_table(recs: List[CaseRecord]) -> Table:
     """
     This function creates the Rich.Table that contains the cases information.
@@ -91,56 +202,58 @@ def make_cases_table(recs: List[CaseRecord]) -> Table:
     The rendered Table of case information.
     """
     n_cases = len(recs)
-    table = Table(
-        title=Text(
-            f"Cases ({n_cases})" if n_cases > 1 else "Case",
-            style="bright_white",
-            justify="left",
-        ),
-        show_header=True,
-        header_style="bold magenta",
-        show_lines=True,
+    table = make_table(
+        f"Cases ({n_cases})" if n_cases > 1 else "Case", CASES_TABLE_COLUMNS
     )
 
-    table.add_column("Case #")
-    table.add_column("Urgency")
-    table.add_column("Status")
-    table.add_column("Impact")
-    table.add_column("Date(s)")
-    table.add_column("Location", width=12, overflow="fold")
-    table.add_column("Start Time")
-    table.add_column("End Time")
-    table.add_column("Reason")
+    timefmt = TimeFormatter()
+    for row_obj in recs:
+        table.add_row(*make_case_row(row_obj, timefmt))
+
+    return table
 
-    pdates = attrgetter("primary_date", "primary_date_2", "primary_date_3")
 
-    for row_obj in recs:
+@profiling.timed("rows.impact")
+def make_impact_row(rec: Dict) -> Tuple:
+    """ returns the impacts table row for the impact record in API dict form """
+    row_obj = ImpactRecord.parse_obj(rec)
 
-        if row_obj.status != consts.CaseStatusOptions.closed:
-            row_obj.urgency = colorize_urgency(row_obj.urgency)  # noqa
-            row_obj.impact = colorize_impact(row_obj.impact)
-            row_obj.status = colorize_status(row_obj.status)
-
-        rec_pdates = sorted(pd for pd in pdates(row_obj) if pd)
-        md = maya.parse(rec_pdates[0])
-        dstr = "\n".join(map(str, rec_pdates)) + f"\n({md.slang_time()})"
-
-        table.add_row(
-            row_obj.case_num,
-            row_obj.urgency,
-            row_obj.status,
-            row_obj.impact,
-            dstr,
-            row_obj.location,
-            str(row_obj.from_time),
-            str(row_obj.to_time),
-            row_obj.reason,
-        )
+    return (
+        row_obj.case_num,
+        row_obj.circuit_id,
+        row_obj.impact,
+        row_obj.clli_a,
+        row_obj.clli_z,
+    )
+
+
+def make_service_location(service: ServiceRow, end: str) -> str:
+    """ returns the address of the service A or Z `end` location """
+    return (
+        f"{service[end + '_name']}\n"
+        f"{service[end + '_city']}, {service[end + '_state']} "
+        f"{service[end + '_postal_code']}"
+    )
 
-    return table
 
+def make_impact_service_cells(service: Optional[ServiceRow]) -> Tuple:
+    """ returns the --with-services cells of the impacted circuit service """
+    if service is None:
+        return (Text("not in inventory", style="dim"), "", "", "", "")
 
-def make_impacts_table(impacts: List[dict]) -> Table:
+    return (
+        service["service_name"],
+        f"{service['product_group']}\n{service['product']}",
+        service["bandwidth"],
+        make_service_location(service, "a"),
+        make_service_location(service, "z"),
+    )
+
+
+@profiling.timed("table.impacts")
+def make_impacts_table(
+    impacts: List[dict], join: Optional[ServiceJoin] = None
+) -> Table:
     """
     This function creates the Rich.Table that contains the case impact information.
 
@@ -149,43 +262,47 @@ def make_impacts_table(impacts: List[dict]) -> Table:
     impacts: List[dict]
         The list of case impact records in API dict form.
 
+    join: ServiceJoin, optional
+        When provided the service inventory details of each impacted circuit
+        are included.
+
     Returns
     -------
     The rendered Table of case impact information.
     """
     count = len(impacts)
+    columns = IMPACTS_TABLE_COLUMNS
+    if join:
+        columns += IMPACT_SERVICES_TABLE_COLUMNS
 
-    table = Table(
-        title=Text(
-            f"Impacts ({count})" if count > 1 else "Impact",
-            style="bright_white",
-            justify="left",
-        ),
-        show_header=True,
-        header_style="bold magenta",
-        show_lines=True,
-    )
+    table = make_table(f"Impacts ({count})" if count > 1 else "Impact", columns)
 
-    table.add_column("Case #")
-    table.add_column("Circuit Id")
-    table.add_column("Expected Impact")
-    table.add_column("CLLI A")
-    table.add_column("CLLI Z")
-
-    for rec in impacts:
-        row_obj = ImpactRecord.parse_obj(rec)
-
-        table.add_row(
-            row_obj.case_num,
-            row_obj.circuit_id,
-            row_obj.impact,
-            row_obj.clli_a,
-            row_obj.clli_z,
-        )
+    if not join:
+        for rec in impacts:
+            table.add_row(*make_impact_row(rec))
+        return table
+
+    for rec, service in join.join_impacts(impacts):
+        table.add_row(*make_impact_row(rec), *make_impact_service_cells(service))
 
     return table
 
 
+@profiling.timed("rows.notif")
+def make_notif_row(rec: Dict, timefmt: Optional[TimeFormatter] = None) -> Tuple:
+    """
+    Returns the notifications table row for the record in API dict form.  The
+    `timefmt` should be shared by all rows of a table.
+    """
+    timefmt = timefmt or TimeFormatter()
+    row_obj = NotificationDetailRecord.parse_obj(rec)
+    email_list = sorted(map(str.strip, row_obj.email_list.split(";")))
+    dstring = timefmt.datetime_cell(row_obj.date)
+
+    return row_obj.name, row_obj.type, dstring, row_obj.subject, "\n".join(email_list)
+
+
+@profiling.timed("table.notifs")
 def make_notifs_table(notifs):
     """
     This function creates the Rich.Table that contains the case notification information.
@@ -200,37 +317,77 @@ def make_notifs_table(notifs):
     The rendered Table of case notifications information.
     """
     count = len(notifs)
-    table = Table(
-        title=Text(
-            f"Notifications ({count})" if count > 1 else "Notification",
-            style="bright_white",
-            justify="left",
-        ),
-        show_header=True,
-        header_style="bold magenta",
-        show_lines=True,
+    table = make_table(
+        f"Notifications ({count})" if count > 1 else "Notification",
+        NOTIFS_TABLE_COLUMNS,
     )
 
-    table.add_column("#")
-    table.add_column("Type")
-    table.add_column("Email Sent")
-    table.add_column("Email Subject")
-    table.add_column("Email To")
-
+    timefmt = TimeFormatter()
     for rec in notifs:
-        row_obj = NotificationDetailRecord.parse_obj(rec)
-        email_list = sorted(map(str.strip, row_obj.email_list.split(";")))
-        mt = maya.parse(row_obj.date)
-        dstring = (
-            mt.local_datetime().strftime("%Y-%m-%d\n%H:%M:%S")
-            + f"\n({mt.slang_time()})"
-        )
+        table.add_row(*make_notif_row(rec, timefmt))
 
-        table.add_row(
-            row_obj.name, row_obj.type, dstring, row_obj.subject, "\n".join(email_list)
+    return table
+
+
+@profiling.timed("rows.conflict")
+def make_conflict_row(conflict: mtc_analysis.Conflict) -> Tuple:
+    """ returns the conflicts table row for the maintenance conflict """
+    return (
+        conflict.group,
+        conflict.case_a,
+        conflict.circuit_a,
+        conflict.case_b,
+        conflict.circuit_b,
+        Text(conflict.start.strftime("%Y-%m-%d %H:%M"), style="bold red"),
+        Text(conflict.end.strftime("%Y-%m-%d %H:%M"), style="bold red"),
+    )
+
+
+@profiling.timed("rows.circuit_window")
+def make_circuit_window_row(
+    circuit_id: str, window: mtc_analysis.MaintenanceWindow, case: CaseRecord
+) -> Tuple:
+    """ returns the by-circuits table row for the circuit maintenance window """
+    return (
+        circuit_id,
+        case.case_num,
+        colorize_urgency(case.urgency),
+        colorize_status(case.status),
+        window.start.strftime("%Y-%m-%d %H:%M"),
+        window.end.strftime("%Y-%m-%d %H:%M"),
+        case.reason,
+    )
+
+
+_EVENT_STYLES = {
+    mtc_watch.CaseEventKinds.new: "bold green",
+    mtc_watch.CaseEventKinds.status: "bright_yellow",
+    mtc_watch.CaseEventKinds.rescheduled: "bright_blue",
+    mtc_watch.CaseEventKinds.closed: "dim",
+    mtc_watch.CaseEventKinds.removed: "dim red",
+}
+
+
+def make_event_text(event: mtc_watch.CaseEvent) -> Text:
+    """ returns the terminal line describing the case change event """
+    text = Text(f"{event.detected.astimezone():%Y-%m-%d %H:%M:%S} ")
+    text.append(f"{event.kind.upper():12}", style=_EVENT_STYLES[event.kind])
+    text.append(f"{event.case_num}  ")
+
+    if event.kind == mtc_watch.CaseEventKinds.removed:
+        text.append(f"(was {event.old.status})")
+
+    elif event.kind == mtc_watch.CaseEventKinds.rescheduled:
+        text.append(
+            " ".join(str(val) for val in event.new.schedule if val)
+            + f"  (was {' '.join(str(val) for val in event.old.schedule if val)})"
         )
+    elif event.old:
+        text.append(f"{event.new.status}  (was {event.old.status})")
+    else:
+        text.append(f"{event.new.status}  {event.record.get('primaryDate')}")
 
-    return table
+    return text
 
 
 # HTML_SAVE_THEME = TerminalTheme(
@@ -269,53 +426,94 @@ def mtc():
     pass
 
 
+def opt_with_services(func):
+    """ decorator that adds the --with-services option to a command """
+    return click.option(
+        "--with-services",
+        is_flag=True,
+        help="include the service inventory details of the impacted circuits",
+    )(func)
+
+
 @mtc.command(name="list")
-@click.option("--circuit-id", help="filter case by circuit ID")
-def mtc_cases(circuit_id):
+@click.option(
+    "--circuit-id",
+    shell_complete=complete_circuit_id,
+    help="filter case by circuit ID",
+)
+@opt_with_services
+@opt_output
+def mtc_cases(circuit_id, with_services, fmt, limit, page, pager):
     """
     Show listing of maintenance caess.
     """
-    zapi = ZayoClient()
+    zapi = make_client(multi_account=True)
 
-    recs = [
+    # if circuit_id was provided by the User then we need to filter the case
+    # list by only those records that have an associated impact record with the
+    # same circuit_id value.
+
+    impacted_case_nums = None
+    if circuit_id:
+        impacted_case_nums = {
+            i_rec["caseNumber"] for i_rec in zapi.get_impacts(by_circuit_id=circuit_id)
+        }
+
+    # the rows are rendered as the pages of case records arrive.
+
+    recs = (
         rec
         for rec in map(
-            CaseRecord.parse_obj,
-            zapi.get_cases(orderBy=[consts.OrderBy.date_sooner.value]),
+            profiling.timed("parse")(CaseRecord.parse_obj),
+            chain.from_iterable(
+                zapi.iter_case_pages(orderBy=[consts.OrderBy.date_sooner.value])
+            ),
         )
         if rec.status != CaseStatusOptions.closed
-    ]
+        and (impacted_case_nums is None or rec.case_num in impacted_case_nums)
+    )
 
-    # if circuit_id was provided by the User then we need to filter the case
-    # list by only those records that have an associated impact record with the
-    # same circuit_id value.
+    rows = map(
+        partial(make_case_row, timefmt=TimeFormatter()),
+        limit_records(recs, limit, page),
+    )
+    columns = CASES_TABLE_COLUMNS
 
-    if circuit_id:
-        circuit_id = zapi.format_circuit_id(circuit_id)
-        impacted_case_nums = [
-            i_rec["caseNumber"]
-            for rec in recs
-            for i_rec in zapi.get_impacts(by_case_num=rec.case_num)
-            if i_rec["circuitId"] == circuit_id
-        ]
-        recs = [rec for rec in recs if rec.case_num in impacted_case_nums]
-
-    console = Console(record=True)
-    console.print(make_cases_table(recs))
+    # the inventory and the impacts are each loaded once, in bulk, and joined
+    # before the case rows are rendered.
+
+    if with_services:
+        join = ServiceJoin(zapi.get_service_inventory())
+        case_services = join.case_services(
+            chain.from_iterable(zapi.iter_impact_pages())
+        )
+        columns += CASE_SERVICES_TABLE_COLUMNS
+        rows = (
+            (*row, _service_names(case_services.get(row[0], ()))) for row in rows
+        )
+
+    print_rows("Cases", columns, rows, fmt=fmt, pager=pager)
     # console.save_html('cases.html', theme=HTML_SAVE_THEME)
 
 
 @mtc.command(name="show-details")
-@click.argument("case_number")
+@click.argument("case_number", shell_complete=complete_case_num)
 @click.option("--save-emails", "-E", is_flag=True, help="Save notification emails")
-def mtc_case_details(case_number, save_emails):
+@opt_with_services
+def mtc_case_details(case_number, save_emails, with_services):
     """
     Show specific case details.
     """
 
     # find the case by number
 
-    zapi = ZayoClient()
+    zapi = make_client()
+
+    # the email content is only retained when the emails are saved.
+
+    if not save_emails:
+        zapi.set_projection(consts.ZAYO_SM_ROUTE_MTC_NOTIFS_BY_NAME, ["emailBody"])
+
     case, impacts, notifs = zapi.get_case_details(by_case_num=case_number)
 
     console = Console()
@@ -326,13 +524,302 @@ def mtc_case_details(case_number, save_emails):
 
     console.print(f"\nCase [bold white]{case_number}[/bold white]: [bold green]Found")
     console.print("\n", make_cases_table([CaseRecord.parse_obj(case)]), "\n")
-    console.print(make_impacts_table(impacts), "\n")
+    join = ServiceJoin(zapi.get_service_inventory()) if with_services else None
+    console.print(make_impacts_table(impacts, join), "\n")
     console.print(make_notifs_table(notifs), "\n")
 
     if save_emails:
         _save_notif_emails(notifs)
 
 
+@mtc.command(name="notification")
+@click.argument("name", shell_complete=complete_notification)
+@click.option("--save-email", "-E", is_flag=True, help="Save notification email")
+def mtc_notification(name, save_email):
+    """
+    Show specific notification.
+    """
+    zapi = make_client()
+
+    if not save_email:
+        zapi.set_projection(consts.ZAYO_SM_ROUTE_MTC_NOTIFS_BY_NAME, ["emailBody"])
+
+    notif = zapi.get_notification_details(by_name=name)
+    Console().print("\n", make_notifs_table([notif]), "\n")
+
+    if save_email:
+        _save_notif_emails([notif])
+
+
+@mtc.command(name="export")
+@click.option(
+    "--records",
+    type=click.Choice(["cases", "impacts"]),
+    default="cases",
+    show_default=True,
+    help="which maintenance records to export",
+)
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(export.EXPORT_FORMATS),
+    default="csv",
+    show_default=True,
+    help="output file format",
+)
+@click.option("--output", "-o", default="-", help="output file, stdout by default")
+def mtc_export(records, fmt, output):
+    """
+    Export maintenance cases or impacts to a flat file.
+    """
+    zapi = make_client(multi_account=True)
+
+    if records == "cases":
+        pages = zapi.iter_case_pages(orderBy=[consts.OrderBy.date_sooner.value])
+        flatten, fields = export.flatten_case, export.CASE_FIELDS
+    else:
+        pages = zapi.iter_impact_pages()
+        flatten, fields = export.flatten_impact, export.IMPACT_FIELDS
+
+    from pyzayo.pool import ZayoClientPool, ACCOUNT_KEY
+
+    if isinstance(zapi, ZayoClientPool):
+        flatten, fields = export.flatten_tagged(flatten, fields, ACCOUNT_KEY)
+
+    count = export.export_pages(pages, flatten, fields, fmt, output)
+    click.echo(f"Maintenance {records} exported: {count}", err=True)
+
+
+@mtc.command(name="conflicts")
+@click.option(
+    "--groups",
+    "groups_file",
+    type=click.File(),
+    help="circuit groups file, one group per line: [name:] circuit-id ...",
+)
+@click.option(
+    "--by-clli", is_flag=True, help="group the impacted circuits by CLLI code"
+)
+@opt_output
+def mtc_conflicts(groups_file, by_clli, fmt, limit, page, pager):
+    """
+    Show overlapping maintenance windows within circuit groups.
+
+    Reports the scheduled maintenance cases whose windows overlap while
+    impacting different circuits of the same group; for example both legs of
+    a diverse path (--groups), or circuits at the same CLLI (--by-clli).
+    """
+    if bool(groups_file) == by_clli:
+        raise click.UsageError("Provide exactly one of --groups or --by-clli")
+
+    if groups_file:
+        group_by = mtc_analysis.group_by_circuits(
+            _load_circuit_groups(groups_file), normalize=normalize_circuit_id
+        )
+    else:
+        group_by = mtc_analysis.group_by_clli
+
+    zapi = make_client(multi_account=True)
+
+    # the records are parsed as the pages arrive; see pyzayo.parsing
+
+    cases = [
+        rec
+        for rec in chain.from_iterable(
+            parse_pages(CaseRecord, zapi.iter_case_pages())
+        )
+        if rec.status not in mtc_analysis.INACTIVE_CASE_STATUSES
+    ]
+    case_nums = {rec.case_num for rec in cases}
+
+    # impacts are parsed and retained only for the active cases.
+
+    impact_pages = (
+        [rec for rec in page if rec["caseNumber"] in case_nums]
+        for page in zapi.iter_impact_pages()
+    )
+    impacts = list(chain.from_iterable(parse_pages(ImpactRecord, impact_pages)))
+
+    conflicts = mtc_analysis.find_conflicts(cases, impacts, group_by)
+
+    print_rows(
+        f"Maintenance Conflicts ({len(conflicts)})",
+        CONFLICTS_TABLE_COLUMNS,
+        map(make_conflict_row, limit_records(conflicts, limit, page)),
+        fmt=fmt,
+        pager=pager,
+        show_count=False,
+    )
+
+
+@mtc.command(name="by-circuits")
+@click.argument("circuits_file", type=click.File())
+@click.option(
+    "--from",
+    "from_date",
+    type=click.DateTime(),
+    help="time span start, today by default",
+)
+@click.option(
+    "--to",
+    "to_date",
+    type=click.DateTime(),
+    help="time span end, 30 days after the start by default",
+)
+@opt_output
+def mtc_by_circuits(circuits_file, from_date, to_date, fmt, limit, page, pager):
+    """
+    Show the maintenance of many circuits within a time span.
+
+    The CIRCUITS_FILE lists the circuit IDs, one per line.
+    """
+    circuit_ids = [
+        line.strip()
+        for line in circuits_file
+        if line.strip() and not line.startswith("#")
+    ]
+
+    from_date = from_date or datetime.combine(datetime.today(), datetime.min.time())
+    to_date = to_date or from_date + timedelta(days=30)
+
+    index = MaintenanceIndex.from_client(make_client(multi_account=True))
+    found = index.query(circuit_ids, start=from_date, end=to_date)
+
+    rows = (
+        make_circuit_window_row(circuit_id, window, index.cases[window.case_num])
+        for circuit_id in circuit_ids
+        for window in found.get(circuit_id, ())
+    )
+
+    print_rows(
+        f"Circuits with maintenance ({len(found)} of {len(circuit_ids)})",
+        BY_CIRCUITS_TABLE_COLUMNS,
+        limit_records(rows, limit, page),
+        fmt=fmt,
+        pager=pager,
+        show_count=False,
+    )
+
+
+@mtc.command(name="watch")
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=1),
+    default=60,
+    show_default=True,
+    help="seconds between polls",
+)
+@click.option(
+    "--jitter",
+    type=click.FloatRange(0, 1),
+    default=0.1,
+    show_default=True,
+    help="random fraction by which each interval varies",
+)
+@click.option(
+    "--full-every",
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="number of polls between requests of all cases",
+)
+@click.option("--count", type=click.IntRange(min=1), help="number of polls, then exit")
+@click.option(
+    "--output",
+    "-o",
+    type=click.File("a"),
+    help="append the events as JSON lines to this file, - for stdout",
+)
+def mtc_watch_cases(interval, jitter, full_every, count, output):
+    """
+    Watch the maintenance cases and show the changes as they happen.
+
+    The changes reported are new cases, status changes, rescheduled cases,
+    closed cases, and cases removed from the listing.
+    """
+    zapi = make_client()
+
+    if output:
+        on_event = mtc_watch.JsonlEventWriter(output)
+    else:
+        console = Console()
+        console.print(f"Watching maintenance cases every {interval}s ...", style="dim")
+
+        def on_event(event):
+            """ print the event to the terminal """
+            console.print(make_event_text(event))
+
+    try:
+        mtc_watch.run_watch(
+            zapi,
+            on_event,
+            interval=interval,
+            jitter=jitter,
+            full_every=full_every,
+            max_polls=count,
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+@mtc.command(name="archive-emails")
+@click.argument("case_numbers", nargs=-1, shell_complete=complete_case_num)
+@click.option(
+    "--from",
+    "from_date",
+    type=click.DateTime(),
+    help="archive the cases with maintenance from this date",
+)
+@click.option(
+    "--to",
+    "to_date",
+    type=click.DateTime(),
+    help="archive the cases with maintenance until this date",
+)
+@click.option(
+    "--dir",
+    "directory",
+    default="zayo-emails",
+    show_default=True,
+    help="archive directory",
+)
+@click.option("--compress", "-z", is_flag=True, help="gzip compress the email files")
+def mtc_archive_emails(case_numbers, from_date, to_date, directory, compress):
+    """
+    Archive the notification emails of cases.
+
+    The cases are the CASE_NUMBERS, or those with maintenance within the --from
+    and --to dates.  Notifications already in the archive are skipped.
+    """
+    if not case_numbers and not (from_date or to_date):
+        raise click.UsageError("Provide CASE_NUMBERS, or the --from/--to dates")
+
+    zapi = make_client()
+    case_nums = list(case_numbers)
+
+    if from_date or to_date:
+        start = from_date or datetime.min
+        end = to_date or datetime.max
+        case_nums.extend(
+            case.case_num
+            for case in map(CaseRecord.parse_obj, zapi.get_cases())
+            if case.case_num not in case_numbers
+            and any(
+                win.start < end and start < win.end
+                for win in mtc_analysis.case_windows(case)
+            )
+        )
+
+    archive = EmailArchive(directory, compress=compress)
+    try:
+        counts = archive.archive(zapi, case_nums)
+    finally:
+        archive.close()
+
+    for name, count in counts.items():
+        click.echo(f"{name}: {count}")
+
+
 # -----------------------------------------------------------------------------
 #
 #                               MODULE FUNCTIONS
@@ -346,3 +833,29 @@ def _save_notif_emails(notifs: List[Dict]) -> None:
         with open(notif["name"] + ".html", "w+") as ofile:
             ofile.write(notif["emailBody"])
             print(f"Email saved: {ofile.name}")
+
+
+def _load_circuit_groups(ifile: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Returns the circuit groups from the groups file lines.  Each line lists
+    the circuit IDs of one group, separated by spaces or commas, optionally
+    prefixed by the group name and a colon.  Blank lines and lines starting
+    with "#" are ignored.
+    """
+    groups = dict()
+
+    for line in map(str.strip, ifile):
+        if not line or line.startswith("#"):
+            continue
+
+        name, _, circuits = line.rpartition(":")
+        groups[name.strip() or f"group-{len(groups) + 1}"] = circuits.replace(
+            ",", " "
+        ).split()
+
+    return groups
+
+
+def _service_names(services: Iterable[ServiceRow]) -> str:
+    """ returns the distinct service names, one per line """
+    return "\n".join(sorted({svc["service_name"] for svc in services}))
@@ -0,0 +1,108 @@
+"""
+This file contains the shell completion of the case numbers, notification
+names, and circuit IDs, and the CLI command to sync the completion index; see
+`pyzayo.completion`.  The completions are read from the local index, without
+requests to the API.
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import List
+from collections import defaultdict
+from itertools import chain
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import click
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo import consts
+from pyzayo.completion import (
+    CompletionIndex,
+    COMPLETION_KINDS,
+    circuit_key,
+    collect_ids,
+)
+from .cli_root import cli, make_client
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def complete_case_num(ctx, param, incomplete: str) -> List[str]:
+    """ click shell completion of a case number """
+    return CompletionIndex().complete("cases", incomplete.strip().upper())
+
+
+def complete_notification(ctx, param, incomplete: str) -> List[str]:
+    """ click shell completion of a notification name """
+    return CompletionIndex().complete("notifications", incomplete.strip().upper())
+
+
+def complete_circuit_id(ctx, param, incomplete: str) -> List[str]:
+    """ click shell completion of a circuit ID, in the "OGYX/123456/ZYO" form """
+    return CompletionIndex().complete("circuits", circuit_key(incomplete))
+
+
+# -----------------------------------------------------------------------------
+#
+#                               CLI CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+@cli.group("completion")
+def completion():
+    """
+    Shell completion commands.
+    """
+    pass
+
+
+@completion.command(name="sync")
+@click.option(
+    "--notifications",
+    is_flag=True,
+    help="include the notification names of the cases that are not closed",
+)
+def cli_completion_sync(notifications):
+    """
+    Add the IDs of all cases, impacts, and services to the completion index.
+    """
+    zapi = make_client()
+    ids = defaultdict(set)
+
+    for route, pages in (
+        (consts.ZAYO_SM_ROUTE_MTC_CASES, zapi.iter_case_pages()),
+        (consts.ZAYO_SM_ROUTE_MTC_IMPACTS, zapi.iter_impact_pages()),
+        (consts.ZAYO_SM_ROUTE_SERVICES, zapi.iter_service_pages()),
+    ):
+        collect_ids(route, chain.from_iterable(pages), ids)
+
+    if notifications:
+        open_cases = [
+            rec["caseNumber"]
+            for rec in zapi.get_cases()
+            if rec["status"] != consts.CaseStatusOptions.closed
+        ]
+        notifs = zapi.get_cases_notifications(open_cases)
+        collect_ids(
+            consts.ZAYO_SM_ROUTE_MTC_NOTIFS_BY_CASE,
+            chain.from_iterable(case_notifs for case_notifs, _ in notifs.values()),
+            ids,
+        )
+
+    index = CompletionIndex()
+    for kind in COMPLETION_KINDS:
+        added = index.update(kind, ids[kind])
+        click.echo(f"{kind}: {len(ids[kind])} ({added} new)")
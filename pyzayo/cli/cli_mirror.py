@@ -0,0 +1,140 @@
+"""
+This file contains the CLI commands for the local SQLite mirror of the Zayo
+maintenance and service inventory records.
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import List, Dict
+import sqlite3
+import csv
+import json
+import sys
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import click
+from rich.console import Console
+from rich.table import Table, Text
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo import consts
+from pyzayo.mirror import ZayoMirror
+from .cli_root import cli, make_client
+
+# -----------------------------------------------------------------------------
+#
+#                               TABLE CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def make_query_table(rows: List[Dict]) -> Table:
+    """
+    Create a Rich.Table of the query result rows.
+
+    Parameters
+    ----------
+    rows: List[Dict]
+        The query result rows, as returned by ZayoMirror.query
+
+    Returns
+    -------
+    The Table ready for console rendering.
+    """
+    count = len(rows)
+    table = Table(
+        title=Text(f"Rows ({count})", style="bright_white", justify="left"),
+        show_header=True,
+        header_style="bold magenta",
+    )
+
+    for col in rows[0] if rows else []:
+        table.add_column(col)
+
+    for row in rows:
+        table.add_row(*("" if val is None else str(val) for val in row.values()))
+
+    return table
+
+
+# -----------------------------------------------------------------------------
+#
+#                               CLI CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+opt_db = click.option(
+    "--db",
+    "dbpath",
+    default=consts.ZAYO_MIRROR_DB,
+    show_default=True,
+    help="mirror database file",
+)
+
+
+@cli.command(name="sync")
+@opt_db
+@click.option(
+    "--all-notifications",
+    is_flag=True,
+    help="mirror notifications of all cases, not only cases that are not closed",
+)
+def cli_sync(dbpath, all_notifications):
+    """
+    Mirror cases, impacts, notifications, and services into a local database.
+    """
+    with ZayoMirror(dbpath) as mirror:
+        counts = mirror.sync(make_client(), all_notifications=all_notifications)
+
+    for table, count in counts.items():
+        click.echo(f"{table}: {count}")
+
+
+@cli.command(name="query")
+@opt_db
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["table", "csv", "jsonl"]),
+    default="table",
+    show_default=True,
+    help="output format",
+)
+@click.argument("sql")
+@click.argument("params", nargs=-1)
+def cli_query(dbpath, fmt, sql, params):
+    """
+    Run the SQL statement against the local mirror database.
+
+    The tables are: cases, impacts, notifications, services, and sync_status.
+    Use "?" placeholders in the SQL with PARAMS values.
+    """
+    try:
+        with ZayoMirror(dbpath, read_only=True) as mirror:
+            rows = mirror.query(sql, params)
+
+    except FileNotFoundError as exc:
+        raise click.ClickException(f"{exc}; run 'zayocli sync' first")
+
+    except sqlite3.Error as exc:
+        raise click.ClickException(f"Query failed: {exc}")
+
+    if fmt == "table":
+        Console().print(make_query_table(rows))
+
+    elif fmt == "csv" and rows:
+        writer = csv.DictWriter(sys.stdout, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    elif fmt == "jsonl":
+        for row in rows:
+            click.echo(json.dumps(row))
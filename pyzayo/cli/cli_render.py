@@ -0,0 +1,270 @@
+"""
+This file contains the CLI output rendering functions shared by the commands.
+Tables are built from a column specification and table rows so that a listing
+can be rendered either as a single Rich.Table, or streamed: rendered in chunks
+of rows as the records arrive from the API pagination.  The column widths of
+the streamed chunks are those measured from the first chunk, so that the
+chunks align as one table.
+
+When the output is not a terminal, or when the "tsv" format is selected, the
+rows are written as plain tab-separated values without any table layout.
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Iterable, Sequence, Tuple, Dict, List, Optional
+from contextlib import contextmanager, nullcontext
+from itertools import islice, chain
+import subprocess
+import shutil
+import shlex
+import sys
+import os
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import click
+from rich.console import Console
+from rich.table import Table, Text
+from rich.measure import Measurement
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo import profiling
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "TableColumns",
+    "make_table",
+    "limit_records",
+    "print_rows",
+    "opt_output",
+]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# The table column specification: a sequence of (column-name, column-options)
+TableColumns = Sequence[Tuple[str, Dict]]
+
+# The number of rows rendered per table chunk when streaming.
+TABLE_CHUNK_SIZE = 50
+
+OUTPUT_FORMATS = ("auto", "table", "tsv")
+
+
+def make_table(
+    title: str,
+    columns: TableColumns,
+    show_header=True,
+    caption: Optional[str] = None,
+    widths: Optional[Sequence[int]] = None,
+) -> Table:
+    """
+    Create an empty Rich.Table, in the style used by the CLI, with the given
+    title and columns; and optionally a caption and fixed column widths.
+    """
+    table = Table(
+        title=Text(title, style="bright_white", justify="left") if title else None,
+        caption=(
+            Text(caption, style="bright_white", justify="left") if caption else None
+        ),
+        show_header=show_header,
+        header_style="bold magenta",
+        show_lines=True,
+    )
+
+    for idx, (name, col_opts) in enumerate(columns):
+        if widths and "width" not in col_opts:
+            col_opts = dict(col_opts, width=widths[idx])
+        table.add_column(name, **col_opts)
+
+    return table
+
+
+def _column_widths(
+    console: Console, columns: TableColumns, rows: Sequence[Sequence]
+) -> List[int]:
+    """ returns the content width of each column, measured from the rows """
+    options = console.options
+    return [
+        max(
+            Measurement.get(console, options, cell).maximum
+            for cell in chain((name,), (row[idx] or "" for row in rows))
+        )
+        for idx, (name, _) in enumerate(columns)
+    ]
+
+
+def limit_records(
+    records: Iterable, limit: Optional[int] = None, page: Optional[int] = 1
+) -> Iterable:
+    """
+    Returns the records of the given `page`, `limit` records per page.  When
+    `limit` is not provided all records are returned.  The records are
+    consumed lazily so that records beyond the page are not retrieved.
+    """
+    if not limit:
+        return records
+
+    start = (page - 1) * limit
+    return islice(records, start, start + limit)
+
+
+def _tsv_value(value) -> str:
+    """ returns the cell value as plain text on a single line """
+    text = value.plain if isinstance(value, Text) else str(value or "")
+    return " ".join(text.split())
+
+
+@contextmanager
+def _pager_console():
+    """
+    Provide a Console whose output is piped, as it is rendered, to the pager
+    command defined by the PAGER environment variable, "less -R" by default.
+    """
+    proc = subprocess.Popen(
+        shlex.split(os.environ.get("PAGER", "less -R")),
+        stdin=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    console = Console(
+        file=proc.stdin, force_terminal=True, width=shutil.get_terminal_size()[0]
+    )
+
+    try:
+        yield console
+
+    except BrokenPipeError:
+        # the User quit the pager before all of the output was rendered.
+        pass
+
+    finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        proc.wait()
+
+
+def print_rows(
+    title: str,
+    columns: TableColumns,
+    rows: Iterable[Sequence],
+    fmt: Optional[str] = "auto",
+    pager: Optional[bool] = False,
+    chunk_size: Optional[int] = TABLE_CHUNK_SIZE,
+    show_count: Optional[bool] = True,
+):
+    """
+    Output the rows as they arrive.
+
+    Parameters
+    ----------
+    title: str
+        The table title
+
+    columns: TableColumns
+        The table column specification
+
+    rows: Iterable[Sequence]
+        The table rows, consumed lazily.
+
+    fmt: str
+        One of OUTPUT_FORMATS.  The "auto" format selects "table" when the
+        output is a terminal, and "tsv" otherwise.
+
+    pager: bool
+        When True the table output is piped through the pager.
+
+    chunk_size: int
+        The number of rows rendered per table chunk.
+
+    show_count: bool
+        When True the number of rows is shown with the title: in the title
+        when all of the rows are within the first chunk, and otherwise in the
+        caption of the last chunk.
+    """
+    if fmt == "auto":
+        fmt = "table" if sys.stdout.isatty() else "tsv"
+
+    if fmt == "tsv":
+        write = sys.stdout.write
+        write("\t".join(name for name, _ in columns) + "\n")
+        for row in rows:
+            with profiling.phase("render"):
+                write("\t".join(map(_tsv_value, row)) + "\n")
+        return
+
+    with _pager_console() if pager else nullcontext(Console()) as console:
+        rows = iter(rows)
+        chunk = list(islice(rows, chunk_size))
+        count, widths, first = 0, None, True
+
+        while True:
+            # one row of look-ahead so that the last chunk carries the count.
+
+            following = next(rows, None)
+            count += len(chunk)
+            last = following is None
+            total_title = f"{title} ({count})" if show_count else title
+
+            with profiling.phase("render"):
+                if not last and widths is None:
+                    widths = _column_widths(console, columns, chunk)
+
+                table = make_table(
+                    (total_title if last else title) if first else None,
+                    columns,
+                    show_header=first,
+                    caption=total_title if last and show_count and not first else None,
+                    widths=widths,
+                )
+                for row in chunk:
+                    table.add_row(*row)
+
+                console.print(table)
+
+            if last:
+                break
+
+            chunk = [following, *islice(rows, chunk_size - 1)]
+            first = False
+
+
+def opt_output(func):
+    """ decorator that adds the listing output options to a command """
+    options = (
+        click.option(
+            "--format",
+            "fmt",
+            type=click.Choice(OUTPUT_FORMATS),
+            default="auto",
+            show_default=True,
+            help="output format; auto uses tsv when the output is not a terminal",
+        ),
+        click.option("--limit", type=click.IntRange(min=1), help="records per page"),
+        click.option(
+            "--page",
+            type=click.IntRange(min=1),
+            default=1,
+            show_default=True,
+            help="page number when using --limit",
+        ),
+        click.option("--pager", is_flag=True, help="pipe the output through a pager"),
+    )
+    for option in reversed(options):
+        func = option(func)
+    return func
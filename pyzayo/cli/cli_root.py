@@ -17,27 +17,193 @@ import click
 
 import pyzayo
 from pyzayo.consts import Env
+from pyzayo import profiling
 
 
 # -----------------------------------------------------------------------------
 # Module Exports
 # -----------------------------------------------------------------------------
 
-__all__ = ["cli"]
+__all__ = ["cli", "make_client"]
 
 VERSION = metadata.version(pyzayo.__package__)
 
 
 @click.group(invoke_without_command=True)
 @click.version_option(version=VERSION)
+@click.option(
+    "--snapshot",
+    type=click.Path(exists=True, dir_okay=False),
+    help="serve all commands from the snapshot file, offline",
+)
+@click.option(
+    "--record",
+    type=click.Path(dir_okay=False, writable=True),
+    help="record the API requests and responses into the cassette file",
+)
+@click.option(
+    "--replay",
+    type=click.Path(exists=True, dir_okay=False),
+    help="serve all commands from the cassette file, offline",
+)
+@click.option(
+    "--account",
+    help="use the credentials of the account in the accounts file",
+)
+@click.option(
+    "--all-accounts",
+    is_flag=True,
+    help="query all of the accounts in the accounts file, where supported",
+)
+@click.option(
+    "--replay-latency",
+    type=float,
+    default=1.0,
+    show_default=True,
+    help="scale of the recorded latencies when replaying, 0 for none",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="report the time spent per phase and the request waterfall on stderr",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False, writable=True),
+    help="with --profile, write the cProfile statistics to this file",
+)
 @click.pass_context
-def cli(ctx: click.Context):
+def cli(
+    ctx: click.Context,
+    snapshot,
+    record,
+    replay,
+    account,
+    all_accounts,
+    replay_latency,
+    profile,
+    profile_output,
+):
     """
     Zayo CLI tool to access information via the API.
+
+    The account credentials used by the --account and --all-accounts options
+    are defined in the accounts file, $PYZAYO_ACCOUNTS_FILE or
+    ~/.config/pyzayo/accounts.ini by default.
     """
-    try:
-        # Ensure the necessary environment variables are set before proceeding.
-        all(environ[env_var] for env_var in Env.values())
+    if len([opt for opt in (snapshot, record, replay) if opt]) > 1:
+        ctx.fail("Use only one of --snapshot, --record, or --replay")
+
+    if account and all_accounts:
+        ctx.fail("Use only one of --account or --all-accounts")
+
+    if (account or all_accounts) and (snapshot or replay):
+        ctx.fail("The account options do not apply to --snapshot or --replay")
+
+    if profile_output and not profile:
+        ctx.fail("The --profile-output option requires --profile")
+
+    if profile:
+        profiler = profiling.enable(output=profile_output)
+
+        def report():
+            profiling.disable()
+            profiler.report()
+
+        ctx.call_on_close(report)
+
+    ctx.obj = dict(
+        snapshot=snapshot,
+        record=record,
+        replay=replay,
+        replay_latency=replay_latency,
+        account=account,
+        all_accounts=all_accounts,
+    )
+
+
+def make_client(multi_account=False):
+    """
+    Create the ZayoClient instance used by the commands, in accordance with
+    the root command options.  The client credential environment variables are
+    checked only when the client requires access to the API.
+
+    Parameters
+    ----------
+    multi_account: bool
+        True when the command supports the --all-accounts option; a
+        `pyzayo.pool.ZayoClientPool` is then returned when the option is used.
+    """
+    ctx = click.get_current_context()
+    options = ctx.find_root().obj or {}
+
+    if options.get("snapshot"):
+        from pyzayo.snapshot import SnapshotTransport
+
+        client = pyzayo.ZayoClient(transport=SnapshotTransport(options["snapshot"]))
+        ctx.call_on_close(client.close)
+        return client
+
+    if options.get("replay"):
+        from pyzayo.cassette import ReplayTransport
+
+        client = pyzayo.ZayoClient(
+            transport=ReplayTransport(
+                options["replay"], latency_scale=options["replay_latency"]
+            )
+        )
+        ctx.call_on_close(client.close)
+        return client
+
+    credentials = None
+
+    if options.get("account") or options.get("all_accounts"):
+        from pyzayo.pool import ZayoClientPool, load_accounts
+
+        try:
+            accounts = load_accounts()
+        except (OSError, ValueError) as exc:
+            ctx.fail(str(exc))
+
+        if options.get("all_accounts"):
+            if not multi_account:
+                ctx.fail(f"{ctx.command_path} does not support --all-accounts")
+            if options.get("record"):
+                ctx.fail("The --record option does not support --all-accounts")
+
+            pool = ZayoClientPool(accounts)
+            ctx.call_on_close(pool.close)
+            return pool
+
+        try:
+            credentials = accounts[options["account"]]
+        except KeyError:
+            ctx.fail(f"Account not found in the accounts file: {options['account']}")
+
+    else:
+        try:
+            # Ensure the necessary environment variables are set before proceeding.
+            all(environ[env_var] for env_var in Env.values())
+
+        except KeyError as exc:
+            ctx.fail(f"Missing environment variable: {exc}")
+
+    if options.get("record"):
+        from pyzayo.cassette import RecordingTransport
+
+        client = pyzayo.ZayoClient(
+            transport=RecordingTransport(options["record"]),
+            credentials=credentials,
+            completion_index=True,
+        )
+
+        # the client must be closed so that the cassette file is complete.
+        ctx.call_on_close(client.close)
+        return client
+
+    # the client is closed so that the IDs of the records received are added
+    # to the shell completion index.
 
-    except KeyError as exc:
-        ctx.fail(f"Missing environment variable: {exc}")
+    client = pyzayo.ZayoClient(credentials=credentials, completion_index=True)
+    ctx.call_on_close(client.close)
+    return client
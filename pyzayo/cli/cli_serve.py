@@ -0,0 +1,66 @@
+"""
+This file contains the CLI command to run the local caching proxy service, see
+`pyzayo.proxy`.
+"""
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import click
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from .cli_root import cli, make_client
+
+# -----------------------------------------------------------------------------
+#
+#                               CLI CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+@cli.command(name="serve")
+@click.option("--host", default="127.0.0.1", show_default=True, help="listen address")
+@click.option(
+    "--port", type=click.IntRange(0, 65535), default=8080, show_default=True
+)
+@click.option(
+    "--ttl",
+    type=click.FloatRange(min=0, min_open=True),
+    default=300,
+    show_default=True,
+    help="seconds a response is cached",
+)
+@click.option(
+    "--rate",
+    type=click.FloatRange(min=0, min_open=True),
+    default=5,
+    show_default=True,
+    help="maximum upstream requests per second",
+)
+@click.option(
+    "--burst",
+    type=click.IntRange(min=1),
+    help="maximum upstream requests sent without waiting",
+)
+def cli_serve(host, port, ttl, rate, burst):
+    """
+    Run a local caching proxy service for the Zayo API.
+
+    Consumers send requests to the proxy with the same routes and request
+    shapes as the Zayo API; the proxy forwards them upstream with one token, a
+    shared response cache, request coalescing, and a global rate limit.
+    """
+    from pyzayo.proxy import ZayoProxy
+
+    proxy = ZayoProxy(make_client(), ttl=ttl, rate=rate, burst=burst)
+
+    def on_start(server):
+        """ show the listening address """
+        s_host, s_port = server.sockets[0].getsockname()[:2]
+        click.echo(f"Serving the Zayo API proxy on http://{s_host}:{s_port}/", err=True)
+
+    proxy.run(host, port, on_start=on_start)
@@ -12,7 +12,8 @@ References
 # System Imports
 # -----------------------------------------------------------------------------
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
+from itertools import chain
 
 # -----------------------------------------------------------------------------
 # Public Imports
@@ -26,9 +27,17 @@ from rich.table import Table, Text
 # Private Imports
 # -----------------------------------------------------------------------------
 
-from pyzayo import ZayoClient
-from .cli_root import cli
+from .cli_root import cli, make_client
+from .cli_completion import complete_circuit_id
+from .cli_render import TableColumns, make_table, limit_records, print_rows, opt_output
 from pyzayo.consts import InventoryStatusOption
+from pyzayo.export import (
+    EXPORT_FORMATS,
+    SERVICE_FIELDS,
+    flatten_service,
+    flatten_tagged,
+    export_pages,
+)
 
 # -----------------------------------------------------------------------------
 #
@@ -48,6 +57,37 @@ def colorize_status(status):
     )
 
 
+SERVICES_TABLE_COLUMNS: TableColumns = (
+    ("Name", {}),
+    ("Status", {}),
+    ("Product", {}),
+    ("Circuit Id", {}),
+    ("Bandwidth", {}),
+    ("Location A", {}),
+    ("Location Z", {}),
+)
+
+
+def make_location(_loc):
+    """ create address from location fields """
+    return f"{_loc['name']}\n{_loc['city']}, {_loc['state']} {_loc['postalCode']}"
+
+
+def make_service_row(rec: Dict) -> Tuple:
+    """ returns the services table row for the service inventory record """
+    comps = rec["components"][0]
+
+    return (
+        rec["serviceName"],
+        colorize_status(rec["status"]),
+        f"{rec['productGroup']}\n{rec['productCategory']}",
+        comps["circuitId"],
+        comps["bandwidth"],
+        make_location(comps["locations"][0]),
+        make_location(comps["locations"][1]),
+    )
+
+
 def make_services_table(services: List[Dict]) -> Table:
     """
     Create a Rich.Table of service inventory records.
@@ -64,37 +104,10 @@ def make_services_table(services: List[Dict]) -> Table:
     count = len(services)
     title = f"Services ({count})" if count > 1 else "Service"
 
-    table = Table(
-        title=Text(title, style="bright_white", justify="left"),
-        show_header=True,
-        header_style="bold magenta",
-        show_lines=True,
-    )
-
-    table.add_column("Name")
-    table.add_column("Status")
-    table.add_column("Product")
-    table.add_column("Circuit Id")
-    table.add_column("Bandwidth")
-    table.add_column("Location A")
-    table.add_column("Location Z")
-
-    def make_location(_loc):
-        """ create address from location fields """
-        return f"{_loc['name']}\n{_loc['city']}, {_loc['state']} {_loc['postalCode']}"
+    table = make_table(title, SERVICES_TABLE_COLUMNS)
 
     for rec in services:
-        comps = rec["components"][0]
-
-        table.add_row(
-            rec["serviceName"],
-            colorize_status(rec["status"]),
-            f"{rec['productGroup']}\n{rec['productCategory']}",
-            comps["circuitId"],
-            comps["bandwidth"],
-            make_location(comps["locations"][0]),
-            make_location(comps["locations"][1]),
-        )
+        table.add_row(*make_service_row(rec))
 
     return table
 
@@ -113,23 +126,32 @@ def svc():
 
 
 @svc.command(name="list")
-def cli_svc_inventory_list():
+@opt_output
+def cli_svc_inventory_list(fmt, limit, page, pager):
     """
     List service inventory.
     """
-    zapi = ZayoClient()
-    svc_list = zapi.get_services()
-    console = Console()
-    console.print(make_services_table(services=svc_list))
+    zapi = make_client(multi_account=True)
+
+    # the rows are rendered as the pages of records arrive.
+
+    services = chain.from_iterable(zapi.iter_service_pages())
+    print_rows(
+        "Services",
+        SERVICES_TABLE_COLUMNS,
+        map(make_service_row, limit_records(services, limit, page)),
+        fmt=fmt,
+        pager=pager,
+    )
 
 
 @svc.command(name="circuit")
-@click.argument("circuit_id")
+@click.argument("circuit_id", shell_complete=complete_circuit_id)
 def cli_svc_by_circuit(circuit_id):
     """
     Show service record for given circuit ID.
     """
-    zapi = ZayoClient()
+    zapi = make_client()
     cir_rec = zapi.get_service_by_circuit_id(circuit_id)
 
     if not cir_rec:
@@ -138,3 +160,28 @@ def cli_svc_by_circuit(circuit_id):
 
     console = Console()
     console.print(make_services_table(services=[cir_rec]))
+
+
+@svc.command(name="export")
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(EXPORT_FORMATS),
+    default="csv",
+    show_default=True,
+    help="output file format",
+)
+@click.option("--output", "-o", default="-", help="output file, stdout by default")
+def cli_svc_export(fmt, output):
+    """
+    Export service inventory to a flat file.
+    """
+    from pyzayo.pool import ZayoClientPool, ACCOUNT_KEY
+
+    zapi = make_client(multi_account=True)
+    flatten, fields = flatten_service, SERVICE_FIELDS
+    if isinstance(zapi, ZayoClientPool):
+        flatten, fields = flatten_tagged(flatten, fields, ACCOUNT_KEY)
+
+    count = export_pages(zapi.iter_service_pages(), flatten, fields, fmt, output)
+    click.echo(f"Services exported: {count}", err=True)
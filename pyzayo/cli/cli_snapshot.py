@@ -0,0 +1,79 @@
+"""
+This file contains the CLI commands to save and inspect the offline snapshot
+files.  Use the root `--snapshot FILE` option to serve any command from a
+snapshot file.
+"""
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import click
+from rich.console import Console
+from rich.table import Table, Text
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from .cli_root import cli, make_client
+
+# -----------------------------------------------------------------------------
+#
+#                               CLI CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+@cli.group("snapshot")
+def snapshot():
+    """ Offline snapshot commands. """
+    pass
+
+
+@snapshot.command(name="save")
+@click.argument("filepath", type=click.Path(dir_okay=False, writable=True))
+@click.option(
+    "--all-notifications",
+    is_flag=True,
+    help="save notifications of all cases, not only cases that are not closed",
+)
+def cli_snapshot_save(filepath, all_notifications):
+    """
+    Save cases, impacts, notifications, and services into a snapshot file.
+    """
+    from pyzayo.snapshot import save_snapshot
+
+    counts = save_snapshot(
+        make_client(), filepath, all_notifications=all_notifications
+    )
+    for collection, count in counts.items():
+        click.echo(f"{collection}: {count}")
+
+
+@snapshot.command(name="info")
+@click.argument("filepath", type=click.Path(exists=True, dir_okay=False))
+def cli_snapshot_info(filepath):
+    """
+    Show the snapshot creation time and record counts.
+    """
+    from pyzayo.snapshot import Snapshot, SnapshotError
+
+    try:
+        snap = Snapshot(filepath)
+    except SnapshotError as exc:
+        raise click.ClickException(str(exc))
+
+    table = Table(
+        title=Text(f"Snapshot {snap.created}", style="bright_white", justify="left"),
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Collection")
+    table.add_column("Records", justify="right")
+
+    for collection in snap.index["collections"]:
+        table.add_row(collection, str(snap.count(collection)))
+
+    Console().print(table)
+    snap.close()
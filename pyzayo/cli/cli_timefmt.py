@@ -0,0 +1,126 @@
+"""
+This file contains the date and time formatting used by the CLI tables.  The
+formatting uses only the standard library datetime module.  A TimeFormatter
+captures "now" once, when it is created, so that every row of a rendered table
+is humanized relative to the same instant; and the humanized strings are
+memoized since many records share the same dates.
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, Union, Dict, Iterable
+from datetime import date, datetime, time, timezone
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["TimeFormatter"]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# humanize units, largest first: (name, seconds)
+_TIME_UNITS = (
+    ("year", 365 * 86400),
+    ("month", 30 * 86400),
+    ("week", 7 * 86400),
+    ("day", 86400),
+    ("hour", 3600),
+    ("minute", 60),
+    ("second", 1),
+)
+
+
+def humanize_seconds(seconds: float) -> str:
+    """
+    Returns the humanized form of a time difference, in the form used by the
+    CLI tables, for example "in 3 days" or "2 weeks ago".  A positive value
+    designates the future.
+    """
+    abs_secs = abs(seconds)
+    if abs_secs < 10:
+        return "just now"
+
+    for unit, unit_secs in _TIME_UNITS:
+        if abs_secs >= unit_secs:
+            count = int(abs_secs // unit_secs)
+            break
+
+    text = f"{count} {unit}" + ("s" if count != 1 else "")
+    return f"in {text}" if seconds > 0 else f"{text} ago"
+
+
+class TimeFormatter(object):
+    """
+    Formats dates and datetimes for the CLI tables relative to a single "now".
+
+    Parameters
+    ----------
+    now: datetime, optional
+        The reference time used to humanize values, the current time when
+        not provided.
+    """
+
+    def __init__(self, now: Optional[datetime] = None):
+        """ capture the reference time """
+        self.now = now or datetime.now(timezone.utc)
+        self._slang: Dict[Union[date, datetime], str] = dict()
+        self._cells: Dict[Union[tuple, datetime], str] = dict()
+
+    @staticmethod
+    def as_datetime(value: Union[date, datetime]) -> datetime:
+        """
+        Returns the value as a timezone-aware datetime; dates are midnight UTC
+        and naive datetimes are taken to be UTC.
+        """
+        if not isinstance(value, datetime):
+            return datetime.combine(value, time(), tzinfo=timezone.utc)
+
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+
+        return value
+
+    def slang_time(self, value: Union[date, datetime]) -> str:
+        """ returns the humanized time of the value relative to now """
+        try:
+            return self._slang[value]
+        except KeyError:
+            delta = self.as_datetime(value) - self.now
+            text = self._slang[value] = humanize_seconds(delta.total_seconds())
+            return text
+
+    def local_datetime(self, value: Union[date, datetime]) -> datetime:
+        """ returns the value as a datetime in the local timezone """
+        return self.as_datetime(value).astimezone()
+
+    def dates_cell(self, dates: Iterable[date]) -> str:
+        """
+        Returns the table cell text of the sorted dates, followed by the
+        humanized time of the earliest date.
+        """
+        dates = tuple(sorted(dates))
+        try:
+            return self._cells[dates]
+        except KeyError:
+            text = "\n".join(map(str, dates)) + f"\n({self.slang_time(dates[0])})"
+            self._cells[dates] = text
+            return text
+
+    def datetime_cell(self, value: datetime) -> str:
+        """
+        Returns the table cell text of the local date and time, followed by the
+        humanized time.
+        """
+        try:
+            return self._cells[value]
+        except KeyError:
+            text = self.local_datetime(value).strftime("%Y-%m-%d\n%H:%M:%S")
+            text = self._cells[value] = text + f"\n({self.slang_time(value)})"
+            return text
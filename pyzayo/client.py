@@ -1,5 +1,9 @@
+from typing import Dict, List, Iterable, Optional
+
 from pyzayo.mtc_mixin import ZayoMatenanceMixin
 from pyzayo.svcinv_mixin import ZayoServiceInventoryMixin
+from pyzayo.cache import TTLCache
+from pyzayo.prefetch import PrefetchScheduler, PREFETCH_INTERVALS, load_dataset
 
 
 __all__ = ["ZayoClient"]
@@ -10,4 +14,68 @@ class ZayoClient(ZayoMatenanceMixin, ZayoServiceInventoryMixin):
     Zayo Client class supporting the Maintenance and Sevice-Inventory functional areas.
     """
 
-    pass
+    def __init__(self, *args, **kwargs):
+        """ see ZayoClientBase; creates the empty dataset cache """
+        super().__init__(*args, **kwargs)
+        self.datasets = TTLCache(ttl=max(PREFETCH_INTERVALS.values()))
+        self.prefetch: Optional[PrefetchScheduler] = None
+
+    def close(self):
+        """ stop any prefetch scheduler and close the client """
+        self.stop_prefetch()
+        super().close()
+
+    def get_dataset(self, name: str):
+        """
+        Returns the named dataset, see `pyzayo.prefetch`, from the dataset cache;
+        the dataset is loaded when not cached, or expired.  The cached dataset is
+        shared by all callers and must not be modified.
+        """
+        return self._run(self._fetch_dataset(name))
+
+    async def _fetch_dataset(self, name: str):
+        """ coroutine that implements `get_dataset` """
+        intervals = self.prefetch.intervals if self.prefetch else PREFETCH_INTERVALS
+        return await self.datasets.get_or_fetch(
+            name, lambda: load_dataset(self, name), ttl=intervals.get(name)
+        )
+
+    def start_prefetch(
+        self,
+        datasets: Optional[Iterable[str]] = None,
+        intervals: Optional[Dict[str, float]] = None,
+        concurrency: Optional[int] = 2,
+    ) -> PrefetchScheduler:
+        """
+        Start refreshing the datasets in the background so that `get_dataset`,
+        and `get_services` without criteria, are served from memory; see
+        `pyzayo.prefetch.PrefetchScheduler` for the parameters.
+        """
+        self.stop_prefetch()
+        self.prefetch = PrefetchScheduler(
+            self, datasets=datasets, intervals=intervals, concurrency=concurrency
+        )
+        self.prefetch.start()
+        return self.prefetch
+
+    def stop_prefetch(self):
+        """ stop refreshing the datasets in the background """
+        if self.prefetch:
+            self.prefetch.stop()
+            self.prefetch = None
+
+    def get_services(self, **params) -> List[Dict]:
+        """
+        See ZayoServiceInventoryMixin.get_services; all of the services are
+        served from the dataset cache when the "services" dataset is cached.  The
+        records are then shallow copies, so that the caller may modify them
+        without changing the cached dataset; their nested values are shared.
+        """
+        if not params and self._run(self._is_dataset_cached("services")):
+            return list(map(dict, self.get_dataset("services")))
+
+        return super().get_services(**params)
+
+    async def _is_dataset_cached(self, name: str) -> bool:
+        """ True if the dataset is cached; checked on the loop thread """
+        return name in self.datasets
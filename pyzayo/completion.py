@@ -0,0 +1,201 @@
+"""
+This module contains the local index of case numbers, notification names, and
+circuit IDs used by the zayocli shell completion.
+
+Completion must answer within a few milliseconds, so it cannot request the
+API.  Instead the IDs seen by the client are kept in the index directory, one
+file per kind, each a sorted list of unique IDs one per line.  A prefix query
+memory-maps the file and bisects it for the first ID not less than the prefix;
+the matching IDs follow it.  Only the standard library is imported, so that a
+completion does not import the HTTP stack.
+
+The index is updated when a client created with `completion_index=True`, as
+by zayocli, is closed; and by the `zayocli completion sync` command.
+
+Examples
+--------
+    from pyzayo.completion import CompletionIndex
+
+    index = CompletionIndex()
+    index.update("cases", ["TTN-0003153584"])
+    index.complete("cases", "TTN-00031")
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, List, Set, Iterable, Optional
+from tempfile import NamedTemporaryFile
+import mmap
+import os
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo import consts
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "CompletionIndex",
+    "COMPLETION_KINDS",
+    "circuit_key",
+    "collect_ids",
+]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+COMPLETION_KINDS = ("cases", "notifications", "circuits")
+
+# The maximum number of completions returned by a prefix query.
+COMPLETION_MAX_ITEMS = 100
+
+
+class CompletionIndex(object):
+    """
+    The sorted ID files of the completion index.
+
+    Parameters
+    ----------
+    directory: str, optional
+        The index directory, `consts.ZAYO_COMPLETION_DIR` by default.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """ the index in the directory; created by the first update """
+        self.directory = directory or consts.ZAYO_COMPLETION_DIR
+
+    def path(self, kind: str) -> str:
+        """ returns the ID file path of the kind """
+        if kind not in COMPLETION_KINDS:
+            raise ValueError(f"Unknown completion kind: {kind}")
+        return os.path.join(self.directory, f"{kind}.txt")
+
+    def complete(
+        self, kind: str, prefix: str, limit: Optional[int] = COMPLETION_MAX_ITEMS
+    ) -> List[str]:
+        """ returns the IDs of the kind that begin with the prefix, sorted """
+        try:
+            with open(self.path(kind), "rb") as ifile:
+                if not os.fstat(ifile.fileno()).st_size:
+                    return []
+                with mmap.mmap(ifile.fileno(), 0, access=mmap.ACCESS_READ) as ids:
+                    return _prefix_lines(ids, prefix.encode(), limit)
+        except FileNotFoundError:
+            return []
+
+    def read(self, kind: str) -> List[str]:
+        """ returns all of the IDs of the kind, one per line of the file """
+        try:
+            with open(self.path(kind)) as ifile:
+                return ifile.read().splitlines()
+        except FileNotFoundError:
+            return []
+
+    def update(self, kind: str, values: Iterable[str]) -> int:
+        """
+        Add the IDs to the index, returning the number of new IDs.  The file is
+        replaced atomically, so that a concurrent completion reads either the
+        old or the new IDs.
+        """
+        values = {value.strip() for value in values} - {""}
+        existing = self.read(kind)
+        added = values.difference(existing)
+        if not added:
+            return 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        with NamedTemporaryFile(
+            "w", dir=self.directory, prefix=f".{kind}.", delete=False
+        ) as ofile:
+            ofile.writelines(f"{value}\n" for value in sorted(added.union(existing)))
+
+        os.replace(ofile.name, self.path(kind))
+        return len(added)
+
+
+# -----------------------------------------------------------------------------
+#
+#                               MODULE FUNCTIONS
+#
+# -----------------------------------------------------------------------------
+
+
+def circuit_key(circuit_id: str) -> str:
+    """
+    Returns the circuit ID in the indexed form, the API form less the field
+    padding and the leading and trailing "/", for example "OGYX/123456/ZYO".
+    """
+    return "/".join(
+        field.strip() for field in circuit_id.upper().split("/") if field.strip()
+    )
+
+
+def collect_ids(route: str, records: Iterable[Dict], ids: Dict[str, Set[str]]):
+    """
+    Add the case numbers, notification names, and circuit IDs of the records,
+    in API dict form, of the API route to the `ids` sets by kind.
+    """
+    if route == consts.ZAYO_SM_ROUTE_MTC_CASES:
+        ids["cases"].update(
+            rec["caseNumber"] for rec in records if rec.get("caseNumber")
+        )
+
+    elif route == consts.ZAYO_SM_ROUTE_MTC_IMPACTS:
+        for rec in records:
+            if rec.get("caseNumber"):
+                ids["cases"].add(rec["caseNumber"])
+            if rec.get("circuitId"):
+                ids["circuits"].add(circuit_key(rec["circuitId"]))
+
+    elif route in (
+        consts.ZAYO_SM_ROUTE_MTC_NOTIFS_BY_CASE,
+        consts.ZAYO_SM_ROUTE_MTC_NOTIFS_BY_NAME,
+    ):
+        ids["notifications"].update(rec["name"] for rec in records if rec.get("name"))
+
+    elif route == consts.ZAYO_SM_ROUTE_SERVICES:
+        ids["circuits"].update(
+            circuit_key(component["circuitId"])
+            for rec in records
+            for component in rec.get("components") or ()
+            if component.get("circuitId")
+        )
+
+
+def _prefix_lines(lines: mmap.mmap, prefix: bytes, limit: int) -> List[str]:
+    """
+    Returns up to `limit` lines, of the sorted lines, that begin with the
+    prefix.  The bisection is over the byte offsets; `lo` is always the start
+    of a line, and each probe compares the line containing the midpoint.
+    """
+    lo, hi = 0, len(lines)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        start = lines.rfind(b"\n", lo, mid) + 1 or lo
+        end = lines.find(b"\n", start)
+        end = len(lines) if end < 0 else end
+        if lines[start:end] < prefix:
+            lo = end + 1
+        else:
+            hi = start
+
+    found = list()
+    while lo < len(lines) and len(found) < limit:
+        end = lines.find(b"\n", lo)
+        end = len(lines) if end < 0 else end
+        line = lines[lo:end]
+        if not line.startswith(prefix):
+            break
+        found.append(line.decode())
+        lo = end + 1
+
+    return found
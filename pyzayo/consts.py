@@ -3,6 +3,7 @@ This file contains _constants_ used by this package.
 """
 
 from enum import Enum
+from os import getenv, path
 
 # Environment variables
 
@@ -23,10 +24,53 @@ ZAYO_SM_ROUTE_MTC_NOTIFS_BY_CASE = "maintenance-cases/{case_num}/notifications"
 ZAYO_SM_ROUTE_MTC_NOTIFS_BY_NAME = "maintenance-cases/notifications/{name}"
 ZAYO_SM_ROUTE_SERVICES = "existing-services"
 
+# The access token lifetime, in seconds, when the authentication response does
+# not provide "expires_in"; the token is refreshed this margin, in seconds,
+# ahead of its expiry.  See pyzayo.auth.TokenAuth
+AUTH_TOKEN_LIFETIME = 3600
+AUTH_REFRESH_MARGIN = 60
 
-# The Zayo API has a maximum "top" count of 50 records
+
+# The page size, the paging "top" count, accepted by every Zayo API route.
+# Larger page sizes are probed, largest first, and used on the routes that
+# accept them; see pyzayo.paging.PageSizer
 MAX_TOP_COUNT = 50
 MAX_PAGED_RECORDS = 100
+PAGE_SIZE_CANDIDATES = (1000, 500, 250, 100)
+
+# The number of the latest cases requested by each poll of the case watch; see
+# ZayoClient.watch_cases
+WATCH_HEAD_COUNT = 10
+
+# The default number of pages requested ahead of the page being consumed when
+# the records are paged, bounding the pages held in memory; see the
+# ZayoClientBase page_buffer parameter
+PAGE_PREFETCH_COUNT = 4
+
+# The number of cases whose notifications are fetched concurrently when
+# retrieving the notification details of many cases.
+MAX_CONCURRENT_CASES = 8
+
+# Local directory used for the data files maintained by this package, such as
+# the SQLite mirror database.  The location can be set via the environment.
+ZAYO_CACHE_DIR = path.expanduser(getenv("PYZAYO_CACHE_DIR", "~/.cache/pyzayo"))
+ZAYO_MIRROR_DB = path.join(ZAYO_CACHE_DIR, "mirror.db")
+
+# Local directory of the shell completion index: the sorted case numbers,
+# notification names, and circuit IDs seen by the client; see pyzayo.completion
+ZAYO_COMPLETION_DIR = path.join(ZAYO_CACHE_DIR, "completion")
+
+# When set, other than "0", the library calls are profiled and the report is
+# written to stderr at exit; the optional cProfile statistics file is written
+# as well.  See pyzayo.profiling
+ZAYO_PROFILE = getenv("PYZAYO_PROFILE", "")
+ZAYO_PROFILE_OUTPUT = getenv("PYZAYO_PROFILE_OUTPUT")
+
+# The INI file of the account credentials used by the multi-account client
+# pool; one section per account name, see pyzayo.pool.load_accounts
+ZAYO_ACCOUNTS_FILE = path.expanduser(
+    getenv("PYZAYO_ACCOUNTS_FILE", "~/.config/pyzayo/accounts.ini")
+)
 
 
 # -----------------------------------------------------------------------------
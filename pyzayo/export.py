@@ -0,0 +1,321 @@
+"""
+This module contains the streaming exporters used to write the Zayo service
+inventory, maintenance case, and maintenance impact records into flat,
+fixed-schema files: CSV, JSONL, or Parquet.
+
+The exporters consume records page-by-page, as provided by
+`ZayoClientBase.iter_pages`, and write each page as it arrives so that memory
+use is independent of the total number of records.
+
+Notes
+-----
+Parquet output requires the optional `pyarrow` package.
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, List, Iterable, Callable, Tuple, Optional, TextIO
+from abc import ABC, abstractmethod
+import csv
+import json
+import sys
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "SERVICE_FIELDS",
+    "CASE_FIELDS",
+    "IMPACT_FIELDS",
+    "EXPORT_FORMATS",
+    "flatten_service",
+    "flatten_case",
+    "flatten_impact",
+    "flatten_tagged",
+    "make_writer",
+    "export_pages",
+]
+
+
+# -----------------------------------------------------------------------------
+#
+#                               RECORD SCHEMAS
+#
+# -----------------------------------------------------------------------------
+
+# Each schema is a tuple of (column-name, API-field) pairs.  The column names
+# match the field names used by the pyzayo.mtc_models where one exists.
+
+CASE_SCHEMA: Tuple[Tuple[str, str], ...] = (
+    ("case_id", "caseId"),
+    ("case_num", "caseNumber"),
+    ("urgency", "urgency"),
+    ("impact", "levelOfImpact"),
+    ("status", "status"),
+    ("primary_date", "primaryDate"),
+    ("primary_date_2", "x2ndPrimaryDate"),
+    ("primary_date_3", "x3rdPrimaryDate"),
+    ("from_time", "fromTime"),
+    ("to_time", "toTime"),
+    ("reason", "reasonForMaintenance"),
+    ("location", "location"),
+    ("longitude", "longitiude"),
+    ("latitude", "latittude"),
+)
+
+IMPACT_SCHEMA: Tuple[Tuple[str, str], ...] = (
+    ("case_num", "caseNumber"),
+    ("circuit_id", "circuitId"),
+    ("impact", "expectedImpact"),
+    ("clli_a", "aLocationClli"),
+    ("clli_z", "zLocationClli"),
+)
+
+CASE_FIELDS = tuple(col for col, _ in CASE_SCHEMA)
+IMPACT_FIELDS = tuple(col for col, _ in IMPACT_SCHEMA)
+
+# The service inventory records are nested; the first component provides the
+# circuit and the first two component locations provide the A and Z ends.
+
+SERVICE_LOCATION_SCHEMA: Tuple[Tuple[str, str], ...] = (
+    ("name", "name"),
+    ("city", "city"),
+    ("state", "state"),
+    ("postal_code", "postalCode"),
+    ("clli", "clli"),
+)
+
+SERVICE_FIELDS = (
+    "service_name",
+    "status",
+    "product_group",
+    "product_category",
+    "product",
+    "term",
+    "circuit_id",
+    "bandwidth",
+    *(f"a_{col}" for col, _ in SERVICE_LOCATION_SCHEMA),
+    *(f"z_{col}" for col, _ in SERVICE_LOCATION_SCHEMA),
+)
+
+
+def flatten_case(rec: Dict) -> Dict:
+    """ flatten a maintenance-cases API record into the CASE_FIELDS schema """
+    return {col: rec.get(field) for col, field in CASE_SCHEMA}
+
+
+def flatten_impact(rec: Dict) -> Dict:
+    """ flatten a maintenance-impacts API record into the IMPACT_FIELDS schema """
+    return {col: rec.get(field) for col, field in IMPACT_SCHEMA}
+
+
+def flatten_service(rec: Dict) -> Dict:
+    """ flatten an existing-services API record into the SERVICE_FIELDS schema """
+    comps = (rec.get("components") or [{}])[0]
+    locs = comps.get("locations") or []
+    loc_a = locs[0] if len(locs) > 0 else {}
+    loc_z = locs[1] if len(locs) > 1 else {}
+
+    row = {
+        "service_name": rec.get("serviceName"),
+        "status": rec.get("status"),
+        "product_group": rec.get("productGroup"),
+        "product_category": rec.get("productCategory"),
+        "product": rec.get("product"),
+        "term": rec.get("term"),
+        "circuit_id": comps.get("circuitId"),
+        "bandwidth": comps.get("bandwidth"),
+    }
+
+    for end, loc in (("a", loc_a), ("z", loc_z)):
+        for col, field in SERVICE_LOCATION_SCHEMA:
+            row[f"{end}_{col}"] = loc.get(field)
+
+    return row
+
+
+def flatten_tagged(
+    flatten: Callable[[Dict], Dict], fields: Iterable[str], key: str
+) -> Tuple[Callable[[Dict], Dict], List[str]]:
+    """
+    Returns the flatten function and fields that also keep the record `key`
+    value, for example the account tag of the multi-account pool records.
+    """
+
+    def flatten_with_key(rec: Dict) -> Dict:
+        """ flatten the record and keep the key value """
+        row = flatten(rec)
+        row[key] = rec.get(key)
+        return row
+
+    return flatten_with_key, [key, *fields]
+
+
+# -----------------------------------------------------------------------------
+#
+#                               FILE WRITERS
+#
+# -----------------------------------------------------------------------------
+
+
+class TextFileWriter(ABC):
+    """ Base class for the text format writers; "-" designates stdout """
+
+    def __init__(self, filepath: str, fields: Iterable[str]):
+        """ open the output file """
+        self._fields = list(fields)
+        self._ofile: TextIO = (
+            sys.stdout if filepath == "-" else open(filepath, "w", newline="")
+        )
+
+    @abstractmethod
+    def write_rows(self, rows: List[Dict]):
+        """ write a batch of rows """
+
+    def close(self):
+        """ flush any buffered output and close the file """
+        self._ofile.flush()
+        if self._ofile is not sys.stdout:
+            self._ofile.close()
+
+
+class CsvWriter(TextFileWriter):
+    """ Writes flattened rows into a CSV file with a header row """
+
+    def __init__(self, filepath: str, fields: Iterable[str]):
+        """ open the output file and write the CSV header """
+        super().__init__(filepath, fields)
+        self._writer = csv.DictWriter(self._ofile, fieldnames=self._fields)
+        self._writer.writeheader()
+
+    def write_rows(self, rows: List[Dict]):
+        """ write a batch of rows """
+        self._writer.writerows(rows)
+
+
+class JsonlWriter(TextFileWriter):
+    """ Writes flattened rows as one JSON object per line """
+
+    def write_rows(self, rows: List[Dict]):
+        """ write a batch of rows """
+        self._ofile.writelines(json.dumps(row, default=str) + "\n" for row in rows)
+
+
+class ParquetWriter(object):
+    """ Writes flattened rows into a Parquet file, one row-group per batch """
+
+    def __init__(self, filepath: str, fields: Iterable[str]):
+        """ open the Parquet file using an all-string schema """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+        except ImportError:
+            raise RuntimeError("Parquet export requires the pyarrow package")
+
+        self._pa = pa
+        self._fields = list(fields)
+        self._schema = pa.schema([(field, pa.string()) for field in self._fields])
+        self._writer = pq.ParquetWriter(filepath, self._schema)
+
+    def write_rows(self, rows: List[Dict]):
+        """ write a batch of rows as a row-group """
+        if not rows:
+            return
+
+        columns = {
+            field: [None if row[field] is None else str(row[field]) for row in rows]
+            for field in self._fields
+        }
+        self._writer.write_table(
+            self._pa.Table.from_pydict(columns, schema=self._schema)
+        )
+
+    def close(self):
+        """ write the Parquet footer and close the file """
+        self._writer.close()
+
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+
+
+def make_writer(fmt: str, filepath: str, fields: Iterable[str]):
+    """
+    Create a writer instance for the given format.
+
+    Parameters
+    ----------
+    fmt: str
+        One of EXPORT_FORMATS
+
+    filepath: str
+        The output file path; "-" designates stdout for the text formats.
+
+    fields: Iterable[str]
+        The schema column names
+
+    Returns
+    -------
+    The writer instance, providing `write_rows` and `close` methods.
+    """
+    if fmt == "parquet" and filepath == "-":
+        raise ValueError("Parquet export requires an output file")
+
+    writer_cls = {"csv": CsvWriter, "jsonl": JsonlWriter, "parquet": ParquetWriter}
+    if fmt not in writer_cls:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    return writer_cls[fmt](filepath, fields)
+
+
+def export_pages(
+    pages: Iterable[List[Dict]],
+    flatten: Callable[[Dict], Dict],
+    fields: Iterable[str],
+    fmt: str,
+    filepath: str,
+    on_page: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Flatten and write each page of records as it arrives.
+
+    Parameters
+    ----------
+    pages: Iterable[List[Dict]]
+        The pages of API records, for example from `ZayoClientBase.iter_pages`.
+
+    flatten: Callable
+        One of the flatten_* functions matching the records.
+
+    fields: Iterable[str]
+        The schema column names matching the `flatten` function.
+
+    fmt: str
+        One of EXPORT_FORMATS
+
+    filepath: str
+        The output file path; "-" designates stdout for the text formats.
+
+    on_page: Callable, optional
+        Called with the number of records written after each page.
+
+    Returns
+    -------
+    The total number of records written.
+    """
+    writer = make_writer(fmt, filepath, fields)
+    count = 0
+
+    try:
+        for page in pages:
+            writer.write_rows([flatten(rec) for rec in page])
+            count += len(page)
+            if on_page:
+                on_page(len(page))
+    finally:
+        writer.close()
+
+    return count
@@ -0,0 +1,138 @@
+"""
+This module contains the minimal HTTP/1.1 request reading and response writing
+shared by the local asyncio servers of this package: the caching proxy of the
+"serve" command, see `pyzayo.proxy`, and the mock Zayo API server of the load
+test, see `pyzayo.loadtest`.
+
+Only what those servers require is supported: requests with a Content-Length
+body, keep-alive connections, and responses with a complete body.
+
+Examples
+--------
+    async def handle_connection(reader, writer):
+        request = await read_request(reader)
+        if request is not None:
+            method, target, headers, body = request
+            write_response(writer, (200, "application/json", b"{}"))
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle_connection, port=8080, limit=MAX_LINE)
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, Optional, Tuple
+from http import HTTPStatus
+import asyncio
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "BadRequest",
+    "Request",
+    "Response",
+    "MAX_LINE",
+    "MAX_BODY",
+    "read_request",
+    "write_response",
+]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# The maximum size of a request header line, used as the stream reader limit
+# of the server, and of a request body.
+MAX_LINE = 16 * 1024
+MAX_BODY = 1024 * 1024
+
+# A request: (method, target, headers, body); the header names are lowercase.
+Request = Tuple[str, str, Dict[str, str], bytes]
+
+# A response: (status code, content-type, content)
+Response = Tuple[int, str, bytes]
+
+
+class BadRequest(Exception):
+    """ The client request cannot be parsed """
+
+    pass
+
+
+async def read_request(
+    reader: asyncio.StreamReader, max_body: Optional[int] = MAX_BODY
+) -> Optional[Request]:
+    """
+    Returns the next request of the connection: (method, target, headers,
+    body); or None when the connection is closed by the client.
+
+    Raises
+    ------
+    BadRequest
+        When the request is malformed, or exceeds the size limits.
+    """
+    try:
+        line = await reader.readline()
+        if not line:
+            return None
+
+        try:
+            method, target, _version = line.decode("latin-1").split()
+        except ValueError:
+            raise BadRequest("Invalid request line")
+
+        headers = dict()
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    except ValueError:
+        # the line exceeds the stream reader limit.
+        raise BadRequest("Request header too large")
+
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise BadRequest("Invalid Content-Length")
+
+    if length > max_body:
+        raise BadRequest("Request body too large")
+
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, headers, body
+
+
+def _reason(status: int) -> str:
+    """ returns the HTTP reason phrase of the status code """
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return "Unknown"
+
+
+def write_response(
+    writer: asyncio.StreamWriter,
+    response: Response,
+    headers: Optional[Dict[str, str]] = None,
+    keep_alive: Optional[bool] = False,
+):
+    """ write the HTTP/1.1 response, with any additional `headers` """
+    status, content_type, content = response
+    lines = [
+        f"HTTP/1.1 {status} {_reason(status)}",
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(content)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + content)
@@ -0,0 +1,749 @@
+"""
+This module contains the load-test tool used to size the client worker pools
+and rate limits before more consumers use the Zayo API.
+
+A local mock Zayo API server, with synthetic maintenance and service records,
+enforces the configured rate limits, responding "429 Too Many Requests" when
+exceeded, and the configured response latency.  Many simulated consumers,
+each a ZayoClient in its own thread, run a weighted mix of the operations:
+
+    * cases: get_cases()
+    * details: get_case_details(case_num)
+    * impacts: get_impacts(by_circuit_id=circuit_id)
+    * services: get_services()
+
+An operation throttled by the server, "429 Too Many Requests" for any of its
+requests, is counted as throttled; one that fails, or that returns other than
+the number of dataset records expected, is counted as an error.  The report
+includes the achieved operation and request throughput, the error and
+throttle rates, and the latency percentiles of each operation.
+
+Examples
+--------
+    python -m pyzayo.loadtest --clients 20 --duration 60 --rate 50
+
+    python -m pyzayo.loadtest --clients 50 --client-rate 2 --mix cases=1,details=4
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, List, Optional, Tuple, NamedTuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import urlsplit
+import asyncio
+import random
+import json
+import time
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import click
+import httpx
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo import consts
+from pyzayo.client import ZayoClient
+from pyzayo.circuit_id import format_circuit_id
+from pyzayo.loop_thread import LoopThread
+from pyzayo.httpserver import BadRequest, MAX_LINE, read_request, write_response
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "MockZayoServer",
+    "LoadTest",
+    "LoadTestResult",
+    "LOADTEST_MIX",
+    "make_dataset",
+    "main",
+]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# The default operation mix: the relative weight of each operation.
+LOADTEST_MIX = {"cases": 3, "details": 3, "impacts": 3, "services": 1}
+
+# The percentiles of the operation latencies in the report.
+LOADTEST_PERCENTILES = (50, 90, 99)
+
+_AUTH_PATH = "/oauth/token"
+_API_BASE_PATH = urlsplit(consts.ZAYO_URL_SM).path
+
+
+def make_dataset(n_cases: int, seed: Optional[int] = 1) -> Dict[str, List[Dict]]:
+    """
+    Returns the synthetic records, in API dict form, of the mock server:
+    "cases", "impacts" (three per case), "services" (two per case), and
+    "notifications" (two per case, with the email body).
+    """
+    rnd = random.Random(seed)
+    circuit_ids = [
+        format_circuit_id(f"/OGYX/{100000 + num}/001/ZYO/")
+        for num in range(2 * n_cases)
+    ]
+    clli_codes = ["DNVRCO01", "CHCGIL02", "NYCMNY01", "DLLSTX03", "LSANCA01"]
+    location = {
+        "name": "DC",
+        "city": "Denver",
+        "state": "CO",
+        "postalCode": "80202",
+        "clli": "DNVRCO01",
+    }
+
+    cases, impacts, notifications = list(), list(), list()
+    for num in range(n_cases):
+        case_num = f"TTN-{3000000000 + num:010d}"
+        cases.append(
+            {
+                "caseId": f"case-{num}",
+                "caseNumber": case_num,
+                "urgency": rnd.choice([opt.value for opt in consts.CaseUrgencyOptions]),
+                "levelOfImpact": consts.CaseImpactOptions.svc_aff.value,
+                "status": rnd.choice([opt.value for opt in consts.CaseStatusOptions]),
+                "primaryDate": f"2026-{num % 12 + 1:02d}-{num % 28 + 1:02d}",
+                "x2ndPrimaryDate": None,
+                "x3rdPrimaryDate": None,
+                "fromTime": "22:00:00",
+                "toTime": "04:00:00",
+                "reasonForMaintenance": "fiber maintenance",
+                "location": "Denver, CO",
+                "longitiude": None,
+                "latittude": None,
+                "productGroup": "Wavelengths",
+                "lastModifiedDate": "2026-01-01T00:00:00Z",
+            }
+        )
+        impacts.extend(
+            {
+                "caseNumber": case_num,
+                "circuitId": rnd.choice(circuit_ids),
+                "expectedImpact": "Hard Down",
+                "aLocationClli": rnd.choice(clli_codes),
+                "zLocationClli": rnd.choice(clli_codes),
+            }
+            for _ in range(3)
+        )
+        notifications.extend(
+            {
+                "name": f"MNN-{3000000000 + num:010d}-{seq}",
+                "caseNumber": case_num,
+                "notificationType": "Scheduled",
+                "lastModifiedDate": "2026-01-01T00:00:00Z",
+                "subject": f"Zayo maintenance {case_num}",
+                "toEmailList": "noc@example.com",
+                "emailBody": "<html>" + "maintenance notice " * 100 + "</html>",
+            }
+            for seq in range(2)
+        )
+
+    services = [
+        {
+            "serviceName": f"service-{num}",
+            "status": "Active",
+            "productGroup": "Wavelengths",
+            "productCategory": "Waves",
+            "product": "Wavelength",
+            "term": "36",
+            "components": [
+                {
+                    "circuitId": circuit_id,
+                    "bandwidth": "10 Gbps",
+                    "locations": [location, location],
+                }
+            ],
+        }
+        for num, circuit_id in enumerate(circuit_ids)
+    ]
+
+    return dict(
+        cases=cases, impacts=impacts, services=services, notifications=notifications
+    )
+
+
+class _RateLimit(object):
+    """ Non-blocking token bucket: a request is either allowed or throttled """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """ create the bucket full of tokens """
+        self.rate = rate
+        self.burst = burst or max(1, int(-(-rate // 1)))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def allow(self) -> bool:
+        """ True, consuming a token, if a token is available """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class MockZayoServer(object):
+    """
+    Local mock of the Zayo API, and its authentication, for load tests.
+
+    Parameters
+    ----------
+    dataset: Dict[str, List[Dict]]
+        The records served, see `make_dataset`.
+
+    rate: float, optional
+        The maximum number of requests per second of all clients.
+
+    client_rate: float, optional
+        The maximum number of requests per second of each access token.
+
+    latency: float
+        The minimum response latency, in seconds.
+
+    jitter: float
+        The maximum random latency added to each response, in seconds.
+
+    max_top: int
+        The largest paging "top" count accepted; larger counts are rejected
+        with "400 Bad Request", as by the Zayo API.
+    """
+
+    def __init__(
+        self,
+        dataset: Dict[str, List[Dict]],
+        rate: Optional[float] = None,
+        client_rate: Optional[float] = None,
+        latency: Optional[float] = 0.05,
+        jitter: Optional[float] = 0.02,
+        max_top: Optional[int] = 100,
+    ):
+        """ index the dataset; call `start` to begin serving """
+        self.latency = latency
+        self.jitter = jitter
+        self.max_top = max_top
+        self.url: Optional[str] = None
+        self.stats = {"requests": 0, "throttled": 0, "rejected": 0, "auth": 0}
+
+        self._records = {
+            consts.ZAYO_SM_ROUTE_MTC_CASES: dataset["cases"],
+            consts.ZAYO_SM_ROUTE_MTC_IMPACTS: dataset["impacts"],
+            consts.ZAYO_SM_ROUTE_SERVICES: dataset["services"],
+        }
+        self._notifs_by_case = defaultdict(list)
+        self._notifs_by_name = dict()
+        for notif in dataset["notifications"]:
+            self._notifs_by_case[notif["caseNumber"]].append({"name": notif["name"]})
+            self._notifs_by_name[notif["name"]] = notif
+
+        self._rate_limit = _RateLimit(rate) if rate else None
+        self._client_rate = client_rate
+        self._client_limits: Dict[str, _RateLimit] = dict()
+        self._loop_thread: Optional[LoopThread] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def base_url(self) -> str:
+        """ the Zayo API base URL of the server """
+        return self.url + _API_BASE_PATH
+
+    @property
+    def auth_url(self) -> str:
+        """ the authentication URL of the server """
+        return self.url + _AUTH_PATH
+
+    def start(self, host: Optional[str] = "127.0.0.1", port: Optional[int] = 0):
+        """ start serving in a background loop thread; port 0 for any port """
+        self._loop_thread = LoopThread(name="pyzayo-mock-server")
+        self._server = self._loop_thread.run(
+            asyncio.start_server(self._handle_connection, host, port, limit=MAX_LINE)
+        )
+        host, port = self._server.sockets[0].getsockname()[:2]
+        self.url = f"http://{host}:{port}"
+
+    def stop(self):
+        """ stop serving """
+        if self._server:
+            self._server.close()
+            self._loop_thread.run(self._server.wait_closed())
+            self._loop_thread.close()
+            self._loop_thread = None
+            self._server = None
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        """ serve the HTTP/1.1 requests of a client connection """
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except BadRequest:
+                    break
+
+                if request is None:
+                    break
+
+                method, target, headers, body = request
+                status, content, extra = await self.handle(
+                    method, target, headers, body
+                )
+                write_response(
+                    writer,
+                    (status, "application/json", json.dumps(content).encode()),
+                    extra,
+                    keep_alive=True,
+                )
+                await writer.drain()
+
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+
+        finally:
+            writer.close()
+
+    async def handle(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[int, Dict, Dict[str, str]]:
+        """ returns the response status, JSON content, and extra headers """
+        self.stats["requests"] += 1
+        path = urlsplit(target).path
+
+        if path == _AUTH_PATH:
+            self.stats["auth"] += 1
+            token = f"token-{self.stats['auth']}"
+            return HTTPStatus.OK, {"access_token": token, "expires_in": 3600}, {}
+
+        token = headers.get("authorization", "")
+        limits = [self._rate_limit] if self._rate_limit else []
+        if self._client_rate:
+            limits.append(
+                self._client_limits.setdefault(token, _RateLimit(self._client_rate))
+            )
+
+        if not all(limit.allow() for limit in limits):
+            self.stats["throttled"] += 1
+            return (
+                HTTPStatus.TOO_MANY_REQUESTS,
+                {"error": "Too Many Requests"},
+                {"Retry-After": "1"},
+            )
+
+        await asyncio.sleep(self.latency + random.uniform(0, self.jitter))
+
+        route = path[len(_API_BASE_PATH) :] if path.startswith(_API_BASE_PATH) else ""
+        status, content = self._route(method, route, body)
+        if status != HTTPStatus.OK:
+            self.stats["rejected"] += 1
+        return status, content, {}
+
+    def _route(self, method: str, route: str, body: bytes) -> Tuple[int, Dict]:
+        """ returns the response status and JSON content of the API route """
+        if method == "POST" and route in self._records:
+            payload = json.loads(body or b"{}")
+            paging = payload.get("paging") or {}
+            top, skip = paging.get("top", consts.MAX_TOP_COUNT), paging.get("skip", 0)
+            if top > self.max_top:
+                return HTTPStatus.BAD_REQUEST, {"error": f"top exceeds {self.max_top}"}
+
+            recs = self._records[route]
+            for field, value in (payload.get("filter") or {}).items():
+                recs = [rec for rec in recs if rec.get(field) == value]
+
+            return HTTPStatus.OK, {
+                "data": {
+                    "metadata": {"totalRecordCount": len(recs)},
+                    "records": recs[skip : skip + top],
+                }
+            }
+
+        parts = route.split("/")
+        if method == "GET" and len(parts) == 3 and parts[0] == "maintenance-cases":
+            if parts[2] == "notifications":
+                return HTTPStatus.OK, {"data": self._notifs_by_case.get(parts[1], [])}
+            if parts[1] == "notifications" and parts[2] in self._notifs_by_name:
+                return HTTPStatus.OK, {"data": self._notifs_by_name[parts[2]]}
+
+        return HTTPStatus.NOT_FOUND, {"error": f"Unknown route: {route}"}
+
+
+class _OpResult(NamedTuple):
+    """ The outcome of an operation: "ok", "throttled", or "error" """
+
+    op: str
+    seconds: float
+    outcome: str
+
+
+class LoadTestResult(object):
+    """ The operation outcomes of a load test, and the server statistics """
+
+    def __init__(
+        self, clients: int, duration: float, results: List[_OpResult], server_stats
+    ):
+        """ the results of the completed load test """
+        self.clients = clients
+        self.duration = duration
+        self.results = results
+        self.server_stats = dict(server_stats)
+
+    def summary(self) -> Dict:
+        """ returns the throughput, error and throttle rates, and percentiles """
+        by_op = defaultdict(list)
+        for result in self.results:
+            by_op[result.op].append(result)
+            by_op["all"].append(result)
+
+        requests = self.server_stats["requests"] - self.server_stats["auth"]
+        return {
+            "clients": self.clients,
+            "duration": round(self.duration, 3),
+            "requests": requests,
+            "requests_per_sec": round(requests / self.duration, 2),
+            "throttle_rate": round(self.server_stats["throttled"] / (requests or 1), 4),
+            "operations": {
+                op: _op_summary(results, self.duration)
+                for op, results in sorted(by_op.items())
+            },
+        }
+
+    def report(self) -> str:
+        """ returns the summary as text """
+        summary = self.summary()
+        lines = [
+            f"Load test: {summary['clients']} clients, {summary['duration']}s",
+            f"requests: {summary['requests']} ({summary['requests_per_sec']}/s), "
+            f"throttled (429): {summary['throttle_rate']:.2%}",
+            "",
+            f"{'operation':<10}{'count':>8}{'ops/s':>9}{'errors':>9}{'throttled':>11}"
+            + "".join(f"{'p' + str(pct) + ' ms':>10}" for pct in LOADTEST_PERCENTILES)
+            + f"{'max ms':>10}",
+        ]
+        for op, stats in summary["operations"].items():
+            lines.append(
+                f"{op:<10}{stats['count']:>8}{stats['ops_per_sec']:>9}"
+                f"{stats['error_rate']:>9.2%}{stats['throttle_rate']:>11.2%}"
+                + "".join(
+                    f"{stats['p' + str(pct)] * 1e3:>10.1f}"
+                    for pct in LOADTEST_PERCENTILES
+                )
+                + f"{stats['max'] * 1e3:>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+class LoadTest(object):
+    """
+    Runs the simulated consumers against the Zayo API at the URLs.
+
+    Parameters
+    ----------
+    base_url: str
+        The Zayo API base URL, for example `MockZayoServer.base_url`.
+
+    auth_url: str
+        The Zayo API authentication URL.
+
+    case_nums: List[str]
+        The case numbers used by the "details" operations.
+
+    circuit_ids: List[str]
+        The circuit IDs used by the "impacts" operations.
+
+    clients: int
+        The number of concurrent consumers, each with its own client.
+
+    duration: float
+        The number of seconds the consumers run operations.
+
+    mix: Dict[str, float], optional
+        The relative weight of each operation, LOADTEST_MIX by default.
+
+    client_rate: float, optional
+        The client `rate_limit` of each consumer, unlimited by default.
+
+    seed: int, optional
+        The random seed of the operation choices.
+
+    dataset: Dict[str, List[Dict]], optional
+        The records served, see `make_dataset`; when provided, an operation
+        that returns other than the number of records expected is an error.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        auth_url: str,
+        case_nums: List[str],
+        circuit_ids: List[str],
+        clients: Optional[int] = 10,
+        duration: Optional[float] = 30.0,
+        mix: Optional[Dict[str, float]] = None,
+        client_rate: Optional[float] = None,
+        seed: Optional[int] = 1,
+        dataset: Optional[Dict[str, List[Dict]]] = None,
+    ):
+        """ configure the load test; call `run` to run it """
+        self.base_url = base_url
+        self.auth_url = auth_url
+        self.case_nums = case_nums
+        self.circuit_ids = circuit_ids
+        self.clients = clients
+        self.duration = duration
+        self.mix = mix or LOADTEST_MIX
+        self.client_rate = client_rate
+        self.seed = seed
+        self._expected = _expected_counts(dataset) if dataset else None
+
+        unknown = set(self.mix) - set(LOADTEST_MIX)
+        if unknown:
+            raise ValueError(f"Unknown operations: {', '.join(sorted(unknown))}")
+
+    def run(self, server_stats: Optional[Dict] = None) -> LoadTestResult:
+        """
+        Run the consumers concurrently until the duration has elapsed and
+        return the result.  The `server_stats`, if provided, is the mock
+        server statistics dictionary; its counts during the run are reported.
+        """
+        before = dict(server_stats or {})
+        start = time.monotonic()
+        deadline = start + self.duration
+
+        with ThreadPoolExecutor(max_workers=self.clients) as pool:
+            per_client = list(
+                pool.map(lambda num: self._consume(num, deadline), range(self.clients))
+            )
+
+        elapsed = time.monotonic() - start
+        stats = {
+            key: value - before.get(key, 0)
+            for key, value in (server_stats or {}).items()
+        }
+        stats.setdefault("requests", 0)
+        stats.setdefault("auth", 0)
+        stats.setdefault("throttled", 0)
+
+        results = [result for results in per_client for result in results]
+        return LoadTestResult(self.clients, elapsed, results, stats)
+
+    def _consume(self, num: int, deadline: float) -> List[_OpResult]:
+        """ the consumer thread: run the operation mix until the deadline """
+        rnd = random.Random(self.seed + num)
+        ops, weights = zip(*self.mix.items())
+        results = list()
+
+        client = ZayoClient(
+            base_url=self.base_url,
+            auth_url=self.auth_url,
+            credentials={"client_id": f"loadtest-{num}", "client_secret": "-"},
+            rate_limit=self.client_rate,
+        )
+
+        try:
+            while time.monotonic() < deadline:
+                op = rnd.choices(ops, weights)[0]
+                start = time.perf_counter()
+                try:
+                    key, count = self._run_op(client, op, rnd)
+                    outcome = "ok" if self._is_expected(op, key, count) else "error"
+                    retry_after = 0.0
+                except httpx.HTTPStatusError as exc:
+                    outcome, retry_after = "error", 0.0
+                    if exc.response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                        outcome = "throttled"
+                        retry_after = float(exc.response.headers.get("retry-after", 1))
+                except Exception:  # noqa
+                    outcome, retry_after = "error", 0.0
+
+                results.append(_OpResult(op, time.perf_counter() - start, outcome))
+
+                # a throttled consumer waits as directed by the server.
+                time.sleep(min(retry_after, max(0.0, deadline - time.monotonic())))
+        finally:
+            client.close()
+
+        return results
+
+    def _run_op(
+        self, client: ZayoClient, op: str, rnd: random.Random
+    ) -> Tuple[Optional[str], int]:
+        """ run the operation; returns its key and the number of records received """
+        if op == "cases":
+            return None, len(client.get_cases())
+
+        if op == "details":
+            case_num = rnd.choice(self.case_nums)
+            case, impacts, notifs = client.get_case_details(by_case_num=case_num)
+            return case_num, (1 + len(impacts) + len(notifs)) if case else 0
+
+        if op == "impacts":
+            circuit_id = rnd.choice(self.circuit_ids)
+            return circuit_id, len(client.get_impacts(by_circuit_id=circuit_id))
+
+        return None, len(client.get_services())
+
+    def _is_expected(self, op: str, key: Optional[str], count: int) -> bool:
+        """ True if the operation received the number of dataset records expected """
+        if self._expected is None:
+            return True
+        return self._expected.get((op, key), 0) == count
+
+
+# -----------------------------------------------------------------------------
+#
+#                               MODULE FUNCTIONS
+#
+# -----------------------------------------------------------------------------
+
+
+def _expected_counts(dataset: Dict[str, List[Dict]]) -> Dict[Tuple, int]:
+    """
+    Returns the number of records expected of each operation, by the operation
+    and its key: the case number of "details", the circuit ID of "impacts".
+    """
+    expected = defaultdict(int)
+    expected["cases", None] = len(dataset["cases"])
+    expected["services", None] = len(dataset["services"])
+
+    for rec in dataset["cases"]:
+        expected["details", rec["caseNumber"]] += 1
+    for rec in dataset["impacts"]:
+        expected["impacts", rec["circuitId"]] += 1
+        expected["details", rec["caseNumber"]] += 1
+    for rec in dataset["notifications"]:
+        expected["details", rec["caseNumber"]] += 1
+
+    return dict(expected)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """ returns the nearest-rank percentile of the sorted values """
+    if not values:
+        return 0.0
+    rank = max(1, -(-len(values) * pct // 100))
+    return values[int(rank) - 1]
+
+
+def _op_summary(results: List[_OpResult], duration: float) -> Dict:
+    """ returns the throughput, rates, and percentiles of the results """
+    count = len(results)
+    latencies = sorted(result.seconds for result in results)
+    outcomes = defaultdict(int)
+    for result in results:
+        outcomes[result.outcome] += 1
+
+    return {
+        "count": count,
+        "ops_per_sec": round(outcomes["ok"] / duration, 2),
+        "error_rate": round(outcomes["error"] / (count or 1), 4),
+        "throttle_rate": round(outcomes["throttled"] / (count or 1), 4),
+        **{
+            f"p{pct}": round(_percentile(latencies, pct), 6)
+            for pct in LOADTEST_PERCENTILES
+        },
+        "max": round(latencies[-1], 6) if latencies else 0.0,
+    }
+
+
+def _parse_mix(ctx, param, value: Optional[str]) -> Optional[Dict[str, float]]:
+    """ click callback that parses the "op=weight,..." operation mix """
+    if not value:
+        return None
+
+    try:
+        mix = {
+            op.strip(): float(weight)
+            for op, _, weight in (item.partition("=") for item in value.split(","))
+        }
+    except ValueError:
+        raise click.BadParameter("expected op=weight,... for example cases=3,details=1")
+
+    unknown = set(mix) - set(LOADTEST_MIX)
+    if unknown:
+        raise click.BadParameter(
+            f"unknown operations: {', '.join(sorted(unknown))}, "
+            f"expected {', '.join(LOADTEST_MIX)}"
+        )
+    return mix
+
+
+@click.command()
+@click.option("--clients", type=click.IntRange(min=1), default=10, show_default=True)
+@click.option(
+    "--duration", type=click.FloatRange(min=1), default=30.0, show_default=True
+)
+@click.option(
+    "--mix",
+    callback=_parse_mix,
+    help="operation weights, for example cases=3,details=3,impacts=3,services=1",
+)
+@click.option("--cases", "n_cases", default=500, show_default=True, help="mock cases")
+@click.option("--rate", type=float, help="server limit of requests/s, all clients")
+@click.option(
+    "--server-client-rate", type=float, help="server limit of requests/s, per client"
+)
+@click.option("--client-rate", type=float, help="client rate_limit of each consumer")
+@click.option("--latency", default=0.05, show_default=True, help="server latency, s")
+@click.option("--jitter", default=0.02, show_default=True, help="server jitter, s")
+@click.option("--max-top", default=100, show_default=True, help="server page limit")
+@click.option("--json", "as_json", is_flag=True, help="output the summary as JSON")
+def main(
+    clients,
+    duration,
+    mix,
+    n_cases,
+    rate,
+    server_client_rate,
+    client_rate,
+    latency,
+    jitter,
+    max_top,
+    as_json,
+):
+    """
+    Load-test the client with simulated consumers and a mock Zayo API server.
+    """
+    dataset = make_dataset(n_cases)
+    server = MockZayoServer(
+        dataset,
+        rate=rate,
+        client_rate=server_client_rate,
+        latency=latency,
+        jitter=jitter,
+        max_top=max_top,
+    )
+    server.start()
+
+    try:
+        result = LoadTest(
+            server.base_url,
+            server.auth_url,
+            case_nums=[rec["caseNumber"] for rec in dataset["cases"]],
+            circuit_ids=[rec["circuitId"] for rec in dataset["impacts"]],
+            clients=clients,
+            duration=duration,
+            mix=mix,
+            client_rate=client_rate,
+            dataset=dataset,
+        ).run(server_stats=server.stats)
+    finally:
+        server.stop()
+
+    click.echo(json.dumps(result.summary(), indent=2) if as_json else result.report())
+
+
+if __name__ == "__main__":
+    main()
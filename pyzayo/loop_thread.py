@@ -0,0 +1,106 @@
+"""
+This module contains the LoopThread class used by the synchronous Zayo client
+facade.  A LoopThread owns a single, long-lived asyncio event loop running in a
+background daemon thread.  Coroutines are submitted to that loop thread-safely,
+so that any number of caller threads can share the one loop and therefore the
+one `ZayoAPI` connection pool bound to it.
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Coroutine, Any, Optional
+from concurrent.futures import Future
+import asyncio
+import threading
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo import profiling
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["LoopThread"]
+
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class LoopThread(object):
+    """
+    Runs an asyncio event loop forever in a background daemon thread.  Use the
+    `run` method to execute a coroutine on the loop and block the calling thread
+    until the result is available, or `submit` to obtain a concurrent Future.
+    """
+
+    def __init__(self, name: Optional[str] = "pyzayo-loop"):
+        """ create the event loop and start the thread that runs it """
+        self.loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run_forever, name=name, daemon=True
+        )
+        self._thread.start()
+        self._started.wait()
+
+    def _run_forever(self):
+        """ thread target; runs the event loop until `close` is called """
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._started.set)
+        try:
+            with profiling.thread_profile(self.loop):
+                self.loop.run_forever()
+        finally:
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.close()
+
+    @property
+    def is_running(self) -> bool:
+        """ True if the loop thread is alive and accepting coroutines """
+        return self._thread.is_alive() and not self.loop.is_closed()
+
+    def in_loop_thread(self) -> bool:
+        """ True if the caller is executing in the loop thread """
+        return threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine) -> Future:
+        """
+        Schedule the coroutine on the loop and return a concurrent Future that
+        the caller can use to obtain the result.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine) -> Any:
+        """
+        Execute the coroutine on the loop, blocking the calling thread until
+        the result (or exception) is available.
+
+        Raises
+        ------
+        RuntimeError
+            When called from within the loop thread itself, since blocking
+            there would deadlock the loop.
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("LoopThread.run() called from within the loop thread")
+
+        return self.submit(coro).result()
+
+    def close(self):
+        """ stop the event loop and wait for the thread to exit """
+        if not self.is_running:
+            return
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        if not self.in_loop_thread():
+            self._thread.join()
@@ -0,0 +1,311 @@
+"""
+This module contains the ZayoMirror class used to mirror the maintenance
+cases, impacts, notifications, and service inventory into a local SQLite
+database.  The mirror tables use the flat schemas defined in `pyzayo.export`
+and are indexed on the fields commonly used in ad-hoc queries: circuit ID,
+case number, CLLI, status, and primary date.
+
+Examples
+--------
+    from pyzayo import ZayoClient
+    from pyzayo.mirror import ZayoMirror
+
+    mirror = ZayoMirror()
+    mirror.sync(ZayoClient())
+
+    mirror.query(
+        "SELECT c.case_num, i.circuit_id FROM cases c "
+        "JOIN impacts i USING (case_num) WHERE i.clli_a = ?",
+        ("DNVRCO01",)
+    )
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, List, Dict, Iterable, Sequence, Callable
+from datetime import datetime, timezone
+from pathlib import Path
+import sqlite3
+import os
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo import consts
+from pyzayo import export
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["ZayoMirror", "NOTIFICATION_FIELDS"]
+
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+NOTIFICATION_FIELDS = (
+    "name",
+    "case_num",
+    "type",
+    "date",
+    "subject",
+    "email_list",
+    "email_content",
+)
+
+
+def flatten_notification(case_num: str, rec: Dict) -> Dict:
+    """ flatten a notification details API record into the NOTIFICATION_FIELDS """
+    return {
+        "name": rec.get("name"),
+        "case_num": case_num,
+        "type": rec.get("notificationType"),
+        "date": rec.get("lastModifiedDate"),
+        "subject": rec.get("subject"),
+        "email_list": rec.get("toEmailList"),
+        "email_content": rec.get("emailBody"),
+    }
+
+
+# table name: (columns, primary-key column or None, indexed columns)
+MIRROR_TABLES = {
+    "cases": (
+        export.CASE_FIELDS,
+        "case_num",
+        ("status", "primary_date", "primary_date_2", "primary_date_3", "urgency"),
+    ),
+    "impacts": (
+        export.IMPACT_FIELDS,
+        None,
+        ("case_num", "circuit_id", "clli_a", "clli_z"),
+    ),
+    "notifications": (NOTIFICATION_FIELDS, "name", ("case_num", "date")),
+    "services": (
+        export.SERVICE_FIELDS,
+        None,
+        ("circuit_id", "status", "product_group", "a_clli", "z_clli"),
+    ),
+}
+
+
+class ZayoMirror(object):
+    """
+    Local SQLite database mirror of the Zayo maintenance and service
+    inventory records.
+
+    Parameters
+    ----------
+    dbpath: str, optional
+        The database file path, `consts.ZAYO_MIRROR_DB` by default.
+
+    read_only: bool, optional
+        When True the existing database is opened for queries only; it is
+        neither created nor modified.
+
+    Raises
+    ------
+    FileNotFoundError
+        When `read_only` and the database file does not exist.
+    """
+
+    def __init__(self, dbpath: Optional[str] = None, read_only: Optional[bool] = False):
+        """ open (or create) the mirror database """
+        self.dbpath = dbpath or consts.ZAYO_MIRROR_DB
+
+        if read_only:
+            if not os.path.isfile(self.dbpath):
+                raise FileNotFoundError(f"Mirror database not found: {self.dbpath}")
+            self.db = sqlite3.connect(
+                Path(self.dbpath).resolve().as_uri() + "?mode=ro", uri=True
+            )
+            self.db.row_factory = sqlite3.Row
+            return
+
+        if os.path.dirname(self.dbpath):
+            os.makedirs(os.path.dirname(self.dbpath), exist_ok=True)
+
+        self.db = sqlite3.connect(self.dbpath)
+        self.db.row_factory = sqlite3.Row
+        self._create_schema()
+
+    def __enter__(self):
+        """ context manager support; the database is closed on exit """
+        return self
+
+    def __exit__(self, *exc_info):
+        """ close the database on context manager exit """
+        self.close()
+
+    def close(self):
+        """ close the database connection """
+        self.db.close()
+
+    def _create_schema(self):
+        """ create the mirror tables and indexes if they do not exist """
+        with self.db:
+            for table, (columns, pkey, indexes) in MIRROR_TABLES.items():
+                col_defs = ", ".join(
+                    f"{col} TEXT PRIMARY KEY" if col == pkey else f"{col} TEXT"
+                    for col in columns
+                )
+                self.db.execute(f"CREATE TABLE IF NOT EXISTS {table} ({col_defs})")
+                for col in indexes:
+                    self.db.execute(
+                        f"CREATE INDEX IF NOT EXISTS {table}_{col} ON {table} ({col})"
+                    )
+
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS sync_status "
+                "(name TEXT PRIMARY KEY, synced_at TEXT, count INTEGER)"
+            )
+
+    # -------------------------------------------------------------------------
+    #                               SYNC METHODS
+    # -------------------------------------------------------------------------
+
+    def sync(
+        self,
+        client,
+        all_notifications: Optional[bool] = False,
+        on_progress: Optional[Callable[[str, int], None]] = None,
+    ) -> Dict[str, int]:
+        """
+        Replace the mirror contents with the current records from the API.
+
+        Parameters
+        ----------
+        client: ZayoClient
+            The client used to retrieve the records.
+
+        all_notifications: bool
+            When True the notification details of every case are mirrored.
+            By default only the cases that are not closed are used since each
+            case requires its own notification requests.
+
+        on_progress: Callable, optional
+            Called with (table-name, record-count) after each page is stored.
+
+        Returns
+        -------
+        Dictionary of table name to the number of records mirrored.
+        """
+        counts = dict()
+
+        counts["cases"] = self._sync_table(
+            "cases",
+            client.iter_case_pages(),
+            export.flatten_case,
+            on_progress,
+        )
+        counts["impacts"] = self._sync_table(
+            "impacts", client.iter_impact_pages(), export.flatten_impact, on_progress
+        )
+        counts["services"] = self._sync_table(
+            "services",
+            client.iter_service_pages(),
+            export.flatten_service,
+            on_progress,
+        )
+
+        case_nums = [
+            row["case_num"]
+            for row in self.db.execute(
+                "SELECT case_num FROM cases"
+                + ("" if all_notifications else " WHERE status != ?"),
+                () if all_notifications else (consts.CaseStatusOptions.closed.value,),
+            )
+        ]
+
+        notif_details = client.get_cases_notification_details(by_case_nums=case_nums)
+        counts["notifications"] = self._sync_table(
+            "notifications",
+            [
+                [flatten_notification(case_num, rec) for rec in recs]
+                for case_num, recs in notif_details.items()
+            ],
+            None,
+            on_progress,
+        )
+
+        return counts
+
+    def _sync_table(
+        self,
+        table: str,
+        pages: Iterable[List[Dict]],
+        flatten: Optional[Callable[[Dict], Dict]],
+        on_progress: Optional[Callable[[str, int], None]],
+    ) -> int:
+        """
+        Replace the contents of the table with the flattened records; the
+        replacement is done in a single transaction so that concurrent
+        readers see either the prior or the new contents.
+        """
+        columns = MIRROR_TABLES[table][0]
+        insert_sql = (
+            f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
+        )
+        count = 0
+
+        with self.db:
+            self.db.execute(f"DELETE FROM {table}")
+            for page in pages:
+                rows = map(flatten, page) if flatten else page
+                self.db.executemany(
+                    insert_sql,
+                    (
+                        tuple(_sql_value(row[col]) for col in columns)
+                        for row in rows
+                    ),
+                )
+                count += len(page)
+                if on_progress:
+                    on_progress(table, count)
+
+            self.db.execute(
+                "INSERT OR REPLACE INTO sync_status VALUES (?, ?, ?)",
+                (table, datetime.now(timezone.utc).isoformat(), count),
+            )
+
+        return count
+
+    # -------------------------------------------------------------------------
+    #                               QUERY METHODS
+    # -------------------------------------------------------------------------
+
+    def query(self, sql: str, params: Optional[Sequence] = ()) -> List[Dict]:
+        """
+        Execute the SQL statement against the mirror database.
+
+        Parameters
+        ----------
+        sql: str
+            The SQL statement; use "?" placeholders for `params`.
+
+        params: Sequence, optional
+            The statement parameter values.
+
+        Returns
+        -------
+        List of result rows in dict form.
+        """
+        return [dict(row) for row in self.db.execute(sql, params)]
+
+    def sync_status(self) -> List[Dict]:
+        """ returns the last sync time and record count of each table """
+        return self.query("SELECT * FROM sync_status ORDER BY name")
+
+
+def _sql_value(value):
+    """ store non-text values as text so comparisons are consistent """
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
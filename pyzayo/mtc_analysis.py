@@ -0,0 +1,219 @@
+"""
+This module contains the maintenance analysis functions used to answer the
+question: do scheduled maintenances impact redundant circuits at the same time?
+
+Each case is converted into its maintenance windows, one per primary date,
+from the case `from_time` to `to_time`.  The impacts of the cases are grouped,
+either by user defined circuit groups (the legs of a diverse path), or by the
+impact CLLI codes.  Within each group a sweep-line pass over the windows,
+sorted by start time, reports the overlapping windows of different cases on
+different circuits.  The cost is O(n log n + k) for n windows and k overlaps,
+rather than comparing every pair of windows.
+
+Examples
+--------
+    from pyzayo import ZayoClient
+    from pyzayo.mtc_analysis import find_conflicts, group_by_clli
+
+    zapi = ZayoClient()
+    cases = map(CaseRecord.parse_obj, zapi.get_cases())
+    impacts = map(ImpactRecord.parse_obj, zapi.get_impacts())
+
+    for conflict in find_conflicts(cases, impacts, group_by_clli):
+        print(conflict)
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, List, Iterable, Callable, NamedTuple, Optional
+from datetime import datetime, timedelta
+from collections import defaultdict
+import heapq
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo.consts import CaseStatusOptions
+from pyzayo.mtc_models import CaseRecord, ImpactRecord
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "INACTIVE_CASE_STATUSES",
+    "MaintenanceWindow",
+    "Conflict",
+    "case_windows",
+    "find_conflicts",
+    "group_by_clli",
+    "group_by_circuits",
+]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# Cases in these states no longer have any scheduled maintenance windows.
+INACTIVE_CASE_STATUSES = {
+    CaseStatusOptions.closed,
+    CaseStatusOptions.cancelled,
+    CaseStatusOptions.completed,
+    CaseStatusOptions.rejected,
+}
+
+
+class MaintenanceWindow(NamedTuple):
+    """ A maintenance window of a case """
+
+    start: datetime
+    end: datetime
+    case_num: str
+
+
+class Conflict(NamedTuple):
+    """ The overlapping maintenance windows of two cases within a group """
+
+    group: str
+    case_a: str
+    circuit_a: str
+    case_b: str
+    circuit_b: str
+    start: datetime
+    end: datetime
+
+
+def case_windows(case: CaseRecord) -> List[MaintenanceWindow]:
+    """
+    Returns the maintenance windows of the case, one per primary date.  When
+    the `to_time` is not after the `from_time` the window ends the next day.
+    """
+    windows = list()
+
+    for pdate in (case.primary_date, case.primary_date_2, case.primary_date_3):
+        if not pdate:
+            continue
+
+        start = datetime.combine(pdate, case.from_time)
+        end = datetime.combine(pdate, case.to_time)
+        if end <= start:
+            end += timedelta(days=1)
+
+        windows.append(MaintenanceWindow(start, end, case.case_num))
+
+    return windows
+
+
+def group_by_clli(impact: ImpactRecord) -> Iterable[str]:
+    """ group the impact by its A and Z location CLLI codes """
+    return {clli for clli in (impact.clli_a, impact.clli_z) if clli}
+
+
+def group_by_circuits(
+    groups: Dict[str, Iterable[str]],
+    normalize: Optional[Callable[[str], str]] = None,
+) -> Callable[[ImpactRecord], Iterable[str]]:
+    """
+    Returns a grouping function for `find_conflicts` from the circuit groups.
+
+    Parameters
+    ----------
+    groups: Dict[str, Iterable[str]]
+        The group name to the circuit IDs of the group, for example the legs
+        of a diverse path.
+
+    normalize: Callable, optional
+        Used to normalize the circuit IDs, of both the groups and the impacts,
+        before they are compared.
+    """
+    normalize = normalize or str
+    circuit_groups = defaultdict(set)
+    for name, circuits in groups.items():
+        for circuit_id in circuits:
+            circuit_groups[normalize(circuit_id)].add(name)
+
+    def group_by(impact: ImpactRecord) -> Iterable[str]:
+        """ the names of the groups containing the impacted circuit """
+        return circuit_groups.get(normalize(impact.circuit_id), ())
+
+    return group_by
+
+
+def find_conflicts(
+    cases: Iterable[CaseRecord],
+    impacts: Iterable[ImpactRecord],
+    group_by: Callable[[ImpactRecord], Iterable[str]],
+) -> List[Conflict]:
+    """
+    Find the overlapping maintenance windows of different cases that impact
+    different circuits within the same group.
+
+    Parameters
+    ----------
+    cases: Iterable[CaseRecord]
+        The maintenance cases; inactive cases are ignored.
+
+    impacts: Iterable[ImpactRecord]
+        The impact records of the cases.
+
+    group_by: Callable
+        Returns the group names of an impact, for example `group_by_clli`.
+
+    Returns
+    -------
+    The conflicts, ordered by group and then start time.
+    """
+    windows = {
+        case.case_num: case_windows(case)
+        for case in cases
+        if case.status not in INACTIVE_CASE_STATUSES
+    }
+
+    # the interval index: each group to the windows of its impacted circuits.
+
+    group_windows = defaultdict(set)
+    for impact in impacts:
+        for window in windows.get(impact.case_num, ()):
+            for group in group_by(impact):
+                group_windows[group].add((window, impact.circuit_id))
+
+    conflicts = list()
+    for group in sorted(group_windows):
+        conflicts.extend(_sweep_group(group, sorted(group_windows[group])))
+
+    return conflicts
+
+
+def _sweep_group(group: str, intervals: List) -> Iterable[Conflict]:
+    """
+    Sweep-line pass over the group intervals, sorted by start time.  The
+    active intervals are kept in a heap ordered by end time so that the
+    intervals ending before the current start are removed as the line
+    advances; each remaining active interval overlaps the current one.
+    """
+    active = list()
+
+    for window, circuit_id in intervals:
+        while active and active[0][0] <= window.start:
+            heapq.heappop(active)
+
+        for _, other, other_circuit in active:
+            if other.case_num == window.case_num or other_circuit == circuit_id:
+                continue
+
+            yield Conflict(
+                group=group,
+                case_a=other.case_num,
+                circuit_a=other_circuit,
+                case_b=window.case_num,
+                circuit_b=circuit_id,
+                start=window.start,
+                end=min(window.end, other.end),
+            )
+
+        heapq.heappush(active, (window.end, window, circuit_id))
@@ -0,0 +1,225 @@
+"""
+This module contains the EmailArchive used to archive the maintenance
+notification emails of many cases, for example for compliance records.
+
+The archive directory is content-addressed: each email body is stored once,
+optionally gzip compressed, in a file named by the SHA-256 digest of the
+content.  The archive index, "index.jsonl", has one JSON line per archived
+notification with its case number, notification type, date, subject, and
+email file.  Notifications already in the index are skipped, so that their
+details are not requested again.
+
+The notification details are requested concurrently and the email files are
+written by the default executor, so that the requests continue while the
+files are written.
+
+Examples
+--------
+    from pyzayo import ZayoClient
+    from pyzayo.mtc_archive import EmailArchive
+
+    zapi = ZayoClient()
+    archive = EmailArchive("zayo-emails", compress=True)
+    archive.archive(zapi, ["TTN-0001234567", "TTN-0001234568"])
+    archive.close()
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, Iterable, Optional
+import asyncio
+import hashlib
+import gzip
+import json
+import os
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo import consts
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["EmailArchive", "ARCHIVE_INDEX_FILE"]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+ARCHIVE_INDEX_FILE = "index.jsonl"
+
+
+class EmailArchive(object):
+    """
+    Content-addressed archive of the maintenance notification emails.
+
+    Parameters
+    ----------
+    directory: str
+        The archive directory, created if it does not exist.
+
+    compress: bool
+        When True the new email files are gzip compressed.
+    """
+
+    def __init__(self, directory: str, compress: Optional[bool] = False):
+        """ load the archive index """
+        self.directory = directory
+        self.compress = compress
+
+        # the index entry of each archived notification, by name.
+        self.index: Dict[str, Dict] = dict()
+
+        os.makedirs(directory, exist_ok=True)
+        index_path = os.path.join(directory, ARCHIVE_INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path) as ifile:
+                for line in ifile:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.index[entry["name"]] = entry
+
+        # the email file of each stored content digest, and the writes of the
+        # email files in progress.
+        self._files = {entry["sha256"]: entry["file"] for entry in self.index.values()}
+        self._writes: Dict[str, asyncio.Future] = dict()
+        self._index_file = open(index_path, "a")
+
+    def __contains__(self, name: str) -> bool:
+        """ True if the notification is archived """
+        return name in self.index
+
+    def __len__(self) -> int:
+        """ the number of archived notifications """
+        return len(self.index)
+
+    def close(self):
+        """ close the archive index """
+        self._index_file.close()
+
+    def archive(
+        self,
+        client,
+        case_nums: Iterable[str],
+        concurrency: Optional[int] = consts.MAX_CONCURRENT_CASES,
+    ) -> Dict[str, int]:
+        """
+        Archive the notification emails of the cases, using the client, and
+        return the counts; see `aarchive`.
+        """
+        return client._run(self.aarchive(client, case_nums, concurrency))
+
+    async def aarchive(
+        self,
+        client,
+        case_nums: Iterable[str],
+        concurrency: Optional[int] = consts.MAX_CONCURRENT_CASES,
+    ) -> Dict[str, int]:
+        """
+        Coroutine that archives the notification emails of the cases, with up
+        to `concurrency` requests at a time, and returns the counts:
+
+            * cases: the number of cases
+            * notifications: the number of notifications of the cases
+            * archived: the number of notifications added to the index
+            * skipped: the number of notifications already in the index
+            * duplicates: the number of archived notifications whose email
+              content was already stored
+        """
+        case_nums = list(case_nums)
+        counts = dict(
+            cases=len(case_nums), notifications=0, archived=0, skipped=0, duplicates=0
+        )
+        limiter = asyncio.Semaphore(concurrency)
+
+        async def archive_notif(case_num, name):
+            """ fetch the notification details and archive the email """
+            async with limiter:
+                details = await client._fetch_notification_details(name)
+
+            if await self.add(case_num, details):
+                counts["duplicates"] += 1
+            counts["archived"] += 1
+
+        async def archive_case(case_num):
+            """ archive the notifications of the case not yet archived """
+            async with limiter:
+                notifs = await client._fetch_notifications(case_num)
+
+            names = [notif["name"] for notif in notifs]
+            new_names = [name for name in names if name not in self.index]
+            counts["notifications"] += len(names)
+            counts["skipped"] += len(names) - len(new_names)
+
+            await asyncio.gather(*(archive_notif(case_num, name) for name in new_names))
+
+        await asyncio.gather(*map(archive_case, case_nums))
+        return counts
+
+    async def add(self, case_num: str, details: Dict) -> bool:
+        """
+        Coroutine that stores the email of the notification details record,
+        in API dict form, and adds the notification to the index.  Returns
+        True if the email content was already stored.
+        """
+        content = (details.get("emailBody") or "").encode()
+        digest = hashlib.sha256(content).hexdigest()
+        duplicate = digest in self._files
+
+        if duplicate:
+            if digest in self._writes:
+                await asyncio.shield(self._writes[digest])
+        else:
+            self._files[digest] = self._email_file(digest)
+            write = self._writes[digest] = asyncio.get_running_loop().run_in_executor(
+                None, self._write_email, self._files[digest], content
+            )
+            try:
+                await write
+            except BaseException:
+                del self._files[digest]
+                raise
+            finally:
+                del self._writes[digest]
+
+        entry = {
+            "name": details["name"],
+            "case_num": case_num,
+            "type": details.get("notificationType"),
+            "date": details.get("lastModifiedDate"),
+            "subject": details.get("subject"),
+            "sha256": digest,
+            "file": self._files[digest],
+        }
+
+        # the index is appended only once the email file is written, so that
+        # an interrupted archive is resumed by archiving the notification again.
+
+        self.index[entry["name"]] = entry
+        self._index_file.write(json.dumps(entry) + "\n")
+        self._index_file.flush()
+        return duplicate
+
+    def _email_file(self, digest: str) -> str:
+        """ returns the email file path, relative to the archive directory """
+        ext = ".html.gz" if self.compress else ".html"
+        return os.path.join(digest[:2], digest + ext)
+
+    def _write_email(self, filename: str, content: bytes):
+        """ write the email file, replacing any partial file """
+        filepath = os.path.join(self.directory, filename)
+        if os.path.exists(filepath):
+            return
+
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        tmp_path = filepath + ".tmp"
+        with open(tmp_path, "wb") as ofile:
+            ofile.write(gzip.compress(content) if self.compress else content)
+        os.replace(tmp_path, filepath)
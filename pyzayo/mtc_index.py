@@ -0,0 +1,229 @@
+"""
+This module contains the MaintenanceIndex, used to answer which of many
+circuits have maintenance scheduled within a time window; for example for
+change-freeze planning.
+
+The cases and impacts are loaded once, in bulk, rather than with a
+`get_impacts(by_circuit_id=...)` request per circuit.  The index maps each
+normalized circuit ID to the maintenance windows of its cases, sorted by start
+time.  A window query bisects the sorted windows: a window overlapping the
+span [start, end) must start before `end`, and no earlier than `start` less
+the longest window duration.
+
+Examples
+--------
+    from datetime import datetime
+    from pyzayo import ZayoClient
+    from pyzayo.mtc_index import MaintenanceIndex
+
+    index = MaintenanceIndex.from_client(ZayoClient())
+    found = index.query(
+        ["/OGYX/123456/ZYO/", "OGYX/123457/ZYO"],
+        start=datetime(2026, 12, 15), end=datetime(2027, 1, 5),
+    )
+
+    for circuit_id, windows in found.items():
+        for window in windows:
+            print(circuit_id, window.case_num, window.start, window.end)
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, List, Iterable, Optional, Callable
+from datetime import datetime, timedelta
+from collections import defaultdict
+from itertools import chain
+from bisect import bisect_left
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo.mtc_models import CaseRecord, ImpactRecord
+from pyzayo.circuit_id import normalize_circuit_id
+from pyzayo.parsing import parse_pages
+from pyzayo.mtc_analysis import (
+    MaintenanceWindow,
+    INACTIVE_CASE_STATUSES,
+    case_windows,
+)
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["MaintenanceIndex"]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class MaintenanceIndex(object):
+    """
+    Index of the maintenance windows of each impacted circuit.
+
+    Parameters
+    ----------
+    cases: Iterable[CaseRecord]
+        The maintenance cases
+
+    impacts: Iterable[ImpactRecord]
+        The impact records of the cases
+
+    active_only: bool
+        When True, the default, the inactive cases (closed, cancelled, ...)
+        are not indexed.
+
+    normalize: Callable, optional
+        Used to normalize the circuit IDs of both the impacts and the queries;
+        `normalize_circuit_id` by default.
+    """
+
+    def __init__(
+        self,
+        cases: Iterable[CaseRecord] = (),
+        impacts: Iterable[ImpactRecord] = (),
+        active_only: Optional[bool] = True,
+        normalize: Optional[Callable[[str], str]] = None,
+    ):
+        """ index the cases and impacts """
+        self.active_only = active_only
+        self.normalize = normalize or normalize_circuit_id
+        self.cases: Dict[str, CaseRecord] = dict()
+
+        self._circuit_cases: Dict[str, set] = defaultdict(set)
+        self._windows: Optional[Dict[str, List[MaintenanceWindow]]] = None
+        self._max_duration = timedelta(0)
+
+        self.add_cases(cases)
+        self.add_impacts(impacts)
+
+    @classmethod
+    def from_client(
+        cls, client, processes: Optional[int] = None, **kwargs
+    ) -> "MaintenanceIndex":
+        """
+        Returns the index of all of the maintenance cases and impacts, loaded
+        in bulk from the client; one paginated pull of each.  The records are
+        parsed as the pages arrive, by `processes` worker processes if given;
+        see `pyzayo.parsing`.  The `kwargs` are passed to the constructor.
+        """
+        index = cls(**kwargs)
+        index.add_cases(
+            chain.from_iterable(
+                parse_pages(CaseRecord, client.iter_case_pages(), processes)
+            )
+        )
+
+        # only the impact records of the indexed cases are parsed and retained.
+
+        impact_pages = (
+            [rec for rec in page if rec["caseNumber"] in index.cases]
+            for page in client.iter_impact_pages()
+        )
+        index.add_impacts(
+            chain.from_iterable(parse_pages(ImpactRecord, impact_pages, processes))
+        )
+        return index
+
+    def add_cases(self, cases: Iterable[CaseRecord]):
+        """ add the cases to the index """
+        for case in cases:
+            if self.active_only and case.status in INACTIVE_CASE_STATUSES:
+                continue
+            self.cases[case.case_num] = case
+        self._windows = None
+
+    def add_impacts(self, impacts: Iterable[ImpactRecord]):
+        """ add the impacts to the index, by normalized circuit ID """
+        for impact in impacts:
+            self._circuit_cases[self.normalize(impact.circuit_id)].add(
+                impact.case_num
+            )
+        self._windows = None
+
+    def __len__(self) -> int:
+        """ the number of impacted circuits """
+        return len(self._circuit_cases)
+
+    def __contains__(self, circuit_id: str) -> bool:
+        """ True when the circuit has indexed maintenance """
+        return self.normalize(circuit_id) in self._circuit_cases
+
+    # -------------------------------------------------------------------------
+    #                               QUERIES
+    # -------------------------------------------------------------------------
+
+    def windows(self, circuit_id: str) -> List[MaintenanceWindow]:
+        """ returns all of the maintenance windows of the circuit by start time """
+        return self._circuit_windows().get(self.normalize(circuit_id), [])
+
+    def query(
+        self, circuit_ids: Iterable[str], start: datetime, end: datetime
+    ) -> Dict[str, List[MaintenanceWindow]]:
+        """
+        Find the maintenance windows of the circuits overlapping a time span.
+
+        Parameters
+        ----------
+        circuit_ids: Iterable[str]
+            The circuit IDs, in any form accepted by the `normalize` function.
+
+        start: datetime
+            The time span start
+
+        end: datetime
+            The time span end, exclusive.
+
+        Returns
+        -------
+        Dictionary of the given circuit ID, for those having maintenance
+        within the time span, to its windows by start time.
+        """
+        circuit_windows = self._circuit_windows()
+        earliest = start - self._max_duration
+        found = dict()
+
+        for circuit_id in circuit_ids:
+            windows = circuit_windows.get(self.normalize(circuit_id))
+            if not windows:
+                continue
+
+            lo = bisect_left(windows, (earliest,))
+            hi = bisect_left(windows, (end,), lo)
+            hits = [win for win in windows[lo:hi] if win.end > start]
+            if hits:
+                found[circuit_id] = hits
+
+        return found
+
+    def _circuit_windows(self) -> Dict[str, List[MaintenanceWindow]]:
+        """ build, when needed, the sorted windows of each circuit """
+        if self._windows is not None:
+            return self._windows
+
+        case_wins = {
+            case_num: case_windows(case) for case_num, case in self.cases.items()
+        }
+
+        self._windows = dict()
+        self._max_duration = timedelta(0)
+
+        for circuit_id, case_nums in self._circuit_cases.items():
+            windows = sorted(
+                chain.from_iterable(case_wins.get(cn, ()) for cn in case_nums)
+            )
+            if not windows:
+                continue
+
+            self._windows[circuit_id] = windows
+            self._max_duration = max(
+                self._max_duration, max(win.end - win.start for win in windows)
+            )
+
+        return self._windows
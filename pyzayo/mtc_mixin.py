@@ -12,9 +12,9 @@ API documentation:
 # System Imports
 # -----------------------------------------------------------------------------
 
-from typing import List, Dict
+from typing import List, Dict, Iterator, Iterable, Tuple, AsyncIterator, Optional
 import asyncio
-import re
+import random
 
 # -----------------------------------------------------------------------------
 # Public Imports
@@ -27,7 +27,11 @@ from first import first
 # -----------------------------------------------------------------------------
 
 from pyzayo.base_client import ZayoClientBase
+from pyzayo.circuit_id import format_circuit_id as circuit_id_format
 from pyzayo import consts
+from pyzayo import profiling
+from pyzayo.mtc_watch import CaseEvent, diff_cases
+from pyzayo.mtc_models import CaseRecord, ImpactRecord
 
 # -----------------------------------------------------------------------------
 # Package Exports
@@ -75,6 +79,116 @@ class ZayoMatenanceMixin(ZayoClientBase):
         """
         return self.paginate_records(url=consts.ZAYO_SM_ROUTE_MTC_CASES, **params)
 
+    def get_case_records(
+        self, processes: Optional[int] = None, **params
+    ) -> List[CaseRecord]:
+        """
+        Returns the maintenance cases parsed into CaseRecord models, see
+        `parse_records`.  The `params` are the same as `get_cases`.
+        """
+        return self.parse_records(
+            consts.ZAYO_SM_ROUTE_MTC_CASES, CaseRecord, processes=processes, **params
+        )
+
+    def iter_case_pages(self, **params) -> Iterator[List[Dict]]:
+        """
+        Generator that yields the maintenance case records one page at a time,
+        as they arrive; see `iter_pages`.  The `params` are the same as
+        `get_cases`.
+        """
+        return self.iter_pages(url=consts.ZAYO_SM_ROUTE_MTC_CASES, **params)
+
+    async def watch_cases(
+        self,
+        interval: Optional[float] = 60.0,
+        jitter: Optional[float] = 0.1,
+        full_every: Optional[int] = 10,
+        max_polls: Optional[int] = None,
+        head_count: Optional[int] = None,
+        **params,
+    ) -> AsyncIterator[CaseEvent]:
+        """
+        Async generator that polls the maintenance cases and yields the change
+        events: new, status, rescheduled, closed, and removed; see
+        `pyzayo.mtc_watch`.  The first poll establishes the baseline state and
+        yields no events.
+
+        Each poll requests a small first page of cases, latest primary date
+        first, whose response also carries the total record count; in the
+        steady state that one request is the only cost of a poll.  All of the
+        cases are requested when the total count changes, and every
+        `full_every` polls so that changes to the older cases, and the cases
+        removed from the listing, are also detected.
+
+        Parameters
+        ----------
+        interval: float
+            The number of seconds between polls.
+
+        jitter: float
+            The fraction of the interval by which each interval is randomly
+            lengthened or shortened, so that many watchers do not poll in step.
+
+        full_every: int, optional
+            The number of polls between requests of all of the cases; 0 or
+            None requests all of the cases only when the total count changes.
+
+        max_polls: int, optional
+            The number of polls after which the generator ends; unlimited when
+            not provided.
+
+        head_count: int, optional
+            The number of the latest cases requested by each poll,
+            `consts.WATCH_HEAD_COUNT` by default.
+
+        Other Parameters
+        ----------------
+        Used as-is per the API spec for request matching, same as `get_cases`.
+
+        Raises
+        ------
+        ValueError
+            When `full_every` is negative.
+        """
+        if full_every and full_every < 0:
+            raise ValueError(f"full_every must not be negative: {full_every}")
+
+        url = consts.ZAYO_SM_ROUTE_MTC_CASES
+        head_payload = {
+            **params,
+            "paging": {"top": head_count or consts.WATCH_HEAD_COUNT, "skip": 0},
+            "orderBy": [consts.OrderBy.date_later.value],
+        }
+
+        states = dict()
+        total = None
+        polls = 0
+
+        while max_polls is None or polls < max_polls:
+            if polls:
+                await asyncio.sleep(interval * random.uniform(1 - jitter, 1 + jitter))
+
+            head = await self._arun(self._fetch_page_data(url, head_payload))
+            count = head["metadata"]["totalRecordCount"]
+            records = head["records"]
+
+            # the cases removed from the listing are detected only when the
+            # records are the complete listing.
+
+            complete = count <= len(records)
+            forced = bool(full_every) and polls % full_every == 0
+            if not complete and (count != total or forced):
+                records = await self._arun(self._fetch_records(url, **params))
+                complete = True
+
+            total = count
+            events = diff_cases(states, records, complete=complete)
+            if polls:
+                for event in events:
+                    yield event
+
+            polls += 1
+
     def get_case(self, by_case_num: str) -> Dict:
         """
         This method will return the specific case record identified `by_case_num`.
@@ -122,13 +236,82 @@ class ZayoMatenanceMixin(ZayoClientBase):
 
         impacts = self.get_impacts(by_case_num=by_case_num)
 
-        notif_details = [
-            self.get_notification_details(by_name=notif["name"])
-            for notif in self.get_notifications(by_case_num=by_case_num)
-        ]
+        notif_details = self._run(self._fetch_case_notif_details(by_case_num))
 
         return case, impacts, notif_details
 
+    async def _fetch_case_notif_details(self, by_case_num: str) -> List[Dict]:
+        """ fetch the notification details for a case concurrently """
+        _, details = await self._fetch_case_notifs(by_case_num)
+        return details
+
+    async def _fetch_case_notifs(
+        self, by_case_num: str
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """ fetch the notifications, and then their details concurrently """
+        notifs = await self._fetch_notifications(by_case_num)
+        details = await asyncio.gather(
+            *(self._fetch_notification_details(notif["name"]) for notif in notifs)
+        )
+        return notifs, list(details)
+
+    def get_cases_notifications(
+        self, by_case_nums: Iterable[str]
+    ) -> Dict[str, Tuple[List[Dict], List[Dict]]]:
+        """
+        This method will obtain the notifications, and their details, for many
+        cases; fetching up to `consts.MAX_CONCURRENT_CASES` cases concurrently.
+
+        Parameters
+        ----------
+        by_case_nums: Iterable[str]
+            The case numbers, each starts with "TNN-"
+
+        Returns
+        -------
+        Dictionary of case number to the tuple (notifications, details), each a
+        list of records.
+        """
+        return self._run(self._fetch_cases_notifs(by_case_nums))
+
+    def get_cases_notification_details(
+        self, by_case_nums: Iterable[str]
+    ) -> Dict[str, List[Dict]]:
+        """
+        This method will obtain the notification details for many cases,
+        fetching up to `consts.MAX_CONCURRENT_CASES` cases concurrently.
+
+        Parameters
+        ----------
+        by_case_nums: Iterable[str]
+            The case numbers, each starts with "TNN-"
+
+        Returns
+        -------
+        Dictionary of case number to the list of notification detail records.
+        """
+        return {
+            case_num: details
+            for case_num, (_, details) in self.get_cases_notifications(
+                by_case_nums
+            ).items()
+        }
+
+    async def _fetch_cases_notifs(
+        self, by_case_nums: Iterable[str]
+    ) -> Dict[str, Tuple[List[Dict], List[Dict]]]:
+        """ coroutine that implements `get_cases_notifications` """
+        case_nums = list(by_case_nums)
+        limiter = asyncio.Semaphore(consts.MAX_CONCURRENT_CASES)
+
+        async def fetch_case(case_num):
+            """ fetch a case's notifications subject to the concurrency limit """
+            async with limiter:
+                return await self._fetch_case_notifs(case_num)
+
+        notifs = await asyncio.gather(*map(fetch_case, case_nums))
+        return dict(zip(case_nums, notifs))
+
     def get_impacts(self, by_circuit_id=None, by_case_num=None, **params) -> List[Dict]:
         """
         Get the maintenance impact records.  If `by_circuid_id` or `by_case_num`
@@ -163,6 +346,29 @@ class ZayoMatenanceMixin(ZayoClientBase):
         params = {"filter": req_filter, **params}
         return self.paginate_records(url=consts.ZAYO_SM_ROUTE_MTC_IMPACTS, **params)
 
+    def get_impact_records(
+        self, processes: Optional[int] = None, **params
+    ) -> List[ImpactRecord]:
+        """
+        Returns the maintenance impacts parsed into ImpactRecord models, see
+        `parse_records`.  The `params` are used as-is per the API spec for
+        request matching.
+        """
+        return self.parse_records(
+            consts.ZAYO_SM_ROUTE_MTC_IMPACTS,
+            ImpactRecord,
+            processes=processes,
+            **params,
+        )
+
+    def iter_impact_pages(self, **params) -> Iterator[List[Dict]]:
+        """
+        Generator that yields the maintenance impact records one page at a
+        time, as they arrive; see `iter_pages`.  The `params` are used as-is
+        per the API spec for request matching.
+        """
+        return self.iter_pages(url=consts.ZAYO_SM_ROUTE_MTC_IMPACTS, **params)
+
     def get_notifications(self, by_case_num) -> List[Dict]:
         """
         Get notifications by case number.
@@ -176,17 +382,18 @@ class ZayoMatenanceMixin(ZayoClientBase):
         -------
         List of notification records.
         """
-        loop = asyncio.get_event_loop()
+        return self._run(self._fetch_notifications(by_case_num))
 
-        res = loop.run_until_complete(
-            self.api.get(
-                url=consts.ZAYO_SM_ROUTE_MTC_NOTIFS_BY_CASE.format(case_num=by_case_num)
-            )
+    async def _fetch_notifications(self, by_case_num) -> List[Dict]:
+        """ coroutine that implements `get_notifications` """
+        res = await self.api.get(
+            url=consts.ZAYO_SM_ROUTE_MTC_NOTIFS_BY_CASE.format(case_num=by_case_num)
         )
 
         res.raise_for_status()
-        body = res.json()
-        return body["data"]
+        with profiling.phase("decode"):
+            body = res.json()
+        return self._project(consts.ZAYO_SM_ROUTE_MTC_NOTIFS_BY_CASE, body["data"])
 
     def get_notification_details(self, by_name: str) -> Dict:
         """
@@ -201,24 +408,25 @@ class ZayoMatenanceMixin(ZayoClientBase):
         -------
         The detail record; refer to API spec for key-value fields.
         """
-        loop = asyncio.get_event_loop()
+        return self._run(self._fetch_notification_details(by_name))
 
-        res = loop.run_until_complete(
-            self.api.get(
-                url=consts.ZAYO_SM_ROUTE_MTC_NOTIFS_BY_NAME.format(name=by_name)
-            )
+    async def _fetch_notification_details(self, by_name: str) -> Dict:
+        """ coroutine that implements `get_notification_details` """
+        res = await self.api.get(
+            url=consts.ZAYO_SM_ROUTE_MTC_NOTIFS_BY_NAME.format(name=by_name)
         )
 
         res.raise_for_status()
-        body = res.json()
-        return body["data"]
+        with profiling.phase("decode"):
+            body = res.json()
+        return self._project(consts.ZAYO_SM_ROUTE_MTC_NOTIFS_BY_NAME, [body["data"]])[0]
 
     @staticmethod
     def format_circuit_id(circuit_id):
         """
         This function transforms a given circuit ID string value that may or may not
         be delimited with the "/" marks and return the value in a Zayo API expected
-        format that is /4/6/3/4/ values.
+        format that is /4/6/3/4/ values; see `pyzayo.circuit_id.format_circuit_id`.
 
         Parameters
         ----------
@@ -228,8 +436,10 @@ class ZayoMatenanceMixin(ZayoClientBase):
         Returns
         -------
         The Zapo API circuit ID formatted value
+
+        Raises
+        ------
+        CircuitIdError
+            When the value is not a recognized circuit ID.
         """
-        cir_re = re.compile(r"/?(\w{4})/(\d{6})/(.{,3})/(.{,4})/?")
-        mo = cir_re.match(circuit_id)
-        groups = mo.groups()
-        return f"/{groups[0]:4}/{groups[1]:6}/{groups[2]:3}/{groups[3]:4}/"
+        return circuit_id_format(circuit_id)
@@ -51,4 +51,4 @@ class NotificationDetailRecord(BaseModel):
     date: datetime = Field(alias="lastModifiedDate")
     subject: str
     email_list: str = Field(alias="toEmailList")
-    email_content: str = Field(alias="emailBody")
+    email_content: Optional[str] = Field(None, alias="emailBody")
@@ -0,0 +1,195 @@
+"""
+This module contains the maintenance case change-detection used by the
+`ZayoClient.watch_cases` async generator and the "cases watch" command.
+
+The state of each case is reduced to its status and schedule; consecutive
+polls are compared by case number to produce change events: a new case, a
+status change, a rescheduled case, a closed case, and a case removed from the
+listing.
+
+Examples
+--------
+    from pyzayo import ZayoClient
+    from pyzayo.mtc_watch import run_watch
+
+    run_watch(ZayoClient(), print, interval=60)
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, List, Iterable, NamedTuple, Optional, Callable, TextIO
+from datetime import datetime, timezone
+import asyncio
+import json
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo.consts import CaseStatusOptions
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "CaseEvent",
+    "CaseEventKinds",
+    "CaseState",
+    "case_state",
+    "diff_cases",
+    "JsonlEventWriter",
+    "run_watch",
+]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class CaseEventKinds(object):
+    """ The kinds of case change events """
+
+    new = "new"
+    status = "status"
+    rescheduled = "rescheduled"
+    closed = "closed"
+    removed = "removed"
+
+
+class CaseState(NamedTuple):
+    """ The fields of a case record compared between polls """
+
+    status: str
+    schedule: tuple
+
+
+class CaseEvent(NamedTuple):
+    """
+    A change to a maintenance case detected between polls.  The `old` state
+    is None for a new case; the `new` state and the `record` are None for a
+    removed case.
+    """
+
+    kind: str
+    case_num: str
+    old: Optional[CaseState]
+    new: Optional[CaseState]
+    record: Optional[Dict]
+    detected: datetime
+
+    def to_dict(self) -> Dict:
+        """ returns the event in JSON serializable form """
+        return {
+            "kind": self.kind,
+            "case_num": self.case_num,
+            "old_status": self.old.status if self.old else None,
+            "status": self.new.status if self.new else None,
+            "old_schedule": list(self.old.schedule) if self.old else None,
+            "schedule": list(self.new.schedule) if self.new else None,
+            "detected": self.detected.isoformat(),
+        }
+
+
+def case_state(rec: Dict) -> CaseState:
+    """ returns the compared state of the case record in API dict form """
+    return CaseState(
+        status=rec.get("status"),
+        schedule=tuple(
+            rec.get(field)
+            for field in (
+                "primaryDate",
+                "x2ndPrimaryDate",
+                "x3rdPrimaryDate",
+                "fromTime",
+                "toTime",
+            )
+        ),
+    )
+
+
+def diff_cases(
+    states: Dict[str, CaseState],
+    records: Iterable[Dict],
+    complete: Optional[bool] = False,
+) -> List[CaseEvent]:
+    """
+    Compare the case records to the previous states, by case number, and
+    return the change events.  The `states` are updated in place with the
+    state of each record.
+
+    When `complete` is True the records are the complete listing of the
+    cases; a removed event is returned for each previous case that is not in
+    the records, and its state is removed.
+    """
+    detected = datetime.now(timezone.utc)
+    events = list()
+    seen = set()
+
+    for rec in records:
+        case_num = rec["caseNumber"]
+        seen.add(case_num)
+        new = case_state(rec)
+        old = states.get(case_num)
+        states[case_num] = new
+
+        if old == new:
+            continue
+
+        if old is None:
+            kinds = [CaseEventKinds.new]
+        else:
+            kinds = list()
+            if old.status != new.status:
+                kinds.append(
+                    CaseEventKinds.closed
+                    if new.status == CaseStatusOptions.closed
+                    else CaseEventKinds.status
+                )
+            if old.schedule != new.schedule:
+                kinds.append(CaseEventKinds.rescheduled)
+
+        events.extend(
+            CaseEvent(kind, case_num, old, new, rec, detected) for kind in kinds
+        )
+
+    if complete:
+        for case_num in [case_num for case_num in states if case_num not in seen]:
+            old = states.pop(case_num)
+            events.append(
+                CaseEvent(CaseEventKinds.removed, case_num, old, None, None, detected)
+            )
+
+    return events
+
+
+class JsonlEventWriter(object):
+    """ Writes each case event as a JSON line, flushed as it is written """
+
+    def __init__(self, ofile: TextIO):
+        """ write to the open text file """
+        self._ofile = ofile
+
+    def __call__(self, event: CaseEvent):
+        """ write the event """
+        self._ofile.write(json.dumps(event.to_dict()) + "\n")
+        self._ofile.flush()
+
+
+def run_watch(client, on_event: Callable[[CaseEvent], None], **watch_params):
+    """
+    Watch the maintenance cases, calling `on_event` with each change event,
+    until interrupted or the number of polls is reached.  The `watch_params`
+    are those of `ZayoClient.watch_cases`.
+    """
+
+    async def watch():
+        """ consume the events of the client watch generator """
+        async for event in client.watch_cases(**watch_params):
+            on_event(event)
+
+    asyncio.run(watch())
@@ -0,0 +1,224 @@
+"""
+This module contains the PageSizer used by the client to negotiate the page
+size, the paging "top" count, of each API route in place of always using the
+fixed `consts.MAX_TOP_COUNT`.
+
+The largest page size accepted by a route is discovered by probing the route
+once with each of the `consts.PAGE_SIZE_CANDIDATES`, largest first, and is
+cached for the life of the client.  Only the responses that reject the request
+itself, the `PAGE_SIZE_REJECT_STATUSES`, reject a page size; any other error,
+such as "429 Too Many Requests", ends the probe without caching a limit.
+`consts.MAX_TOP_COUNT` is the page size known to be accepted by every route,
+and is used when the probes fail.
+
+The page size used by a bulk pull is then the accepted size that minimizes
+the estimated pull time, from a per-route linear model of the observed page
+response times: fewer, larger pages unless the pull is small enough that
+smaller pages requested concurrently complete sooner.
+
+Examples
+--------
+    sizer = PageSizer()
+
+    async def probe(top):
+        res = await api.post(url, json={"paging": {"top": top, "skip": 0}})
+        if res.status_code in PAGE_SIZE_REJECT_STATUSES:
+            return False
+        res.raise_for_status()
+        return True
+
+    page_sz = await sizer.page_size(url, total=12000, concurrency=4, probe=probe)
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, Iterable, Optional, Callable, Awaitable, Tuple
+from http import HTTPStatus
+import asyncio
+import math
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo import consts
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["PageSizer", "PAGE_SIZE_REJECT_STATUSES"]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# The response statuses by which a route rejects the page size of a request.
+# Other errors, for example throttling or authorization, say nothing of the
+# page size.
+PAGE_SIZE_REJECT_STATUSES = frozenset(
+    {
+        HTTPStatus.BAD_REQUEST,
+        HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+        HTTPStatus.UNPROCESSABLE_ENTITY,
+    }
+)
+
+# The weight of the previous observations, per new observation, in the page
+# latency model; older observations fade so that the model tracks the API.
+_LATENCY_DECAY = 0.95
+
+
+class _LatencyModel(object):
+    """
+    Decayed least-squares fit of the page response time, in seconds, to the
+    number of records in the page: overhead + per_record * records.
+    """
+
+    def __init__(self):
+        """ no observations """
+        self._sums = [0.0] * 5  # n, x, y, xx, xy
+
+    def observe(self, records: int, seconds: float):
+        """ add an observation """
+        values = (1.0, records, seconds, records * records, records * seconds)
+        self._sums = [
+            total * _LATENCY_DECAY + value for total, value in zip(self._sums, values)
+        ]
+
+    def fit(self) -> Optional[Tuple[float, float]]:
+        """
+        Returns the (overhead, per_record) seconds, or None until pages of
+        different sizes have been observed.
+        """
+        n, sx, sy, sxx, sxy = self._sums
+        var = n * sxx - sx * sx
+        if n < 2 or var <= 1e-9 * max(1.0, n * sxx):
+            return None
+
+        per_record = max(0.0, (n * sxy - sx * sy) / var)
+        overhead = max(0.0, (sy - per_record * sx) / n)
+        return overhead, per_record
+
+
+class PageSizer(object):
+    """
+    Negotiates and tunes the page size of each API route.
+
+    Parameters
+    ----------
+    candidates: Iterable[int], optional
+        The page sizes probed, `consts.PAGE_SIZE_CANDIDATES` by default.
+
+    min_size: int, optional
+        The page size accepted by every route, `consts.MAX_TOP_COUNT` by
+        default; it is never probed.
+    """
+
+    def __init__(
+        self,
+        candidates: Optional[Iterable[int]] = None,
+        min_size: Optional[int] = None,
+    ):
+        """ no route limits are known until probed """
+        self.min_size = min_size or consts.MAX_TOP_COUNT
+        self.candidates = sorted(
+            {self.min_size}
+            | {
+                size
+                for size in (candidates or consts.PAGE_SIZE_CANDIDATES)
+                if size > self.min_size
+            },
+            reverse=True,
+        )
+
+        # the largest accepted page size of each probed route.
+        self.limits: Dict[str, int] = dict()
+
+        self._models: Dict[str, _LatencyModel] = dict()
+        self._locks: Dict[str, asyncio.Lock] = dict()
+
+    async def page_size(
+        self,
+        url: str,
+        total: int,
+        concurrency: int,
+        probe: Callable[[int], Awaitable[bool]],
+    ) -> int:
+        """
+        Returns the page size used to pull the `total` records of the route,
+        with up to `concurrency` pages requested at a time.  The route limit
+        is probed on first use; `probe(size)` returns True when the page size
+        is accepted, False when rejected.  Should a probe raise any other
+        error, `min_size` is used and the route is probed again next time.
+        """
+        if total <= self.min_size:
+            return self.min_size
+
+        limit = self.limits.get(url)
+        if limit is None:
+            try:
+                limit = await self._probe(url, probe)
+            except Exception:  # noqa
+                return self.min_size
+
+        return self.best_size(url, total, concurrency, limit)
+
+    async def _probe(self, url: str, probe: Callable[[int], Awaitable[bool]]) -> int:
+        """ coroutine that discovers and caches the route limit """
+
+        # concurrent pulls of the same route wait for the one probe.
+
+        lock = self._locks.setdefault(url, asyncio.Lock())
+        async with lock:
+            if url in self.limits:
+                return self.limits[url]
+
+            for size in self.candidates:
+                if size == self.min_size or await probe(size):
+                    self.limits[url] = size
+                    return size
+
+    def best_size(
+        self, url: str, total: int, concurrency: int, limit: Optional[int] = None
+    ) -> int:
+        """
+        Returns the accepted page size, at most `limit`, with the least
+        estimated time to pull the `total` records; the largest accepted page
+        size until the route latency model is fitted.  Ties are resolved to
+        the larger page size, for the fewer requests.
+        """
+        limit = limit or self.limits.get(url, self.min_size)
+        sizes = [size for size in self.candidates if size <= limit]
+
+        model = self._models.get(url)
+        fit = model.fit() if model else None
+        if fit is None:
+            return sizes[0]
+
+        overhead, per_record = fit
+
+        def pull_time(size):
+            rounds = math.ceil(math.ceil(total / size) / concurrency)
+            return rounds * (overhead + per_record * min(size, total))
+
+        return min(sizes, key=lambda size: (pull_time(size), -size))
+
+    def observe(self, url: str, records: int, seconds: float):
+        """ add the response time of a page of the route to its model """
+        self._models.setdefault(url, _LatencyModel()).observe(records, seconds)
+
+    def reject(self, url: str, size: int, returned: Optional[int] = 0):
+        """
+        Lower the route limit below the page size, after the route rejected a
+        page of that size, or truncated it to the `returned` number of
+        records.
+        """
+        smaller = [
+            cand for cand in self.candidates if cand < size and cand <= returned
+        ] or [cand for cand in self.candidates if cand < size]
+        self.limits[url] = smaller[0] if smaller else self.min_size
@@ -0,0 +1,129 @@
+"""
+This module contains the bulk parsing of the API records into their models,
+for example `pyzayo.mtc_models.CaseRecord`, used by the large pulls such as a
+full historical report.
+
+The pages are parsed as they arrive from a paging iterator, such as
+`ZayoClient.iter_case_pages`, whose client keeps fetching the following pages
+in the background; so the parsing overlaps the network time rather than
+following it.  For very large pulls the pages can instead be parsed by a pool
+of worker processes, each page a task, with the parsed pages returned in
+order.  The worker processes are worthwhile only when the parsing, rather than
+the network, is the limit: the records and the models are pickled to and from
+the workers.
+
+Examples
+--------
+    from pyzayo import ZayoClient
+    from pyzayo.mtc_models import CaseRecord
+    from pyzayo.parsing import parse_records
+
+    zapi = ZayoClient()
+    cases = parse_records(CaseRecord, zapi.iter_case_pages(), processes=4)
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import List, Dict, Iterable, Iterator, Optional, Type, TypeVar
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from itertools import chain
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+from pydantic import BaseModel
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo import profiling
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["parse_pages", "parse_records"]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+def parse_pages(
+    model: Type[Model],
+    pages: Iterable[List[Dict]],
+    processes: Optional[int] = None,
+    window: Optional[int] = None,
+) -> Iterator[List[Model]]:
+    """
+    Generator that yields each page of records, in API dict form, parsed into
+    the model; in the order of the pages.
+
+    Parameters
+    ----------
+    model: Type[BaseModel]
+        The record model, for example `pyzayo.mtc_models.CaseRecord`.
+
+    pages: Iterable[List[Dict]]
+        The pages of records, for example from `ZayoClient.iter_case_pages`.
+
+    processes: int, optional
+        The number of worker processes parsing the pages; when not provided,
+        or 1, the pages are parsed in the calling thread.
+
+    window: int, optional
+        The maximum number of pages submitted to the worker processes ahead
+        of the consumer, twice the number of processes by default; this
+        bounds the memory used whatever the result size.
+    """
+    if not processes or processes < 2:
+        for page in pages:
+            yield _parse_page(model, page)
+        return
+
+    window = window or 2 * processes
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        try:
+            for page in pages:
+                pending.append(executor.submit(_parse_page, model, page))
+                if len(pending) >= window:
+                    yield _page_result(pending.popleft())
+
+            while pending:
+                yield _page_result(pending.popleft())
+
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def parse_records(
+    model: Type[Model],
+    pages: Iterable[List[Dict]],
+    processes: Optional[int] = None,
+) -> List[Model]:
+    """ returns the records of the pages parsed into the model, in order """
+    return list(chain.from_iterable(parse_pages(model, pages, processes=processes)))
+
+
+def _parse_page(model: Type[Model], page: List[Dict]) -> List[Model]:
+    """ returns the page records parsed into the model """
+    with profiling.phase("parse"):
+        return [model.parse_obj(rec) for rec in page]
+
+
+def _page_result(future) -> List[Model]:
+    """ returns the parsed page of the worker process """
+    with profiling.phase("parse.wait"):
+        return future.result()
@@ -0,0 +1,272 @@
+"""
+This module contains the ZayoClientPool, used to access several Zayo customer
+accounts, each with its own client credentials, from one process.
+
+Each account has its own client, and therefore its own token and optional
+rate budget; all of the clients share one background loop thread and one
+transport connection pool.  The fan-out queries run the accounts concurrently
+and tag each record with the name of its account.
+
+The account credentials are obtained from an INI file, one section per
+account, or from a callable returning the same mapping:
+
+    [acme-east]
+    client_id = ...
+    client_secret = ...
+    rate = 5
+
+Examples
+--------
+    from pyzayo.pool import ZayoClientPool
+
+    with ZayoClientPool() as pool:
+        cases = pool.get_cases()
+        by_account = pool.fan_out("get_records_count", "existing-services")
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, List, Iterator, Optional, Callable, Union, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from configparser import ConfigParser
+from copy import deepcopy
+import os
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import httpx
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo import consts
+from pyzayo.client import ZayoClient
+from pyzayo.loop_thread import LoopThread
+from pyzayo.svcinv_store import ServiceInventory
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["ZayoClientPool", "load_accounts", "ACCOUNT_KEY"]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# The record key added by the fan-out queries, whose value is the account name.
+ACCOUNT_KEY = "account"
+
+# The account credentials: account name to the "client_id", "client_secret",
+# and optional "rate" values.
+Accounts = Mapping[str, Mapping[str, str]]
+
+
+def load_accounts(filepath: Optional[str] = None) -> Dict[str, Dict[str, str]]:
+    """
+    Returns the account credentials from the INI file, by default the
+    `consts.ZAYO_ACCOUNTS_FILE`; one section per account name.
+
+    Raises
+    ------
+    FileNotFoundError
+        When the file does not exist.
+
+    ValueError
+        When an account is missing the client_id or client_secret value.
+    """
+    filepath = filepath or consts.ZAYO_ACCOUNTS_FILE
+    if not os.path.isfile(filepath):
+        raise FileNotFoundError(f"Accounts file not found: {filepath}")
+
+    config = ConfigParser(interpolation=None)
+    config.read(filepath)
+
+    accounts = {name: dict(config[name]) for name in config.sections()}
+    for name, creds in accounts.items():
+        missing = {"client_id", "client_secret"} - set(creds)
+        if missing:
+            raise ValueError(
+                f"Account {name} missing: {', '.join(sorted(missing))} in {filepath}"
+            )
+
+    return accounts
+
+
+class ZayoClientPool(object):
+    """
+    A pool of ZayoClient instances, one per account, sharing one loop thread
+    and connection pool.
+
+    Parameters
+    ----------
+    accounts: Mapping or Callable, optional
+        The account credentials, or a callable returning them; loaded from the
+        `consts.ZAYO_ACCOUNTS_FILE` by default.
+
+    transport: httpx.AsyncBaseTransport, optional
+        The transport shared by all of the clients, a network transport by
+        default.  The transport is closed when the pool is closed; closing the
+        client of an account does not close it.
+
+    rate_limit: float, optional
+        The default maximum number of requests per second of each account,
+        used when the account does not define a "rate" value.
+    """
+
+    def __init__(
+        self,
+        accounts: Optional[Union[Accounts, Callable[[], Accounts]]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        rate_limit: Optional[float] = None,
+    ):
+        """ authenticate each account concurrently and create its client """
+        if accounts is None:
+            accounts = load_accounts()
+        elif callable(accounts):
+            accounts = accounts()
+
+        if not accounts:
+            raise ValueError("No accounts provided")
+
+        self._loop_thread = LoopThread(name="pyzayo-pool-loop")
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+        def make_client(creds):
+            """ authenticate and create the account client """
+            rate = creds.get("rate")
+            return ZayoClient(
+                transport=_SharedTransport(self._transport),
+                credentials=creds,
+                loop_thread=self._loop_thread,
+                rate_limit=float(rate) if rate else rate_limit,
+            )
+
+        with ThreadPoolExecutor(max_workers=len(accounts)) as executor:
+            self.clients: Dict[str, ZayoClient] = dict(
+                zip(accounts, executor.map(make_client, accounts.values()))
+            )
+
+    def __enter__(self):
+        """ context manager support; the pool is closed on exit """
+        return self
+
+    def __exit__(self, *exc_info):
+        """ close the pool on context manager exit """
+        self.close()
+
+    def __getitem__(self, account: str) -> ZayoClient:
+        """ returns the client of the account """
+        return self.clients[account]
+
+    @property
+    def accounts(self) -> List[str]:
+        """ the account names """
+        return list(self.clients)
+
+    def close(self):
+        """ close each client, the shared transport, and the shared loop thread """
+        if not self._loop_thread.is_running:
+            return
+
+        for client in self.clients.values():
+            client.close()
+        self._loop_thread.run(self._transport.aclose())
+        self._loop_thread.close()
+
+    # -------------------------------------------------------------------------
+    #                               FAN-OUT
+    # -------------------------------------------------------------------------
+
+    def fan_out(self, method: str, *args, **kwargs) -> Dict:
+        """
+        Call the ZayoClient `method` of every account concurrently and return
+        the dictionary of account name to the result.  Each call is given its
+        own copy of the arguments.
+        """
+
+        def call(client):
+            """ call the client method """
+            return getattr(client, method)(*deepcopy(args), **deepcopy(kwargs))
+
+        with ThreadPoolExecutor(max_workers=len(self.clients)) as executor:
+            return dict(zip(self.clients, executor.map(call, self.clients.values())))
+
+    def _fan_out_records(self, method: str, *args, **kwargs) -> List[Dict]:
+        """ fan out the method and return all of the records tagged by account """
+        return [
+            _tag_record(rec, account)
+            for account, recs in self.fan_out(method, *args, **kwargs).items()
+            for rec in recs
+        ]
+
+    def _iter_pages(self, method: str, **params) -> Iterator[List[Dict]]:
+        """ yield the records pages of each account in turn, tagged by account """
+        for account, client in self.clients.items():
+            for page in getattr(client, method)(**deepcopy(params)):
+                yield [_tag_record(rec, account) for rec in page]
+
+    def get_cases(self, **params) -> List[Dict]:
+        """ returns the maintenance cases of all accounts, see `get_cases` """
+        return self._fan_out_records("get_cases", **params)
+
+    def get_impacts(self, **params) -> List[Dict]:
+        """ returns the impact records of all accounts, see `get_impacts` """
+        return self._fan_out_records("get_impacts", **params)
+
+    def get_services(self, **params) -> List[Dict]:
+        """ returns the service records of all accounts, see `get_services` """
+        return self._fan_out_records("get_services", **params)
+
+    def iter_case_pages(self, **params) -> Iterator[List[Dict]]:
+        """ yields the maintenance case pages of each account in turn """
+        return self._iter_pages("iter_case_pages", **params)
+
+    def iter_impact_pages(self, **params) -> Iterator[List[Dict]]:
+        """ yields the impact record pages of each account in turn """
+        return self._iter_pages("iter_impact_pages", **params)
+
+    def iter_service_pages(self, **params) -> Iterator[List[Dict]]:
+        """ yields the service record pages of each account in turn """
+        return self._iter_pages("iter_service_pages", **params)
+
+    def get_service_inventory(self, **params) -> ServiceInventory:
+        """ returns the ServiceInventory of the services of all accounts """
+        return ServiceInventory(self.iter_service_pages(**params))
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """
+    The pool transport as used by the client of each account; the requests
+    are sent by the pool transport, which is not closed when the client is
+    closed.  The transport attributes, such as `requires_auth`, are those of
+    the pool transport.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        """ use the pool transport """
+        self.transport = transport
+
+    def __getattr__(self, name):
+        """ the attributes of the pool transport """
+        return getattr(self.transport, name)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """ send the request using the pool transport """
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self):
+        """ the pool transport is closed by the pool """
+        pass
+
+
+def _tag_record(rec: Dict, account: str) -> Dict:
+    """ returns a copy of the record tagged with the account name """
+    return {**rec, ACCOUNT_KEY: account}
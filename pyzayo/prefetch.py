@@ -0,0 +1,240 @@
+"""
+This module contains the PrefetchScheduler used to keep the frequently used
+datasets warm in the client dataset cache, so that the foreground calls, for
+example `ZayoClient.get_dataset("services")`, are served from memory rather
+than paying the full download latency on the first call or after expiry.
+
+The datasets are:
+
+    * services: all of the service inventory records
+    * open_cases: the maintenance cases that are not closed
+    * open_impacts: the impact records of the open cases
+    * notification_details: the dictionary of each active case number to the
+      notification detail records of the case
+
+The scheduler runs on the client background loop thread.  Each dataset is
+refreshed at its interval, ahead of the expiry of its cache entry; the number
+of datasets refreshed concurrently is bounded by the concurrency budget.
+
+Examples
+--------
+    from pyzayo import ZayoClient
+
+    zapi = ZayoClient()
+    zapi.start_prefetch(intervals={"services": 1800})
+
+    services = zapi.get_dataset("services")
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, List, Iterable, Optional, Callable, Awaitable
+from concurrent.futures import Future
+import asyncio
+import time
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo import consts
+from pyzayo.mtc_analysis import INACTIVE_CASE_STATUSES
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "PrefetchScheduler",
+    "PREFETCH_DATASETS",
+    "PREFETCH_INTERVALS",
+    "load_dataset",
+]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# The default refresh interval of each dataset, in seconds.
+PREFETCH_INTERVALS = {
+    "services": 3600.0,
+    "open_cases": 300.0,
+    "open_impacts": 300.0,
+    "notification_details": 900.0,
+}
+
+PREFETCH_DATASETS = tuple(PREFETCH_INTERVALS)
+
+# The number of seconds before retrying a dataset refresh that failed, at most
+# its interval.
+PREFETCH_RETRY_DELAY = 30.0
+
+
+async def _load_services(client) -> List[Dict]:
+    """ loads all of the service inventory records """
+    return await client._fetch_records(url=consts.ZAYO_SM_ROUTE_SERVICES)
+
+
+async def _load_open_cases(client) -> List[Dict]:
+    """ loads the maintenance cases that are not closed """
+    return [
+        rec
+        for rec in await client._fetch_records(url=consts.ZAYO_SM_ROUTE_MTC_CASES)
+        if rec["status"] != consts.CaseStatusOptions.closed
+    ]
+
+
+async def _load_open_impacts(client) -> List[Dict]:
+    """ loads the impact records of the open cases """
+    open_cases = await client._fetch_dataset("open_cases")
+    case_nums = {rec["caseNumber"] for rec in open_cases}
+    return [
+        rec
+        for rec in await client._fetch_records(url=consts.ZAYO_SM_ROUTE_MTC_IMPACTS)
+        if rec["caseNumber"] in case_nums
+    ]
+
+
+async def _load_notification_details(client) -> Dict[str, List[Dict]]:
+    """ loads the notification details of the active cases, by case number """
+    case_nums = [
+        rec["caseNumber"]
+        for rec in await client._fetch_dataset("open_cases")
+        if rec["status"] not in INACTIVE_CASE_STATUSES
+    ]
+    notifs = await client._fetch_cases_notifs(case_nums)
+    return {case_num: details for case_num, (_, details) in notifs.items()}
+
+
+_DATASET_LOADERS: Dict[str, Callable[..., Awaitable]] = {
+    "services": _load_services,
+    "open_cases": _load_open_cases,
+    "open_impacts": _load_open_impacts,
+    "notification_details": _load_notification_details,
+}
+
+
+def load_dataset(client, name: str) -> Awaitable:
+    """
+    Returns the coroutine that loads the named dataset using the client.
+
+    Raises
+    ------
+    ValueError
+        When the dataset name is not one of PREFETCH_DATASETS.
+    """
+    try:
+        return _DATASET_LOADERS[name](client)
+    except KeyError:
+        raise ValueError(
+            f"Unknown dataset: {name}, expected one of {PREFETCH_DATASETS}"
+        )
+
+
+class PrefetchScheduler(object):
+    """
+    Refreshes the client datasets in the background, ahead of the expiry of
+    their cache entries.
+
+    Parameters
+    ----------
+    client: ZayoClient
+        The client whose `datasets` cache is kept warm.
+
+    datasets: Iterable[str], optional
+        The names of the datasets to refresh, all PREFETCH_DATASETS by default.
+
+    intervals: Dict[str, float], optional
+        The refresh interval of a dataset, in seconds, in place of the
+        PREFETCH_INTERVALS default.
+
+    concurrency: int
+        The maximum number of datasets refreshed concurrently.
+
+    refresh_ahead: float
+        The fraction of the interval, before the cache entry expires, at which
+        the dataset is refreshed.
+    """
+
+    def __init__(
+        self,
+        client,
+        datasets: Optional[Iterable[str]] = None,
+        intervals: Optional[Dict[str, float]] = None,
+        concurrency: Optional[int] = 2,
+        refresh_ahead: Optional[float] = 0.2,
+    ):
+        """ configure the datasets; call `start` to begin refreshing """
+        self.client = client
+        self.datasets = tuple(datasets or PREFETCH_DATASETS)
+        self.intervals = {**PREFETCH_INTERVALS, **(intervals or {})}
+        self.concurrency = concurrency
+        self.refresh_ahead = refresh_ahead
+
+        # per dataset: the time of the last refresh and the last error.
+        self.refreshed: Dict[str, float] = dict()
+        self.errors: Dict[str, BaseException] = dict()
+
+        unknown = set(self.datasets) - set(PREFETCH_DATASETS)
+        if unknown:
+            raise ValueError(f"Unknown datasets: {', '.join(sorted(unknown))}")
+
+        self._budget: Optional[asyncio.Semaphore] = None
+        self._futures: List[Future] = list()
+
+    @property
+    def is_running(self) -> bool:
+        """ True while the refresh tasks are running """
+        return any(not future.done() for future in self._futures)
+
+    def start(self):
+        """ start the refresh tasks on the client loop thread """
+        if self.is_running:
+            return
+
+        loop_thread = self.client._loop_thread
+        self._futures = [
+            loop_thread.submit(self._refresh_forever(name)) for name in self.datasets
+        ]
+
+    def stop(self):
+        """ cancel the refresh tasks; the cached datasets remain until expiry """
+        for future in self._futures:
+            future.cancel()
+        self._futures = list()
+
+    async def refresh(self, name: str):
+        """ coroutine that loads the dataset and caches it for its interval """
+        if self._budget is None:
+            self._budget = asyncio.Semaphore(self.concurrency)
+
+        async with self._budget:
+            value = await load_dataset(self.client, name)
+
+        self.client.datasets.set(name, value, ttl=self.intervals[name])
+        self.refreshed[name] = time.time()
+        self.errors.pop(name, None)
+
+    async def _refresh_forever(self, name: str):
+        """ refresh the dataset ahead of each expiry, until cancelled """
+        interval = self.intervals[name]
+
+        while True:
+            try:
+                await self.refresh(name)
+                delay = interval * (1 - self.refresh_ahead)
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as exc:  # noqa
+                # the failure is recorded and the refresh retried; any cached
+                # value remains available until it expires.
+                self.errors[name] = exc
+                delay = min(interval, PREFETCH_RETRY_DELAY)
+
+            await asyncio.sleep(delay)
@@ -0,0 +1,354 @@
+"""
+This module contains the per-phase profiler used to find where the time of a
+client call, or a zayocli command, is spent: authentication, the record count
+requests, page requests, retries, JSON decoding, model parsing, and table
+rendering.
+
+The client code is instrumented with `phase` timers, which cost a single
+check when profiling is not enabled.  When enabled, the profiler records the
+wall time and call count of each phase, and the timing of each API request
+for the request waterfall.  The phases of concurrent requests overlap, so the
+phase totals are cumulative rather than portions of the wall time.
+
+Profiling is enabled by the zayocli "--profile" option, by `enable`, or by the
+environment variable $PYZAYO_PROFILE, in which case the report is written to
+stderr at exit.  The optional cProfile statistics file, from the zayocli
+"--profile-output" option or $PYZAYO_PROFILE_OUTPUT, covers both the calling
+thread and the client loop threads; it can be read with `pstats` or tools such
+as snakeviz.
+
+Examples
+--------
+    from pyzayo import ZayoClient
+    from pyzayo import profiling
+
+    profiler = profiling.enable()
+    ZayoClient().get_cases()
+    profiling.disable()
+    profiler.report()
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, List, Optional, Callable, TextIO, NamedTuple
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+import asyncio
+import threading
+import cProfile
+import pstats
+import atexit
+import time
+import sys
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo import consts
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "Profiler",
+    "RequestTiming",
+    "enable",
+    "disable",
+    "active",
+    "phase",
+    "timed",
+    "count",
+    "thread_profile",
+]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# The maximum number of requests shown in the report waterfall, and the width
+# of the waterfall bars.
+WATERFALL_MAX_REQUESTS = 100
+WATERFALL_WIDTH = 40
+
+# the profiler while profiling is enabled.
+_profiler: Optional["Profiler"] = None
+
+_NO_PHASE = nullcontext()
+
+
+class RequestTiming(NamedTuple):
+    """ The timing of an API request, relative to the profiler start """
+
+    method: str
+    path: str
+    status: Optional[int]
+    start: float
+    elapsed: float
+    size: int
+
+
+class Profiler(object):
+    """
+    Records the phase timers and the API request timings.
+
+    Parameters
+    ----------
+    output: str, optional
+        When provided, the cProfile statistics are also collected and are
+        written to this file by `dump_stats`.
+    """
+
+    def __init__(self, output: Optional[str] = None):
+        """ start the wall time, and the cProfile of the calling thread """
+        self.output = output
+        self.started = time.perf_counter()
+        self.stopped: Optional[float] = None
+
+        # per phase: [calls, total seconds, max seconds]
+        self.phases: Dict[str, List] = dict()
+        self.counters: Dict[str, int] = dict()
+        self.requests: List[RequestTiming] = list()
+
+        self._lock = threading.Lock()
+        self._cprofiles: List[cProfile.Profile] = list()
+        self._loop_cprofiles: List[tuple] = list()
+
+        if output:
+            self._cprofiles.append(cProfile.Profile())
+            self._cprofiles[0].enable()
+
+    @property
+    def wall_time(self) -> float:
+        """ the seconds since the profiler started, until stopped """
+        return (self.stopped or time.perf_counter()) - self.started
+
+    def add_phase(self, name: str, seconds: float):
+        """ add a call of the phase """
+        with self._lock:
+            stats = self.phases.setdefault(name, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+
+    def add_count(self, name: str, value: Optional[int] = 1):
+        """ add to the named counter, for example the number of retries """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def add_request(
+        self,
+        method: str,
+        path: str,
+        status: Optional[int],
+        start: float,
+        elapsed: float,
+        size: int,
+    ):
+        """ add the timing of an API request; `start` is a perf_counter value """
+        with self._lock:
+            self.requests.append(
+                RequestTiming(method, path, status, start - self.started, elapsed, size)
+            )
+
+    def stop(self):
+        """ stop the wall time and the cProfile collection """
+        if self.stopped is not None:
+            return
+
+        self.stopped = time.perf_counter()
+        for prof in self._cprofiles:
+            prof.disable()
+
+        # the cProfile of a running loop thread is disabled in that thread.
+
+        for prof, loop in self._loop_cprofiles:
+            if loop is _running_loop():
+                prof.disable()
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(_disable(prof), loop).result(
+                    timeout=5
+                )
+            self._cprofiles.append(prof)
+
+    def dump_stats(self, filepath: Optional[str] = None):
+        """ write the cProfile statistics of all of the profiled threads """
+        profiles = [prof for prof in self._cprofiles if prof.getstats()]
+        if not profiles:
+            return
+
+        stats = pstats.Stats(*profiles)
+        stats.dump_stats(filepath or self.output)
+
+    def report(self, ofile: Optional[TextIO] = None):
+        """ write the phase breakdown and the request waterfall, stderr default """
+        ofile = ofile or sys.stderr
+        write = ofile.write
+        wall = self.wall_time
+
+        write(f"\nProfile: {wall:.3f}s wall time\n\n")
+        write(
+            f"{'phase':<24}{'calls':>8}{'total s':>10}{'mean ms':>10}{'max ms':>10}\n"
+        )
+        for name, (calls, total, longest) in sorted(
+            self.phases.items(), key=lambda item: -item[1][1]
+        ):
+            write(
+                f"{name:<24}{calls:>8}{total:>10.3f}"
+                f"{total / calls * 1e3:>10.1f}{longest * 1e3:>10.1f}\n"
+            )
+
+        for name, value in sorted(self.counters.items()):
+            write(f"{name:<24}{value:>8}\n")
+
+        write(f"\nRequests ({len(self.requests)})\n")
+        scale = WATERFALL_WIDTH / wall if wall else 0
+        for req in sorted(self.requests, key=lambda req: req.start)[
+            :WATERFALL_MAX_REQUESTS
+        ]:
+            offset = min(int(req.start * scale), WATERFALL_WIDTH - 1)
+            width = max(1, min(int(req.elapsed * scale), WATERFALL_WIDTH - offset))
+            bar = " " * offset + "#" * width
+            write(
+                f"  +{req.start:7.3f}s {req.elapsed:7.3f}s |{bar:<{WATERFALL_WIDTH}}| "
+                f"{req.method} {req.path} {req.status or 'error'} "
+                f"{req.size / 1024:.1f}kB\n"
+            )
+
+        if len(self.requests) > WATERFALL_MAX_REQUESTS:
+            write(f"  ... {len(self.requests) - WATERFALL_MAX_REQUESTS} more\n")
+
+        if self.output:
+            write(f"\ncProfile statistics: {self.output}\n")
+
+        ofile.flush()
+
+
+# -----------------------------------------------------------------------------
+#
+#                               MODULE FUNCTIONS
+#
+# -----------------------------------------------------------------------------
+
+
+def enable(output: Optional[str] = None) -> Profiler:
+    """
+    Enable profiling and return the new profiler; `output` is the optional
+    cProfile statistics file.
+    """
+    global _profiler
+    _profiler = Profiler(output=output)
+    return _profiler
+
+
+def disable() -> Optional[Profiler]:
+    """
+    Disable profiling, writing the cProfile statistics file if any, and
+    return the profiler.
+    """
+    global _profiler
+    profiler, _profiler = _profiler, None
+    if profiler:
+        profiler.stop()
+        if profiler.output:
+            profiler.dump_stats()
+    return profiler
+
+
+def active() -> Optional[Profiler]:
+    """ returns the profiler while profiling is enabled """
+    return _profiler
+
+
+def phase(name: str):
+    """ returns the context manager that times the named phase """
+    return _phase(_profiler, name) if _profiler else _NO_PHASE
+
+
+@contextmanager
+def _phase(profiler: Profiler, name: str):
+    """ times the phase """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.add_phase(name, time.perf_counter() - start)
+
+
+def timed(name: str) -> Callable:
+    """ decorator that times each call of the function as the named phase """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _profiler:
+                return func(*args, **kwargs)
+            with _phase(_profiler, name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def count(name: str, value: Optional[int] = 1):
+    """ add to the named counter while profiling is enabled """
+    if _profiler:
+        _profiler.add_count(name, value)
+
+
+@contextmanager
+def thread_profile(loop: asyncio.AbstractEventLoop):
+    """
+    Collects the cProfile statistics of the thread running the event loop,
+    when profiling with a cProfile statistics file is enabled.
+    """
+    profiler = _profiler
+    if not (profiler and profiler.output):
+        yield
+        return
+
+    prof = cProfile.Profile()
+    with profiler._lock:
+        profiler._loop_cprofiles.append((prof, loop))
+
+    prof.enable()
+    try:
+        yield
+    finally:
+        prof.disable()
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """ returns the event loop running in the calling thread, if any """
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+async def _disable(prof: cProfile.Profile):
+    """ disable the cProfile in the thread running the coroutine """
+    prof.disable()
+
+
+def _enable_from_env():
+    """ enable profiling, reported at exit, when $PYZAYO_PROFILE is set """
+    if consts.ZAYO_PROFILE in ("", "0"):
+        return
+
+    profiler = enable(output=consts.ZAYO_PROFILE_OUTPUT)
+
+    def report():
+        disable()
+        profiler.report()
+
+    atexit.register(report)
+
+
+_enable_from_env()
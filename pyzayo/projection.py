@@ -0,0 +1,72 @@
+"""
+This module contains the field projection used by the client to drop the
+record fields that are not needed, such as the notification "emailBody" HTML
+or the service component "locations", as soon as each page is decoded; so
+that bulk pulls do not retain them in memory.
+
+The fields are given as dotted paths; a path through a list applies to each
+item of the list.  For example "components.locations" drops the locations of
+each service component.
+
+Examples
+--------
+    from pyzayo import ZayoClient
+    from pyzayo import consts
+
+    zapi = ZayoClient(
+        projections={consts.ZAYO_SM_ROUTE_SERVICES: ["components.locations"]}
+    )
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, Iterable, Callable
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["make_projection", "Projection"]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# A projection modifies a record, in API dict form, in place.
+Projection = Callable[[Dict], None]
+
+
+def make_projection(exclude: Iterable[str]) -> Projection:
+    """
+    Returns the projection that drops the `exclude` fields, each a dotted
+    path, from a record in API dict form.
+    """
+    paths = [tuple(field.split(".")) for field in exclude]
+
+    def project(rec: Dict):
+        """ drop the excluded fields of the record """
+        for path in paths:
+            _drop(rec, path)
+
+    return project
+
+
+def _drop(value, path: tuple):
+    """ drop the field at the path of the dict value, or of each list item """
+    if isinstance(value, list):
+        for item in value:
+            _drop(item, path)
+        return
+
+    if not isinstance(value, dict):
+        return
+
+    name, rest = path[0], path[1:]
+    if not rest:
+        value.pop(name, None)
+    elif name in value:
+        _drop(value[name], rest)
@@ -0,0 +1,270 @@
+"""
+This module contains the ZayoProxy, a local caching HTTP proxy service for the
+Zayo API used by the "serve" command.
+
+Many consumers can send their requests to the proxy, using the same routes and
+request shapes as the Zayo API, in place of each consumer accessing the Zayo
+API with its own token.  The proxy forwards the requests upstream using a
+single client, and therefore a single token and connection pool, with:
+
+    * a shared response cache, see `pyzayo.cache.TTLCache`
+    * request coalescing, so that concurrent identical requests are sent
+      upstream once
+    * a global upstream rate limit, see `pyzayo.ratelimit.TokenBucket`
+
+so that the upstream load does not depend on the number of consumers.
+
+The proxy routes are those of the Zayo API, either relative to the proxy root
+or to the Zayo API base path; for example both of
+
+    POST http://localhost:8080/maintenance-cases
+    POST http://localhost:8080/services/service-management/v1/maintenance-cases
+
+The route "-/stats" returns the proxy cache and upstream statistics.
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, Optional, Tuple, Callable
+from urllib.parse import urlsplit
+from http import HTTPStatus
+import asyncio
+import json
+import re
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import httpx
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo import consts
+from pyzayo.cache import TTLCache
+from pyzayo.ratelimit import TokenBucket
+from pyzayo.httpserver import (
+    BadRequest,
+    Response,
+    MAX_LINE,
+    read_request,
+    write_response,
+)
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["ZayoProxy", "PROXY_ROUTES"]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# The proxied routes: the HTTP method and the route pattern.
+PROXY_ROUTES = (
+    ("POST", re.compile(re.escape(consts.ZAYO_SM_ROUTE_MTC_CASES) + "$")),
+    ("POST", re.compile(re.escape(consts.ZAYO_SM_ROUTE_MTC_IMPACTS) + "$")),
+    ("POST", re.compile(re.escape(consts.ZAYO_SM_ROUTE_SERVICES) + "$")),
+    ("GET", re.compile(r"maintenance-cases/[^/]+/notifications$")),
+    ("GET", re.compile(r"maintenance-cases/notifications/[^/]+$")),
+)
+
+# The Zayo API base path, optionally used by consumers as the proxy base path.
+_API_BASE_PATH = urlsplit(consts.ZAYO_URL_SM).path
+
+# A proxy response: (status code, content-type, content)
+ProxyResponse = Response
+
+
+class ZayoProxy(object):
+    """
+    Local caching proxy service for the Zayo API.
+
+    Parameters
+    ----------
+    client: ZayoClient
+        The client used to send the requests upstream.
+
+    ttl: float
+        The number of seconds a response is cached.
+
+    rate: float
+        The maximum number of upstream requests per second.
+
+    burst: int, optional
+        The maximum number of upstream requests sent without waiting, see
+        `TokenBucket`.
+
+    max_entries: int
+        The maximum number of cached responses.
+    """
+
+    def __init__(
+        self,
+        client,
+        ttl: Optional[float] = 300.0,
+        rate: Optional[float] = 5.0,
+        burst: Optional[int] = None,
+        max_entries: Optional[int] = 4096,
+    ):
+        """ create the cache and rate limiter """
+        self.client = client
+        self.cache = TTLCache(ttl=ttl, max_entries=max_entries)
+        self.limiter = TokenBucket(rate=rate, burst=burst)
+        self.stats = {"requests": 0, "upstream": 0, "upstream_errors": 0}
+
+    # -------------------------------------------------------------------------
+    #                               SERVER
+    # -------------------------------------------------------------------------
+
+    def run(
+        self,
+        host: Optional[str] = "127.0.0.1",
+        port: Optional[int] = 8080,
+        on_start: Optional[Callable] = None,
+    ):
+        """
+        Run the proxy service on the client loop thread, blocking the calling
+        thread until the service is interrupted.  The `on_start` function, if
+        provided, is called with the asyncio server once it is listening.
+        """
+        future = self.client._loop_thread.submit(self.serve(host, port, on_start))
+        try:
+            future.result()
+        except KeyboardInterrupt:
+            future.cancel()
+
+    async def serve(self, host: str, port: int, on_start: Optional[Callable] = None):
+        """ coroutine that runs the proxy service until cancelled """
+        server = await asyncio.start_server(
+            self._handle_connection, host, port, limit=MAX_LINE
+        )
+        async with server:
+            if on_start:
+                on_start(server)
+            await server.serve_forever()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        """ serve the HTTP/1.1 requests of a client connection """
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except BadRequest as exc:
+                    write_response(writer, _error(HTTPStatus.BAD_REQUEST, str(exc)))
+                    break
+
+                if request is None:
+                    break
+
+                method, target, headers, body = request
+                response, cache_state = await self.handle(method, target, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                write_response(
+                    writer, response, {"X-Cache": cache_state}, keep_alive=keep_alive
+                )
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+
+        finally:
+            writer.close()
+
+    # -------------------------------------------------------------------------
+    #                               REQUESTS
+    # -------------------------------------------------------------------------
+
+    async def handle(
+        self, method: str, target: str, body: bytes
+    ) -> Tuple[ProxyResponse, str]:
+        """
+        Returns the response to the request, from the cache or upstream, and
+        the cache state: "HIT", "MISS", or "BYPASS" for responses that are not
+        cacheable.
+        """
+        self.stats["requests"] += 1
+        route = _route(target)
+
+        if route == "-/stats":
+            stats = {**self.stats, **self.cache.stats, "cached": len(self.cache)}
+            return _json_response(HTTPStatus.OK, stats), "BYPASS"
+
+        methods = [meth for meth, pattern in PROXY_ROUTES if pattern.match(route)]
+        if not methods:
+            return _error(HTTPStatus.NOT_FOUND, f"Unknown route: {route}"), "BYPASS"
+
+        if method not in methods:
+            return _error(HTTPStatus.METHOD_NOT_ALLOWED, method), "BYPASS"
+
+        payload = None
+        if method == "POST":
+            try:
+                payload = json.loads(body or b"{}")
+            except ValueError:
+                return _error(HTTPStatus.BAD_REQUEST, "Invalid JSON body"), "BYPASS"
+
+        key = (method, route, json.dumps(payload, sort_keys=True))
+        cache_state = "HIT" if key in self.cache else "MISS"
+
+        response = await self.cache.get_or_fetch(
+            key,
+            lambda: self._fetch_upstream(method, route, payload),
+            cacheable=lambda resp: resp[0] == HTTPStatus.OK,
+        )
+        return response, cache_state
+
+    async def _fetch_upstream(
+        self, method: str, route: str, payload: Optional[Dict]
+    ) -> ProxyResponse:
+        """ send the request upstream, subject to the rate limit """
+        async with self.limiter:
+            self.stats["upstream"] += 1
+            try:
+                res = await self.client.api.request(method, route, json=payload)
+            except httpx.HTTPError as exc:
+                self.stats["upstream_errors"] += 1
+                return _error(HTTPStatus.BAD_GATEWAY, f"Upstream error: {exc!r}")
+
+        return (
+            res.status_code,
+            res.headers.get("content-type", "application/json"),
+            res.content,
+        )
+
+
+# -----------------------------------------------------------------------------
+#
+#                               MODULE FUNCTIONS
+#
+# -----------------------------------------------------------------------------
+
+
+def _route(target: str) -> str:
+    """ returns the API route of the request target """
+    path = urlsplit(target).path
+    if path.startswith(_API_BASE_PATH):
+        path = path[len(_API_BASE_PATH) :]
+    return path.strip("/")
+
+
+def _json_response(status: int, body) -> ProxyResponse:
+    """ returns the JSON response """
+    return int(status), "application/json", json.dumps(body).encode()
+
+
+def _error(status: HTTPStatus, message: str) -> ProxyResponse:
+    """ returns the JSON error response """
+    return _json_response(status, {"error": status.phrase, "message": message})
@@ -0,0 +1,97 @@
+"""
+This module contains the TokenBucket rate limiter used to bound the rate of
+requests sent upstream to the Zayo API, regardless of the number of concurrent
+callers.
+
+Examples
+--------
+    limiter = TokenBucket(rate=5, burst=10)
+
+    async def fetch(url):
+        async with limiter:
+            return await api.get(url)
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional
+import asyncio
+import time
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["TokenBucket"]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class TokenBucket(object):
+    """
+    Asyncio token-bucket rate limiter.  Tokens are added at `rate` per second
+    up to `burst` tokens; each acquire consumes a token, waiting until one is
+    available.  Waiters are served in arrival order.
+
+    Parameters
+    ----------
+    rate: float
+        The sustained number of acquisitions per second.
+
+    burst: int, optional
+        The maximum number of tokens, that is acquisitions allowed without
+        waiting; by default the rate, rounded up.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """ create the bucket full of tokens """
+        if rate <= 0:
+            raise ValueError(f"Invalid rate: {rate}")
+
+        self.rate = rate
+        self.burst = burst or max(1, int(-(-rate // 1)))
+        self.waited = 0.0
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self):
+        """ add the tokens accrued since the last update """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """ wait until a token is available and consume it """
+
+        # the lock is created on first use so that it is bound to the loop
+        # of the caller rather than the loop, if any, of the creator.
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                delay = (1 - self._tokens) / self.rate
+                self.waited += delay
+                await asyncio.sleep(delay)
+                self._refill()
+
+            self._tokens -= 1
+
+    async def __aenter__(self):
+        """ acquire a token """
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """ tokens are not returned """
+        pass
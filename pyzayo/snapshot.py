@@ -0,0 +1,518 @@
+"""
+This module contains the offline snapshot support.  A snapshot captures the
+maintenance cases, impacts, notifications (and their details), and the service
+inventory records into a single file.  The `SnapshotTransport` serves the Zayo
+API routes from a snapshot so that every ZayoClient method, and therefore every
+zayocli command, can be used without network access or credentials.
+
+File Format
+-----------
+The snapshot file is memory-mapped when read, and consists of:
+
+    * a fixed size header: magic, format version, index offset and length
+    * each record as an individually zlib compressed JSON blob
+    * the zlib compressed JSON index
+
+The index provides the (offset, length) of each record blob per collection,
+the record positions keyed by the fields used as API request filters, and the
+record positions ordered by the fields used by the API `orderBy` criteria.  A
+record is only decompressed when it is selected by a request.
+
+Examples
+--------
+    from pyzayo import ZayoClient
+    from pyzayo.snapshot import save_snapshot, SnapshotTransport
+
+    save_snapshot(ZayoClient(), "zayo.snap")
+
+    zapi = ZayoClient(transport=SnapshotTransport("zayo.snap"))
+    zapi.get_case_details("TNN-0003153584")
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, List, Optional, Union, Tuple, Callable, Sequence
+from collections import defaultdict
+from datetime import datetime, timezone
+import tempfile
+import struct
+import json
+import os
+import mmap
+import zlib
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import httpx
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo import consts
+from pyzayo.consts import CaseStatusOptions
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "Snapshot",
+    "SnapshotWriter",
+    "SnapshotTransport",
+    "SnapshotError",
+    "save_snapshot",
+]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+SNAPSHOT_MAGIC = b"PYZAYOSN"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct("<8sHQQ")
+
+# The API route served by each record collection.
+COLLECTION_ROUTES = {
+    consts.ZAYO_SM_ROUTE_MTC_CASES: "cases",
+    consts.ZAYO_SM_ROUTE_MTC_IMPACTS: "impacts",
+    consts.ZAYO_SM_ROUTE_SERVICES: "services",
+}
+
+# The record fields, per collection, that are indexed for request filters.
+INDEXED_FIELDS = {
+    "cases": ("caseNumber", "status", "urgency"),
+    "impacts": ("caseNumber", "circuitId"),
+    "services": ("status", "productGroup", "productCategory", "product", "term"),
+    "notifications": ("caseNumber",),
+    "notification_details": ("name",),
+}
+
+# The record fields, per collection, that are pre-sorted for `orderBy`.
+ORDERED_FIELDS = {"cases": ("primaryDate",), "impacts": (), "services": ()}
+
+
+class SnapshotError(ValueError):
+    """ The file is not a snapshot, or the snapshot version is not supported """
+
+    pass
+
+
+class SnapshotWriter(object):
+    """
+    Writes records into a new snapshot file.  Records are written as they are
+    added so that only the index is held in memory.  The records are written
+    to a temporary file in the same directory, which replaces the snapshot
+    file on `close`; so that a failed save, see `abort`, leaves any existing
+    snapshot file as it was.
+
+    Parameters
+    ----------
+    filepath: str
+        The snapshot file path
+    """
+
+    def __init__(self, filepath: str):
+        """ create the temporary file and reserve the header """
+        self.filepath = filepath
+        fd, self._tmppath = tempfile.mkstemp(
+            prefix=f".{os.path.basename(filepath)}.",
+            suffix=".tmp",
+            dir=os.path.dirname(os.path.abspath(filepath)),
+        )
+        self._ofile = os.fdopen(fd, "wb")
+        self._ofile.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, 0))
+        self._blobs = defaultdict(list)
+        self._keys = defaultdict(lambda: defaultdict(list))
+        self._orders = defaultdict(list)
+
+    def add(self, collection: str, rec: Dict, **keys):
+        """
+        Add the record to the collection.
+
+        Parameters
+        ----------
+        collection: str
+            The collection name, one of INDEXED_FIELDS
+
+        rec: dict
+            The API record
+
+        Other Parameters
+        ----------------
+        Index key values that are not fields in the record, for example the
+        case number of a notification record.
+        """
+        blob = zlib.compress(json.dumps(rec, separators=(",", ":")).encode())
+        pos = len(self._blobs[collection])
+        self._blobs[collection].append((self._ofile.tell(), len(blob)))
+        self._ofile.write(blob)
+
+        for field in INDEXED_FIELDS[collection]:
+            value = keys.get(field, rec.get(field))
+            if value is not None:
+                self._keys[f"{collection}.{field}"][str(value)].append(pos)
+
+        for field in ORDERED_FIELDS.get(collection, ()):
+            self._orders[f"{collection}.{field}"].append((rec.get(field) or "", pos))
+
+    def close(self):
+        """ write the index and header, and replace the snapshot file """
+        index = {
+            "version": SNAPSHOT_VERSION,
+            "created": datetime.now(timezone.utc).isoformat(),
+            "collections": self._blobs,
+            "keys": self._keys,
+            "orders": {
+                name: [pos for _, pos in sorted(values)]
+                for name, values in self._orders.items()
+            },
+        }
+        blob = zlib.compress(json.dumps(index, separators=(",", ":")).encode())
+        offset = self._ofile.tell()
+        self._ofile.write(blob)
+        self._ofile.seek(0)
+        self._ofile.write(
+            SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, offset, len(blob))
+        )
+        self._ofile.close()
+        os.replace(self._tmppath, self.filepath)
+
+    def abort(self):
+        """ close and remove the temporary file, leaving the snapshot file as is """
+        self._ofile.close()
+        os.unlink(self._tmppath)
+
+    def counts(self) -> Dict[str, int]:
+        """ returns the number of records added per collection """
+        return {name: len(blobs) for name, blobs in self._blobs.items()}
+
+
+class Snapshot(object):
+    """
+    Read access to a snapshot file.  The file is memory-mapped and records are
+    decompressed only when selected.
+
+    Parameters
+    ----------
+    filepath: str
+        The snapshot file path
+
+    Raises
+    ------
+    SnapshotError
+        The file is not a snapshot, or the version is not supported.
+    """
+
+    def __init__(self, filepath: str):
+        """ map the file and load the index """
+        self.filepath = filepath
+        with open(filepath, "rb") as ifile:
+            self._mm = mmap.mmap(ifile.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mm) < SNAPSHOT_HEADER.size:
+            raise SnapshotError(f"Not a snapshot file: {filepath}")
+
+        magic, version, offset, length = SNAPSHOT_HEADER.unpack_from(self._mm, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError(f"Not a snapshot file: {filepath}")
+
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(f"Unsupported snapshot version {version}: {filepath}")
+
+        self.index = json.loads(zlib.decompress(self._mm[offset : offset + length]))
+
+        # the positions of the selections that required the records to be
+        # scanned, so that each page of the selection scans them only once.
+        self._selections: Dict[Tuple, List[int]] = dict()
+
+    @property
+    def created(self) -> str:
+        """ returns the ISO timestamp of when the snapshot was saved """
+        return self.index["created"]
+
+    def count(self, collection: str) -> int:
+        """ returns the number of records in the collection """
+        return len(self.index["collections"].get(collection, ()))
+
+    def record(self, collection: str, pos: int) -> Dict:
+        """ returns the record at the position within the collection """
+        offset, length = self.index["collections"][collection][pos]
+        return json.loads(zlib.decompress(self._mm[offset : offset + length]))
+
+    def lookup(self, collection: str, field: str, value) -> List[Dict]:
+        """ returns the records whose indexed `field` matches `value` """
+        positions = self.index["keys"].get(f"{collection}.{field}", {})
+        return [self.record(collection, pos) for pos in positions.get(str(value), ())]
+
+    def select(
+        self,
+        collection: str,
+        filters: Optional[Dict] = None,
+        order_by: Optional[List[str]] = None,
+        skip: Optional[int] = 0,
+        top: Optional[int] = None,
+    ) -> Tuple[int, List[Dict]]:
+        """
+        Select records in the manner of the API list routes.
+
+        Parameters
+        ----------
+        collection: str
+            The collection name
+
+        filters: dict, optional
+            Field-value criteria; all must match.  Indexed fields are used to
+            select candidate records, any others are matched by scanning the
+            candidates.
+
+        order_by: List[str], optional
+            The API `orderBy` criteria, for example ["primaryDate asc"]
+
+        skip: int, optional
+            The number of matching records to skip
+
+        top: int, optional
+            The maximum number of records to return, all when None.
+
+        Returns
+        -------
+        Tuple (total-count, records)
+        """
+        positions = self._select_positions(collection, filters, order_by)
+        end = None if top is None else skip + top
+        return (
+            len(positions),
+            [self.record(collection, pos) for pos in positions[skip:end]],
+        )
+
+    def _select_positions(
+        self,
+        collection: str,
+        filters: Optional[Dict],
+        order_by: Optional[List[str]],
+    ) -> Sequence[int]:
+        """ returns the ordered positions of the records matching the filters """
+        select_key = (
+            collection,
+            json.dumps(filters, sort_keys=True, default=str),
+            tuple(order_by or ()),
+        )
+        if select_key in self._selections:
+            return self._selections[select_key]
+
+        filters = dict(filters or {})
+        positions = None
+
+        for field in list(filters):
+            keys = self.index["keys"].get(f"{collection}.{field}")
+            if keys is None:
+                continue
+
+            matches = keys.get(str(filters.pop(field)), [])
+            positions = (
+                matches
+                if positions is None
+                else sorted(set(positions).intersection(matches))
+            )
+
+        if positions is None:
+            positions = range(self.count(collection))
+
+        sort_field, descending, get_sorted = self._order_by(collection, order_by)
+        if get_sorted and isinstance(positions, range):
+            positions = get_sorted[::-1] if descending else get_sorted
+
+        elif get_sorted:
+            rank = {pos: idx for idx, pos in enumerate(get_sorted)}
+            positions = sorted(positions, key=rank.__getitem__, reverse=descending)
+
+        if not filters and not (sort_field and not get_sorted):
+            return positions
+
+        # the remaining criteria require the records; these are scanned once
+        # and the matching positions kept for the following pages.
+
+        matches = list()
+        for pos in positions:
+            rec = self.record(collection, pos)
+            if all(rec.get(field) == value for field, value in filters.items()):
+                matches.append(((rec.get(sort_field) or "") if sort_field else "", pos))
+
+        if sort_field and not get_sorted:
+            matches.sort(key=lambda match: match[0], reverse=descending)
+
+        positions = [pos for _, pos in matches]
+        self._selections[select_key] = positions
+        return positions
+
+    def _order_by(self, collection, order_by) -> Tuple[Optional[str], bool, list]:
+        """ returns the (field, descending, pre-sorted positions) of the order """
+        if not order_by:
+            return None, False, []
+
+        field, _, direction = order_by[0].partition(" ")
+        descending = direction.strip().lower() == "desc"
+        return (
+            field,
+            descending,
+            self.index["orders"].get(f"{collection}.{field}", []),
+        )
+
+    def close(self):
+        """ unmap the file """
+        self._mm.close()
+
+
+# -----------------------------------------------------------------------------
+#
+#                               TRANSPORT
+#
+# -----------------------------------------------------------------------------
+
+
+class SnapshotTransport(httpx.AsyncBaseTransport):
+    """
+    HTTPx transport that serves the Zayo API routes from a snapshot file, for
+    use with the ZayoAPI client.  Since no network is used, the transport does
+    not require authentication.
+
+    Parameters
+    ----------
+    snapshot: str or Snapshot
+        The snapshot file path or instance
+    """
+
+    requires_auth = False
+
+    def __init__(self, snapshot: Union[str, Snapshot]):
+        """ open the snapshot file if given a file path """
+        if not isinstance(snapshot, Snapshot):
+            snapshot = Snapshot(snapshot)
+
+        self.snapshot = snapshot
+        self._base_path = httpx.URL(consts.ZAYO_URL_SM).path
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """ serve the request from the snapshot """
+        route = request.url.path.partition(self._base_path)[2].strip("/")
+        parts = route.split("/")
+
+        if request.method == "POST" and route in COLLECTION_ROUTES:
+            body = json.loads(request.content or b"{}")
+            paging = body.get("paging") or {}
+            total, recs = self.snapshot.select(
+                COLLECTION_ROUTES[route],
+                filters=body.get("filter"),
+                order_by=body.get("orderBy"),
+                skip=paging.get("skip", 0),
+                top=paging.get("top", consts.MAX_TOP_COUNT),
+            )
+            data = {"metadata": {"totalRecordCount": total}, "records": recs}
+            return httpx.Response(200, json={"data": data})
+
+        is_notifs_route = len(parts) == 3 and parts[0] == consts.ZAYO_SM_ROUTE_MTC_CASES
+        if request.method == "GET" and is_notifs_route:
+
+            # maintenance-cases/notifications/{name}
+            if parts[1] == "notifications":
+                recs = self.snapshot.lookup("notification_details", "name", parts[2])
+                if recs:
+                    return httpx.Response(200, json={"data": recs[0]})
+                return httpx.Response(404, json={"error": f"Not found: {parts[2]}"})
+
+            # maintenance-cases/{case_num}/notifications
+            if parts[2] == "notifications":
+                recs = self.snapshot.lookup("notifications", "caseNumber", parts[1])
+                return httpx.Response(200, json={"data": recs})
+
+        return httpx.Response(404, json={"error": f"Route not in snapshot: {route}"})
+
+    async def aclose(self):
+        """ close the snapshot file """
+        self.snapshot.close()
+
+
+# -----------------------------------------------------------------------------
+#
+#                               SAVE SNAPSHOT
+#
+# -----------------------------------------------------------------------------
+
+
+def save_snapshot(
+    client,
+    filepath: str,
+    all_notifications: Optional[bool] = False,
+    on_progress: Optional[Callable[[str, int], None]] = None,
+) -> Dict[str, int]:
+    """
+    Save the cases, impacts, notifications, and service inventory records into
+    a snapshot file.
+
+    Parameters
+    ----------
+    client: ZayoClient
+        The client used to retrieve the records.
+
+    filepath: str
+        The snapshot file path
+
+    all_notifications: bool
+        When True the notifications of every case are saved.  By default only
+        the cases that are not closed are used since each case requires its
+        own notification requests.
+
+    on_progress: Callable, optional
+        Called with (collection-name, record-count) after each page is saved.
+
+    Returns
+    -------
+    Dictionary of collection name to the number of records saved.
+
+    Raises
+    ------
+    Any error retrieving the records; the snapshot file is then not changed.
+    """
+    writer = SnapshotWriter(filepath)
+    notif_case_nums = list()
+
+    def add_pages(collection, pages):
+        """ add each record as the pages arrive """
+        for page in pages:
+            for rec in page:
+                writer.add(collection, rec)
+            if on_progress:
+                on_progress(collection, writer.counts()[collection])
+
+    try:
+        for page in client.iter_case_pages():
+            for rec in page:
+                writer.add("cases", rec)
+                if all_notifications or rec["status"] != CaseStatusOptions.closed:
+                    notif_case_nums.append(rec["caseNumber"])
+            if on_progress:
+                on_progress("cases", writer.counts()["cases"])
+
+        add_pages("impacts", client.iter_impact_pages())
+        add_pages("services", client.iter_service_pages())
+
+        case_notifs = client.get_cases_notifications(by_case_nums=notif_case_nums)
+        for case_num, (notifs, details) in case_notifs.items():
+            for rec in notifs:
+                writer.add("notifications", rec, caseNumber=case_num)
+            for rec in details:
+                writer.add("notification_details", rec)
+
+    except BaseException:
+        writer.abort()
+        raise
+
+    writer.close()
+    return writer.counts()
@@ -0,0 +1,99 @@
+"""
+This module contains the ServiceJoin, used to enrich the maintenance impact
+and case records with the service inventory records of the impacted circuits;
+for example the service name, bandwidth, product, and A/Z locations.
+
+The inventory is loaded once, and its hash map of the normalized circuit IDs to
+the inventory rows is used, so that joining the impacts is a single pass rather
+than an inventory lookup, or download, per impact.
+
+Examples
+--------
+    from pyzayo import ZayoClient
+    from pyzayo.svcinv_join import ServiceJoin
+
+    zapi = ZayoClient()
+    join = ServiceJoin(zapi.get_service_inventory())
+
+    for impact, service in join.join_impacts(zapi.get_impacts()):
+        print(impact["circuitId"], service and service["service_name"])
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, List, Iterable, Iterator, Tuple, Optional, Callable
+from collections import defaultdict
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo.svcinv_store import ServiceInventory, ServiceRow
+from pyzayo.circuit_id import normalize_circuit_id
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["ServiceJoin"]
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class ServiceJoin(object):
+    """
+    Hash-join of the maintenance impact records with the service inventory.
+
+    Parameters
+    ----------
+    inventory: ServiceInventory
+        The service inventory, for example from
+        `ZayoClient.get_service_inventory`.
+
+    normalize: Callable, optional
+        Used to normalize the circuit IDs of both the inventory and the
+        impacts; `normalize_circuit_id` by default.
+    """
+
+    def __init__(
+        self,
+        inventory: ServiceInventory,
+        normalize: Optional[Callable[[str], str]] = None,
+    ):
+        """ use the inventory normalized circuit ID hash map """
+        self.inventory = inventory
+        self.normalize = normalize = normalize or normalize_circuit_id
+        self._circuit_rows = inventory.circuit_map(normalize)
+
+    def service(self, circuit_id: str) -> Optional[ServiceRow]:
+        """ returns the inventory row of the circuit, if any """
+        pos = self._circuit_rows.get(self.normalize(circuit_id))
+        return None if pos is None else self.inventory.row(pos)
+
+    def join_impacts(
+        self, impacts: Iterable[Dict]
+    ) -> Iterator[Tuple[Dict, Optional[ServiceRow]]]:
+        """
+        Generator that yields each impact record, in API dict form, with the
+        inventory row of its circuit; or None when the circuit is not in the
+        inventory.
+        """
+        for impact in impacts:
+            yield impact, self.service(impact["circuitId"])
+
+    def case_services(self, impacts: Iterable[Dict]) -> Dict[str, List[ServiceRow]]:
+        """
+        Returns the dictionary of case number to the inventory rows of its
+        impacted circuits, from the impact records in API dict form.
+        """
+        services = defaultdict(list)
+        for impact, service in self.join_impacts(impacts):
+            if service is not None:
+                services[impact["caseNumber"]].append(service)
+        return services
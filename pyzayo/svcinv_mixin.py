@@ -11,7 +11,7 @@ References
 # System Imports
 # -----------------------------------------------------------------------------
 
-from typing import List, Dict
+from typing import List, Dict, Iterator
 
 # -----------------------------------------------------------------------------
 # Public Imports
@@ -25,6 +25,7 @@ from first import first
 
 from pyzayo.base_client import ZayoClientBase
 from pyzayo.consts import ZAYO_SM_ROUTE_SERVICES
+from pyzayo.svcinv_store import ServiceInventory
 
 # -----------------------------------------------------------------------------
 # Module Exports
@@ -55,6 +56,28 @@ class ZayoServiceInventoryMixin(ZayoClientBase):
         """
         return self.paginate_records(url=ZAYO_SM_ROUTE_SERVICES, **params)
 
+    def iter_service_pages(self, **params) -> Iterator[List[Dict]]:
+        """
+        Generator that yields the service-inventory records one page at a
+        time, as they arrive; see `iter_pages`.
+
+        Other Parameters
+        ----------------
+        Same as get_services() method, see for details.
+        """
+        return self.iter_pages(url=ZAYO_SM_ROUTE_SERVICES, **params)
+
+    def get_service_inventory(self, **params) -> ServiceInventory:
+        """
+        Retrieve the service-inventory records into a compact, columnar,
+        ServiceInventory store; each page is ingested as it arrives.
+
+        Other Parameters
+        ----------------
+        Same as get_services() method, see for details.
+        """
+        return ServiceInventory(self.iter_service_pages(**params))
+
     def get_service_by_circuit_id(self, by_circuit_id: str, **params):
         """
         Locate the service associated with the given ciruid ID.
@@ -0,0 +1,374 @@
+"""
+This module contains the ServiceInventory container, a compact columnar
+in-memory store of the service inventory records.
+
+The records are flattened into the `pyzayo.export.SERVICE_FIELDS` schema as
+the pages are ingested; each column is dictionary-encoded: the distinct values
+are interned once and each row holds only an integer code in an array.  The
+repeated status, product, bandwidth, CLLI, city, and state strings are
+therefore stored once regardless of the inventory size.  The bandwidth is also
+stored as a numeric column, in Mbps.
+
+Filtering and group-by counts operate on the integer codes, using NumPy when
+installed.  Rows are materialized as dicts only when accessed.  The circuit ID
+lookup map is built only when first used, and is shared by the lookups, such as
+the `pyzayo.svcinv_join.ServiceJoin`, that use the same normalization.
+
+Examples
+--------
+    from pyzayo import ZayoClient
+
+    inventory = ZayoClient().get_service_inventory()
+
+    active = inventory.by_status("Active")
+    active.by_location(state="CO").group_counts("product_group")
+
+    for row in active.by_product_group("Wavelengths"):
+        print(row["circuit_id"], row["bandwidth"])
+"""
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, List, Iterable, Iterator, Optional, Callable
+from collections.abc import Mapping
+from collections import Counter
+from array import array
+import re
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from pyzayo.export import SERVICE_FIELDS, flatten_service
+from pyzayo.circuit_id import normalize_circuit_id
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["ServiceInventory", "ServiceView", "ServiceRow", "parse_bandwidth"]
+
+
+# -----------------------------------------------------------------------------
+#
+#                               CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+_BANDWIDTH_RE = re.compile(r"([\d.]+)\s*([kmgt]?)(?:bps|b)?", re.IGNORECASE)
+_BANDWIDTH_MBPS = {"k": 1e-3, "": 1.0, "m": 1.0, "g": 1e3, "t": 1e6}
+
+
+def parse_bandwidth(bandwidth: Optional[str]) -> float:
+    """
+    Returns the bandwidth string value, for example "10 Gbps", in Mbps; or NaN
+    if the value cannot be parsed.
+    """
+    mo = _BANDWIDTH_RE.match((bandwidth or "").strip())
+    if not mo:
+        return float("nan")
+
+    return float(mo.group(1)) * _BANDWIDTH_MBPS[mo.group(2).lower()]
+
+
+class _Column(object):
+    """ A dictionary-encoded column of string values """
+
+    __slots__ = ("values", "lookup", "codes")
+
+    def __init__(self):
+        """ code 0 is reserved for None """
+        self.values: List[Optional[str]] = [None]
+        self.lookup: Dict[Optional[str], int] = {None: 0}
+        self.codes = array("I")
+
+    def append(self, value: Optional[str]):
+        """ append the value, adding it to the dictionary if not present """
+        code = self.lookup.get(value)
+        if code is None:
+            code = self.lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def encode(self, values: Iterable[str]) -> List[int]:
+        """ returns the codes of the values present in the dictionary """
+        return [self.lookup[val] for val in values if val in self.lookup]
+
+
+class ServiceRow(Mapping):
+    """
+    A read-only, lazily materialized, dict view of one inventory row keyed by
+    the SERVICE_FIELDS names and the "bandwidth_mbps" numeric field.
+    """
+
+    __slots__ = ("_inventory", "_pos")
+
+    def __init__(self, inventory: "ServiceInventory", pos: int):
+        """ refer to the row position in the inventory """
+        self._inventory = inventory
+        self._pos = pos
+
+    def __getitem__(self, field: str):
+        """ decode the field value """
+        if field == "bandwidth_mbps":
+            return self._inventory._bandwidth_mbps[self._pos]
+
+        column = self._inventory._columns[field]
+        return column.values[column.codes[self._pos]]
+
+    def __iter__(self) -> Iterator[str]:
+        """ iterate over the field names """
+        yield from SERVICE_FIELDS
+        yield "bandwidth_mbps"
+
+    def __len__(self) -> int:
+        """ the number of fields """
+        return len(SERVICE_FIELDS) + 1
+
+    def __repr__(self):
+        """ show the materialized row """
+        return f"ServiceRow({dict(self)!r})"
+
+
+class ServiceView(object):
+    """
+    A selection of inventory rows, as returned by the ServiceInventory filter
+    methods.  A view can be filtered further, iterated as ServiceRow items,
+    and used to compute group-by counts.
+    """
+
+    def __init__(self, inventory: "ServiceInventory", positions: Optional[array]):
+        """ a `positions` value of None designates all rows """
+        self._inventory = inventory
+        self._positions = positions
+
+    def __len__(self) -> int:
+        """ the number of rows in the view """
+        if self._positions is None:
+            return len(self._inventory._bandwidth_mbps)
+        return len(self._positions)
+
+    def __iter__(self) -> Iterator[ServiceRow]:
+        """ iterate the rows of the view """
+        return map(self._inventory.row, self.positions())
+
+    def positions(self) -> Iterable[int]:
+        """ the row positions of the view within the inventory """
+        if self._positions is None:
+            return range(len(self._inventory._bandwidth_mbps))
+        return self._positions
+
+    def to_dicts(self) -> List[Dict]:
+        """ materialize the rows of the view as dicts """
+        return [dict(row) for row in self]
+
+    # -------------------------------------------------------------------------
+    #                               FILTERS
+    # -------------------------------------------------------------------------
+
+    def where(self, field: str, *values: str) -> "ServiceView":
+        """
+        Returns the view of the rows whose `field` value is one of `values`.
+        """
+        column = self._inventory._columns[field]
+        return self._select(column.codes, column.encode(values))
+
+    def by_status(self, *statuses: str) -> "ServiceView":
+        """ returns the view of the rows whose status is one of `statuses` """
+        return self.where("status", *statuses)
+
+    def by_product_group(self, *groups: str) -> "ServiceView":
+        """ returns the view of the rows whose product group is one of `groups` """
+        return self.where("product_group", *groups)
+
+    def by_location(
+        self,
+        clli: Optional[str] = None,
+        city: Optional[str] = None,
+        state: Optional[str] = None,
+    ) -> "ServiceView":
+        """
+        Returns the view of the rows having either the A or Z location matching
+        all of the given location criteria.
+        """
+        criteria = {
+            col: value
+            for col, value in (("clli", clli), ("city", city), ("state", state))
+            if value is not None
+        }
+
+        def end_view(end):
+            """ the view of rows whose `end` location matches the criteria """
+            view = self
+            for col, value in criteria.items():
+                view = view.where(f"{end}_{col}", value)
+            return view
+
+        a_view, z_view = end_view("a"), end_view("z")
+
+        if np is not None:
+            positions = np.union1d(
+                np.fromiter(a_view.positions(), dtype=np.uint32),
+                np.fromiter(z_view.positions(), dtype=np.uint32),
+            )
+            return ServiceView(self._inventory, array("I", positions.tobytes()))
+
+        positions = sorted(set(a_view.positions()).union(z_view.positions()))
+        return ServiceView(self._inventory, array("I", positions))
+
+    def _select(self, codes: array, wanted: List[int]) -> "ServiceView":
+        """ returns the view of the rows within this view having wanted codes """
+        if not wanted:
+            return ServiceView(self._inventory, array("I"))
+
+        if np is not None:
+            np_codes = np.frombuffer(codes, dtype=np.uint32)
+            if self._positions is None:
+                matches = np.flatnonzero(np.isin(np_codes, wanted))
+            else:
+                np_pos = np.frombuffer(self._positions, dtype=np.uint32)
+                matches = np_pos[np.isin(np_codes[np_pos], wanted)]
+            positions = array("I", matches.astype(np.uint32).tobytes())
+            return ServiceView(self._inventory, positions)
+
+        wanted = set(wanted)
+        return ServiceView(
+            self._inventory,
+            array("I", (pos for pos in self.positions() if codes[pos] in wanted)),
+        )
+
+    # -------------------------------------------------------------------------
+    #                               AGGREGATES
+    # -------------------------------------------------------------------------
+
+    def group_counts(self, field: str) -> Dict[Optional[str], int]:
+        """
+        Returns the number of rows in the view per distinct `field` value, in
+        descending count order.
+        """
+        column = self._inventory._columns[field]
+
+        if np is not None:
+            np_codes = np.frombuffer(column.codes, dtype=np.uint32)
+            if self._positions is not None:
+                np_codes = np_codes[np.frombuffer(self._positions, dtype=np.uint32)]
+            counts = Counter(
+                dict(enumerate(np.bincount(np_codes, minlength=len(column.values))))
+            )
+        else:
+            codes = column.codes
+            counts = Counter(codes[pos] for pos in self.positions())
+
+        return {
+            column.values[code]: int(count)
+            for code, count in counts.most_common()
+            if count
+        }
+
+    def total_bandwidth_mbps(self) -> float:
+        """ returns the sum of the bandwidth of the rows, ignoring unknowns """
+        mbps = self._inventory._bandwidth_mbps
+        return sum(mbps[pos] for pos in self.positions() if mbps[pos] == mbps[pos])
+
+
+class ServiceInventory(ServiceView):
+    """
+    Compact columnar store of the service inventory records.  The inventory
+    is a ServiceView of all of its rows.
+
+    Parameters
+    ----------
+    pages: Iterable[List[Dict]], optional
+        The pages of existing-services API records to ingest, for example
+        from `ZayoClient.iter_service_pages`.
+    """
+
+    def __init__(self, pages: Optional[Iterable[List[Dict]]] = None):
+        """ create the columns and ingest the pages """
+        super().__init__(self, None)
+        self._columns = {field: _Column() for field in SERVICE_FIELDS}
+        self._bandwidth_mbps = array("d")
+        self._circuit_maps: Dict[Callable, Dict[str, int]] = dict()
+
+        for page in pages or ():
+            self.ingest(page)
+
+    def ingest(self, records: Iterable[Dict]):
+        """
+        Add the existing-services API records to the inventory.  The nested
+        API records are not retained.
+        """
+        columns = [(field, self._columns[field]) for field in SERVICE_FIELDS]
+        self._circuit_maps.clear()
+
+        for rec in records:
+            row = flatten_service(rec)
+            for field, column in columns:
+                column.append(row[field])
+
+            self._bandwidth_mbps.append(parse_bandwidth(row["bandwidth"]))
+
+    def row(self, pos: int) -> ServiceRow:
+        """ returns the row at the given position """
+        if not 0 <= pos < len(self._bandwidth_mbps):
+            raise IndexError(pos)
+        return ServiceRow(self, pos)
+
+    def column(self, field: str) -> List[Optional[str]]:
+        """ returns the decoded values of the column """
+        column = self._columns[field]
+        values = column.values
+        return [values[code] for code in column.codes]
+
+    def distinct(self, field: str) -> List[str]:
+        """ returns the distinct values of the column """
+        return [val for val in self._columns[field].values if val is not None]
+
+    def circuit_map(
+        self, normalize: Optional[Callable[[str], str]] = None
+    ) -> Dict[str, int]:
+        """
+        Returns the map of the normalized circuit IDs to their first row
+        position.  The map is built on first use, per `normalize` function,
+        and is retained until more records are ingested.
+
+        Parameters
+        ----------
+        normalize: Callable, optional
+            Used to normalize the circuit IDs; `normalize_circuit_id` by
+            default.
+        """
+        normalize = normalize or normalize_circuit_id
+        try:
+            return self._circuit_maps[normalize]
+        except KeyError:
+            pass
+
+        circuit_map: Dict[str, int] = dict()
+        column = self._columns["circuit_id"]
+        values = column.values
+        for pos, code in enumerate(column.codes):
+            if code:
+                circuit_map.setdefault(normalize(values[code]), pos)
+
+        self._circuit_maps[normalize] = circuit_map
+        return circuit_map
+
+    def find_circuit(self, circuit_id: str) -> Optional[ServiceRow]:
+        """
+        Returns the row of the service having the circuit ID, if any; the
+        circuit IDs are compared in their normalized form.
+        """
+        pos = self.circuit_map().get(normalize_circuit_id(circuit_id))
+        return None if pos is None else ServiceRow(self, pos)
@@ -42,6 +42,7 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=requirements(),
+    extras_require={"compression": ["httpx[brotli,zstd]"]},
     entry_points={"console_scripts": ["zayocli = pyzayo.cli.__main__:main"]},
     classifiers=[
         "Development Status :: 3 - Alpha",
@@ -0,0 +1,38 @@
+""" builders of the API records, in API dict form, shared by the tests """
+
+
+def case_record(
+    case_num,
+    pdate="2026-12-01",
+    from_time="22:00:00",
+    to_time="04:00:00",
+    status="Scheduled",
+    pdate_2=None,
+    pdate_3=None,
+):
+    return {
+        "caseId": case_num,
+        "caseNumber": case_num,
+        "urgency": "Planned",
+        "levelOfImpact": "Potential Service Affecting",
+        "status": status,
+        "primaryDate": pdate,
+        "x2ndPrimaryDate": pdate_2,
+        "x3rdPrimaryDate": pdate_3,
+        "fromTime": from_time,
+        "toTime": to_time,
+        "reasonForMaintenance": "fiber work",
+        "location": "Denver, CO",
+        "longitiude": None,
+        "latittude": None,
+    }
+
+
+def impact_record(case_num, circuit_id, clli_a="DNVRCO01", clli_z="CHCGIL01"):
+    return {
+        "caseNumber": case_num,
+        "circuitId": circuit_id,
+        "expectedImpact": "Outage",
+        "aLocationClli": clli_a,
+        "zLocationClli": clli_z,
+    }
@@ -0,0 +1,56 @@
+import asyncio
+import gzip
+import json
+
+import httpx
+
+from pyzayo import consts
+from pyzayo.api import ZayoAPI, ENCODING_PREFERENCE, _accept_encoding
+
+
+def test_accept_encoding_preference():
+    assert _accept_encoding("gzip, deflate, br, zstd") == "zstd, br, gzip, deflate"
+    assert _accept_encoding("deflate, gzip") == "gzip, deflate"
+    assert _accept_encoding("identity, gzip, compress") == "gzip, compress, identity"
+    assert _accept_encoding("") == ""
+
+
+def test_accept_encoding_header():
+    api = ZayoAPI(base_url="http://zayo/api")
+    encodings = [enc.strip() for enc in api.headers["accept-encoding"].split(",")]
+    assert encodings == [enc for enc in ENCODING_PREFERENCE if enc in encodings]
+    asyncio.run(api.aclose())
+
+
+def test_transfer_stats_by_route():
+    content = json.dumps({"data": ["x" * 100]}).encode()
+
+    def handle(request):
+        return httpx.Response(
+            200, headers={"Content-Encoding": "gzip"}, content=gzip.compress(content)
+        )
+
+    async def run():
+        async with ZayoAPI(
+            base_url="http://zayo/api", transport=httpx.MockTransport(handle)
+        ) as api:
+            for path in (
+                "maintenance-cases/TTN-1/notifications",
+                "maintenance-cases/TTN-2/notifications",
+                "maintenance-cases/notifications/MNN-1",
+                "existing-services",
+            ):
+                await api.get(path)
+            return api.transfer_stats
+
+    stats = asyncio.run(run())
+    assert set(stats) == {
+        consts.ZAYO_SM_ROUTE_MTC_NOTIFS_BY_CASE,
+        consts.ZAYO_SM_ROUTE_MTC_NOTIFS_BY_NAME,
+        consts.ZAYO_SM_ROUTE_SERVICES,
+    }
+    by_case = stats[consts.ZAYO_SM_ROUTE_MTC_NOTIFS_BY_CASE]
+    assert by_case["responses"] == 2
+    assert by_case["content_bytes"] == 2 * len(content)
+    assert by_case["wire_bytes"] == 2 * len(gzip.compress(content))
+    assert stats[consts.ZAYO_SM_ROUTE_SERVICES]["responses"] == 1
@@ -0,0 +1,156 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import json
+import time
+
+import httpx
+import pytest
+
+from pyzayo.auth import TokenAuth
+from pyzayo.client import ZayoClient
+
+
+class PagedTransport(httpx.MockTransport):
+    """ serves the records in pages, failing the pages at the given offsets """
+
+    requires_auth = False
+    adaptive_paging = False
+
+    def __init__(self, records, fail_skips=(), status=429):
+        super().__init__(self.handle)
+        self.records = records
+        self.fail_skips = set(fail_skips)
+        self.status = status
+
+    def handle(self, request):
+        paging = json.loads(request.content or b"{}").get("paging") or {}
+        skip, top = paging.get("skip", 0), paging.get("top", 50)
+        if top and skip in self.fail_skips:
+            return httpx.Response(self.status, json={"error": "throttled"})
+
+        data = {
+            "metadata": {"totalRecordCount": len(self.records)},
+            "records": self.records[skip : skip + top],
+        }
+        return httpx.Response(200, json={"data": data})
+
+
+RECORDS = [{"caseNumber": f"C-{num}"} for num in range(120)]
+
+
+def test_paginate_records_all_pages():
+    with ZayoClient(transport=PagedTransport(RECORDS)) as client:
+        assert client.get_cases() == RECORDS
+
+
+def test_paginate_records_raises_on_failed_page():
+    with ZayoClient(transport=PagedTransport(RECORDS, fail_skips={50})) as client:
+        with pytest.raises(httpx.HTTPStatusError) as excinfo:
+            client.get_cases()
+
+    assert excinfo.value.response.status_code == 429
+
+
+def test_iter_pages_raises_on_failed_page():
+    with ZayoClient(transport=PagedTransport(RECORDS, fail_skips={100})) as client:
+        pages = client.iter_case_pages()
+        assert len(next(pages)) == 50
+        assert len(next(pages)) == 50
+        with pytest.raises(httpx.HTTPStatusError):
+            next(pages)
+
+
+class TokenServer(object):
+    """ issues numbered tokens, slowly so that concurrent refreshes overlap """
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.issued = 0
+        self.lock = threading.Lock()
+
+    def fetch_token(self):
+        time.sleep(self.delay)
+        with self.lock:
+            self.issued += 1
+            return {"access_token": f"token-{self.issued}", "expires_in": 3600}
+
+
+class AuthTransport(httpx.MockTransport):
+    """ serves the records to the requests with the accepted tokens """
+
+    adaptive_paging = False
+
+    def __init__(self, accepted=None):
+        super().__init__(self.handle)
+        self.accepted = accepted
+        self.tokens = []
+
+    def handle(self, request):
+        token = request.headers.get("Authorization")
+        self.tokens.append(token)
+        if self.accepted is not None and token not in self.accepted:
+            return httpx.Response(401, json={"error": "Unauthorized"})
+
+        data = {"metadata": {"totalRecordCount": 1}, "records": [{"token": token}]}
+        return httpx.Response(200, json={"data": data})
+
+
+@pytest.fixture()
+def token_server(monkeypatch):
+    server = TokenServer()
+    monkeypatch.setattr(
+        ZayoClient, "_request_token", lambda self: server.fetch_token()
+    )
+    return server
+
+
+def test_expired_token_refreshed_once_by_threads(token_server):
+    with ZayoClient(transport=AuthTransport()) as client:
+        assert client.access_token == "token-1"
+        client._token_auth._expires = 0.0
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(lambda _: client.get_cases(), range(32)))
+
+        assert client._token_auth.refreshes == 2
+        assert token_server.issued == 2
+        assert all(recs == [{"token": "token-2"}] for recs in results)
+
+
+def test_unauthorized_retried_once_with_new_token(token_server):
+    transport = AuthTransport(accepted={"token-2"})
+    with ZayoClient(transport=transport) as client:
+        assert client.get_cases() == [{"token": "token-2"}]
+        assert transport.tokens[:2] == ["token-1", "token-2"]
+        assert set(transport.tokens[2:]) == {"token-2"}
+        assert client._token_auth.refreshes == 2
+
+        transport.accepted, sent = set(), len(transport.tokens)
+        with pytest.raises(httpx.HTTPStatusError) as excinfo:
+            client.get_cases()
+
+    assert excinfo.value.response.status_code == 401
+    assert transport.tokens[sent:] == ["token-2", "token-3"]
+
+
+def test_stale_token_not_refetched():
+    server = TokenServer(delay=0)
+    auth = TokenAuth(fetch_token=server.fetch_token)
+    stale = auth.refresh()
+
+    assert auth.refresh(stale=stale) == "token-2"
+    assert auth.refresh(stale=stale) == "token-2"
+    assert auth.refresh(stale="token-2") == "token-3"
+    assert auth.refreshes == server.issued == 3
+
+
+def test_stale_token_refreshed_once_by_threads():
+    server = TokenServer()
+    auth = TokenAuth(fetch_token=server.fetch_token)
+    stale = auth.refresh()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        tokens = set(pool.map(lambda _: auth.refresh(stale=stale), range(8)))
+
+    assert tokens == {"token-2"}
+    assert auth.refreshes == server.issued == 2
@@ -0,0 +1,105 @@
+import asyncio
+import time
+
+import pytest
+
+from pyzayo.cache import TTLCache
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_set_expiry(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1)
+    cache.set("b", None, ttl=30)
+
+    assert cache.get("a") == 1
+    assert "b" in cache and cache.get("b", "default") is None
+    assert cache.expires_in("a") == 10
+
+    clock[0] += 10
+    assert cache.get("a", "expired") == "expired"
+    assert "a" not in cache and len(cache) == 1
+    assert cache.expires_in("b") == 20
+
+
+def test_zero_ttl_not_default(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1, ttl=0)
+
+    assert cache.get("a", "expired") == "expired"
+    assert cache.expires_in("a") is None
+
+
+def test_lru_eviction(clock):
+    cache = TTLCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+def test_pop_and_clear(clock):
+    cache = TTLCache()
+    cache.set("a", 1)
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "gone") == "gone"
+
+    cache.set("b", 2)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_get_or_fetch_coalesces():
+    cache = TTLCache()
+    fetches = []
+
+    async def fetch():
+        fetches.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def run():
+        values = await asyncio.gather(
+            *(cache.get_or_fetch("key", fetch) for _ in range(5))
+        )
+        return values + [await cache.get_or_fetch("key", fetch)]
+
+    assert asyncio.run(run()) == ["value"] * 6
+    assert len(fetches) == 1
+    assert cache.stats == {"hits": 1, "misses": 1, "coalesced": 4}
+
+
+def test_get_or_fetch_not_cacheable_and_errors():
+    cache = TTLCache()
+
+    async def fetch_error():
+        await asyncio.sleep(0)
+        return {"status": 500}
+
+    async def fetch_fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    async def run():
+        await cache.get_or_fetch(
+            "err", fetch_error, cacheable=lambda res: res["status"] == 200
+        )
+        assert "err" not in cache
+
+        results = await asyncio.gather(
+            *(cache.get_or_fetch("fail", fetch_fail) for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(res, RuntimeError) for res in results)
+        assert "fail" not in cache and not cache._inflight
+
+    asyncio.run(run())
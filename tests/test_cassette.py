@@ -0,0 +1,123 @@
+import asyncio
+import gzip
+import json
+
+import httpx
+import pytest
+
+from pyzayo import cassette
+from pyzayo.cassette import CassetteMissError, RecordingTransport, ReplayTransport
+from pyzayo.client import ZayoClient
+
+
+RECORDS = [{"caseNumber": f"C-{num}"} for num in range(5)]
+
+
+class GzipTransport(httpx.MockTransport):
+    """ serves the records in gzip encoded pages """
+
+    requires_auth = False
+
+    def __init__(self):
+        super().__init__(self.handle)
+        self.requests = 0
+
+    def handle(self, request):
+        self.requests += 1
+        paging = json.loads(request.content or b"{}").get("paging") or {}
+        skip, top = paging.get("skip", 0), paging.get("top", 50)
+        data = {
+            "metadata": {"totalRecordCount": len(RECORDS)},
+            "records": RECORDS[skip : skip + top],
+        }
+        return httpx.Response(
+            200,
+            headers={"Content-Encoding": "gzip"},
+            content=gzip.compress(json.dumps({"data": data}).encode()),
+        )
+
+
+def write_cassette(path, entries):
+    with open(path, "w") as ofile:
+        for entry in entries:
+            ofile.write(json.dumps(entry) + "\n")
+
+
+def entry(content, elapsed=0.5, body=""):
+    return {
+        "method": "GET",
+        "path": "/route",
+        "body": body,
+        "started": 0.0,
+        "elapsed": elapsed,
+        "status": 200,
+        "headers": {"content-type": "text/plain"},
+        "content": content,
+    }
+
+
+def replay(transport, request):
+    async def run():
+        response = await transport.handle_async_request(request)
+        return response.content.decode()
+
+    return asyncio.run(run())
+
+
+def test_record_then_replay(tmp_path):
+    path = str(tmp_path / "session.jsonl")
+    backend = GzipTransport()
+    with ZayoClient(transport=RecordingTransport(path, backend)) as client:
+        assert client.get_cases() == RECORDS
+    sent = backend.requests
+
+    with open(path) as ifile:
+        entries = [json.loads(line) for line in ifile]
+    assert len(entries) == sent
+    assert all("content-encoding" not in rec["headers"] for rec in entries)
+
+    replayed = ReplayTransport(path, latency_scale=0)
+    with ZayoClient(transport=replayed) as client:
+        assert client.get_cases() == RECORDS
+    assert backend.requests == sent
+
+
+def test_replay_repeated_requests_in_order(tmp_path):
+    path = str(tmp_path / "session.jsonl")
+    write_cassette(path, [entry("first"), entry("second"), entry("other", body="x")])
+    transport = ReplayTransport(path, latency_scale=0)
+
+    request = httpx.Request("GET", "http://zayo/route")
+    assert [replay(transport, request) for _ in range(3)] == [
+        "first",
+        "second",
+        "second",
+    ]
+    other = httpx.Request("GET", "http://zayo/route", content=b"x")
+    assert replay(transport, other) == "other"
+
+
+def test_replay_miss(tmp_path):
+    path = str(tmp_path / "session.jsonl")
+    write_cassette(path, [entry("first")])
+    transport = ReplayTransport(path, latency_scale=0)
+
+    with pytest.raises(CassetteMissError):
+        replay(transport, httpx.Request("GET", "http://zayo/other"))
+    with pytest.raises(CassetteMissError):
+        replay(transport, httpx.Request("POST", "http://zayo/route"))
+
+
+@pytest.mark.parametrize("scale, sleeps", [(0, []), (2.0, [1.0])])
+def test_replay_latency_scale(tmp_path, monkeypatch, scale, sleeps):
+    path = str(tmp_path / "session.jsonl")
+    write_cassette(path, [entry("first", elapsed=0.5)])
+    slept = []
+
+    async def sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr(cassette.asyncio, "sleep", sleep)
+    transport = ReplayTransport(path, latency_scale=scale)
+    assert replay(transport, httpx.Request("GET", "http://zayo/route")) == "first"
+    assert slept == sleeps
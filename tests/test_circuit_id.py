@@ -0,0 +1,76 @@
+import pytest
+
+from pyzayo.circuit_id import (
+    CircuitIdError,
+    CircuitIdResolver,
+    format_circuit_id,
+    normalize_circuit_id,
+    normalize_circuit_ids,
+)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("/OGYX/123456/ZYO/", "/OGYX/123456/ZYO/    /"),
+        ("ogyx/123456/zyo", "/OGYX/123456/ZYO/    /"),
+        (" /OGYX/123456/ZYO/    / ", "/OGYX/123456/ZYO/    /"),
+        ("/OGYX/123456//ZYO/", "/OGYX/123456/   /ZYO /"),
+        ("/OGYX/123456/   /ZYO /", "/OGYX/123456/   /ZYO /"),
+        ("/OGYX/123456/0-2/ZYO/", "/OGYX/123456/0-2/ZYO /"),
+        ("/OGYX/123456/", "/OGYX/123456/   /    /"),
+        ("ogyx 123456 zyo", "/OGYX/123456/ZYO/    /"),
+        ("OGYX-123456-ZYO", "/OGYX/123456/ZYO/    /"),
+        ("OGYX123456ZYO", "/OGYX/123456/ZYO/    /"),
+    ],
+)
+def test_format_circuit_id(value, expected):
+    assert format_circuit_id(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "   ",
+        None,
+        "/OGYX/12345/ZYO/",
+        "/OGYX/123456/ZYOX/",
+        "/OGYX/123456/ZYO/ABCDE/",
+        "/OGYX/123456/ZYO/ABCD/EXTRA/",
+        "/OGYX/123456 ZYO/",
+        "not a circuit",
+    ],
+)
+def test_format_circuit_id_errors(value):
+    with pytest.raises(CircuitIdError):
+        format_circuit_id(value)
+
+
+def test_normalize_keeps_unrecognized():
+    assert normalize_circuit_id("  cust-circuit-1 ") == "cust-circuit-1"
+
+
+def test_normalize_circuit_ids_errors_option():
+    values = ["ogyx 123456 zyo", "bad"]
+    assert normalize_circuit_ids(values, errors="none") == [
+        "/OGYX/123456/ZYO/    /",
+        None,
+    ]
+    assert normalize_circuit_ids(values, errors="keep")[1] == "bad"
+    with pytest.raises(CircuitIdError):
+        normalize_circuit_ids(values)
+    with pytest.raises(ValueError):
+        normalize_circuit_ids(values, errors="ignore")
+
+
+def test_resolver():
+    resolver = CircuitIdResolver(["/OGYX/123456/ZYO/", "/OGYX/654321/ZYO/", None])
+    assert len(resolver) == 2
+    assert "ogyx 123456 zyo" in resolver
+    assert resolver.resolve("OGYX/654321/ZYO") == "/OGYX/654321/ZYO/"
+    assert resolver.resolve("/OGYX/123465/ZYO/") is None
+    assert resolver.resolve("/OGYX/123465/ZYO/", fuzzy=True) == "/OGYX/123456/ZYO/"
+    assert resolver.resolve_many(["/OGYX/999999/XYZ/"], fuzzy=True) == {
+        "/OGYX/999999/XYZ/": None
+    }
@@ -0,0 +1,63 @@
+import io
+
+import pytest
+from rich.console import Console
+
+from pyzayo.cli import cli_render
+from pyzayo.cli.cli_render import print_rows, limit_records
+
+COLUMNS = (("Name", {}), ("Value", {}))
+
+
+@pytest.fixture()
+def output(monkeypatch):
+    buffer = io.StringIO()
+    monkeypatch.setattr(
+        cli_render, "Console", lambda: Console(file=buffer, width=80, color_system=None)
+    )
+    return buffer
+
+
+def test_chunks_share_column_widths(output):
+    rows = [(f"row{num}", "x" * num) for num in range(25)]
+    print_rows("Items", COLUMNS, rows, fmt="table", chunk_size=10)
+
+    lines = output.getvalue().splitlines()
+    separators = {
+        tuple(idx for idx, char in enumerate(line) if char == "│")
+        for line in lines
+        if line.startswith("│")
+    }
+    assert len(separators) == 1
+    assert lines[0].strip() == "Items"
+    assert lines[-1].strip() == "Items (25)"
+
+
+def test_single_chunk_count_in_title(output):
+    print_rows("Items", COLUMNS, [("a", "1"), ("b", "2")], fmt="table")
+    lines = output.getvalue().splitlines()
+    assert lines[0].strip() == "Items (2)"
+    assert "Items (2)" not in lines[-1]
+
+
+def test_exact_chunks_no_empty_table(output):
+    rows = [(str(num), "") for num in range(4)]
+    print_rows("Items", COLUMNS, rows, fmt="table", chunk_size=2)
+    text = output.getvalue()
+    assert text.count("Name") == 1
+    assert text.splitlines()[-1].strip() == "Items (4)"
+
+
+def test_without_count(output):
+    print_rows("Items (9)", COLUMNS, [("a", "1")], fmt="table", show_count=False)
+    assert output.getvalue().splitlines()[0].strip() == "Items (9)"
+
+
+def test_tsv(capsys):
+    print_rows("Items", COLUMNS, [("a b", None), ("c\nd", "2")], fmt="tsv")
+    assert capsys.readouterr().out == "Name\tValue\na b\t\nc d\t2\n"
+
+
+def test_limit_records_pages():
+    assert list(limit_records(range(10), limit=3, page=2)) == [3, 4, 5]
+    assert list(limit_records(range(4))) == [0, 1, 2, 3]
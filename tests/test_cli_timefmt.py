@@ -0,0 +1,58 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from pyzayo.cli.cli_timefmt import TimeFormatter, humanize_seconds
+
+NOW = datetime(2026, 6, 15, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "seconds, expected",
+    [
+        (0, "just now"),
+        (-9, "just now"),
+        (10, "in 10 seconds"),
+        (60, "in 1 minute"),
+        (-7200, "2 hours ago"),
+        (3 * 86400 + 5, "in 3 days"),
+        (-14 * 86400, "2 weeks ago"),
+        (400 * 86400, "in 1 year"),
+    ],
+)
+def test_humanize_seconds(seconds, expected):
+    assert humanize_seconds(seconds) == expected
+
+
+def test_as_datetime():
+    assert TimeFormatter.as_datetime(date(2026, 1, 2)) == datetime(
+        2026, 1, 2, tzinfo=timezone.utc
+    )
+    assert TimeFormatter.as_datetime(datetime(2026, 1, 2, 3)).tzinfo is timezone.utc
+
+    eastern = timezone(timedelta(hours=-5))
+    value = datetime(2026, 1, 2, 3, tzinfo=eastern)
+    assert TimeFormatter.as_datetime(value) is value
+
+
+def test_slang_time_relative_to_same_now():
+    timefmt = TimeFormatter(now=NOW)
+    assert timefmt.slang_time(date(2026, 6, 18)) == "in 2 days"
+    assert timefmt.slang_time(NOW - timedelta(minutes=5)) == "5 minutes ago"
+
+
+def test_dates_cell_sorted_and_memoized():
+    timefmt = TimeFormatter(now=NOW)
+    dates = [date(2026, 6, 30), date(2026, 6, 22)]
+    text = timefmt.dates_cell(dates)
+    assert text == "2026-06-22\n2026-06-30\n(in 6 days)"
+    assert timefmt.dates_cell(reversed(dates)) is text
+
+
+def test_datetime_cell():
+    timefmt = TimeFormatter(now=NOW)
+    value = NOW + timedelta(hours=3)
+    local = value.astimezone()
+    assert timefmt.datetime_cell(value) == (
+        local.strftime("%Y-%m-%d\n%H:%M:%S") + "\n(in 3 hours)"
+    )
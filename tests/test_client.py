@@ -0,0 +1,36 @@
+import pytest
+
+from pyzayo.client import ZayoClient
+from pyzayo.snapshot import SnapshotWriter, SnapshotTransport
+
+
+@pytest.fixture()
+def client(tmp_path):
+    path = str(tmp_path / "services.snap")
+    writer = SnapshotWriter(path)
+    for num in range(3):
+        writer.add("services", {"serviceName": f"svc{num}", "status": "Active"})
+    writer.close()
+
+    client = ZayoClient(transport=SnapshotTransport(path))
+    yield client
+    client.close()
+
+
+def test_get_services_copies_cached_dataset(client):
+    cached = client.get_dataset("services")
+    assert len(cached) == 3
+
+    services = client.get_services()
+    assert services == cached
+    assert services is not cached
+
+    services[0]["status"] = "Disconnected"
+    services.pop()
+    assert len(client.get_dataset("services")) == 3
+    assert client.get_services()[0]["status"] == "Active"
+
+
+def test_get_services_with_criteria_not_cached(client):
+    client.get_dataset("services")
+    assert client.get_services(filter={"status": "Pending"}) == []
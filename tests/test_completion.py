@@ -0,0 +1,84 @@
+import mmap
+import random
+
+import pytest
+
+from pyzayo.completion import CompletionIndex, _prefix_lines
+
+
+IDS = ["TTN-0001", "TTN-0002", "TTN-0010", "TTN-0011", "TTN-0100", "TTN-1000"]
+
+
+@pytest.fixture()
+def index(tmp_path):
+    index = CompletionIndex(str(tmp_path / "completion"))
+    index.update("cases", IDS)
+    return index
+
+
+def prefix_lines(lines, prefix, limit=100):
+    data = "".join(f"{line}\n" for line in lines).encode()
+    with mmap.mmap(-1, len(data)) as buf:
+        buf.write(data)
+        return _prefix_lines(buf, prefix.encode(), limit)
+
+
+def test_missing_index(tmp_path):
+    index = CompletionIndex(str(tmp_path / "none"))
+    assert index.complete("cases", "TTN") == []
+    assert index.read("cases") == []
+
+
+def test_empty_file(index):
+    open(index.path("notifications"), "w").close()
+    assert index.complete("notifications", "") == []
+    assert index.read("notifications") == []
+
+
+def test_unknown_kind(index):
+    with pytest.raises(ValueError):
+        index.complete("services", "")
+
+
+def test_complete_prefix(index):
+    assert index.complete("cases", "") == IDS
+    assert index.complete("cases", "TTN-001") == ["TTN-0010", "TTN-0011"]
+    assert index.complete("cases", "TTN-000") == ["TTN-0001", "TTN-0002"]
+
+
+def test_complete_first_and_last(index):
+    assert index.complete("cases", "TTN-0001") == ["TTN-0001"]
+    assert index.complete("cases", "TTN-1000") == ["TTN-1000"]
+
+
+def test_complete_no_match(index):
+    assert index.complete("cases", "AAA") == []
+    assert index.complete("cases", "TTN-0003") == []
+    assert index.complete("cases", "TTN-0012") == []
+    assert index.complete("cases", "ZZZ") == []
+
+
+def test_complete_limit(index):
+    assert index.complete("cases", "TTN", limit=3) == IDS[:3]
+    assert index.complete("cases", "TTN-00", limit=1) == ["TTN-0001"]
+
+
+def test_prefix_lines_brute_force():
+    rnd = random.Random(1)
+    lines = sorted({f"{rnd.randrange(10 ** rnd.randint(1, 4))}" for _ in range(200)})
+    for prefix in ["", "0", "1", "12", "5", "99", "999", "9999", "a"] + lines:
+        expected = [line for line in lines if line.startswith(prefix)]
+        assert prefix_lines(lines, prefix, limit=1000) == expected
+
+
+def test_update_dedup(index):
+    assert index.update("cases", ["TTN-0002", " TTN-0002 ", "", "TTN-0003"]) == 1
+    assert index.update("cases", ["TTN-0003"]) == 0
+    assert index.read("cases") == sorted(IDS + ["TTN-0003"])
+
+
+def test_update_id_with_space(index):
+    assert index.update("notifications", ["MNN 1", "MNN 2"]) == 2
+    assert index.update("notifications", ["MNN 1"]) == 0
+    assert index.read("notifications") == ["MNN 1", "MNN 2"]
+    assert index.complete("notifications", "MNN ") == ["MNN 1", "MNN 2"]
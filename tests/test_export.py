@@ -0,0 +1,151 @@
+import csv
+import json
+
+import pytest
+
+from pyzayo.export import (
+    CASE_FIELDS,
+    IMPACT_FIELDS,
+    SERVICE_FIELDS,
+    export_pages,
+    flatten_case,
+    flatten_impact,
+    flatten_service,
+    flatten_tagged,
+    make_writer,
+    TextFileWriter,
+)
+
+
+LOCATION_A = {
+    "name": "DC-A",
+    "city": "Denver",
+    "state": "CO",
+    "postalCode": "80202",
+    "clli": "DNVRCO01",
+}
+LOCATION_Z = dict(LOCATION_A, name="DC-Z", city="Chicago", clli="CHCGIL02")
+
+SERVICE = {
+    "serviceName": "service-1",
+    "status": "Active",
+    "productGroup": "Wavelengths",
+    "productCategory": "Waves",
+    "product": "Wavelength",
+    "term": "36",
+    "components": [
+        {
+            "circuitId": "/OGYX/123456/ZYO/",
+            "bandwidth": "10 Gbps",
+            "locations": [LOCATION_A, LOCATION_Z],
+        },
+        {"circuitId": "/OGYX/999999/ZYO/"},
+    ],
+}
+
+IMPACT = {
+    "caseNumber": "TTN-0001",
+    "circuitId": "/OGYX/123456/ZYO/",
+    "expectedImpact": "Hard Down",
+    "aLocationClli": "DNVRCO01",
+    "zLocationClli": "CHCGIL02",
+}
+
+
+def test_flatten_case():
+    row = flatten_case({"caseNumber": "TTN-0001", "longitiude": 1.5, "other": 1})
+    assert tuple(row) == CASE_FIELDS
+    assert row["case_num"] == "TTN-0001"
+    assert row["longitude"] == 1.5
+    assert row["status"] is None
+
+
+def test_flatten_impact():
+    row = flatten_impact(IMPACT)
+    assert tuple(row) == IMPACT_FIELDS
+    assert row == {
+        "case_num": "TTN-0001",
+        "circuit_id": "/OGYX/123456/ZYO/",
+        "impact": "Hard Down",
+        "clli_a": "DNVRCO01",
+        "clli_z": "CHCGIL02",
+    }
+
+
+def test_flatten_service():
+    row = flatten_service(SERVICE)
+    assert tuple(row) == SERVICE_FIELDS
+    assert row["circuit_id"] == "/OGYX/123456/ZYO/"
+    assert row["bandwidth"] == "10 Gbps"
+    assert (row["a_name"], row["a_clli"]) == ("DC-A", "DNVRCO01")
+    assert (row["z_name"], row["z_city"], row["z_postal_code"]) == (
+        "DC-Z",
+        "Chicago",
+        "80202",
+    )
+
+
+@pytest.mark.parametrize(
+    "components",
+    [None, [], [{"circuitId": "/OGYX/1/ZYO/"}], [{"locations": [LOCATION_A]}]],
+)
+def test_flatten_service_partial(components):
+    row = flatten_service(dict(SERVICE, components=components))
+    assert tuple(row) == SERVICE_FIELDS
+    assert row["z_name"] is None and row["z_clli"] is None
+    if not components:
+        assert all(row[field] is None for field in SERVICE_FIELDS[6:])
+
+
+def test_flatten_tagged():
+    flatten, fields = flatten_tagged(flatten_impact, IMPACT_FIELDS, "account")
+    assert fields == ["account", *IMPACT_FIELDS]
+    assert flatten(dict(IMPACT, account="east"))["account"] == "east"
+    assert flatten(IMPACT)["account"] is None
+
+
+def test_export_csv(tmp_path):
+    path = str(tmp_path / "impacts.csv")
+    pages = [[IMPACT, dict(IMPACT, caseNumber="TTN-0002")], [], [{}]]
+    written = []
+
+    count = export_pages(
+        pages, flatten_impact, IMPACT_FIELDS, "csv", path, on_page=written.append
+    )
+    assert count == 3
+    assert written == [2, 0, 1]
+
+    with open(path, newline="") as ifile:
+        rows = list(csv.reader(ifile))
+    assert rows[0] == list(IMPACT_FIELDS)
+    assert rows[1] == list(flatten_impact(IMPACT).values())
+    assert rows[2][0] == "TTN-0002"
+    assert rows[3] == [""] * len(IMPACT_FIELDS)
+
+
+def test_export_jsonl(tmp_path):
+    path = str(tmp_path / "services.jsonl")
+    pages = [[SERVICE], [SERVICE]]
+    count = export_pages(pages, flatten_service, SERVICE_FIELDS, "jsonl", path)
+    assert count == 2
+
+    with open(path) as ifile:
+        rows = [json.loads(line) for line in ifile]
+    assert rows == [flatten_service(SERVICE)] * 2
+
+
+def test_export_stdout(capsys):
+    export_pages([[IMPACT]], flatten_impact, IMPACT_FIELDS, "jsonl", "-")
+    assert json.loads(capsys.readouterr().out) == flatten_impact(IMPACT)
+
+
+def test_make_writer_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        make_writer("parquet", "-", IMPACT_FIELDS)
+    with pytest.raises(ValueError):
+        make_writer("xlsx", str(tmp_path / "out.xlsx"), IMPACT_FIELDS)
+
+
+def test_text_writer_is_abstract(tmp_path):
+    with pytest.raises(TypeError):
+        TextFileWriter(str(tmp_path / "out.txt"), IMPACT_FIELDS)
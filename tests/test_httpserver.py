@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from pyzayo.httpserver import BadRequest, read_request, write_response
+
+
+class BufferWriter(object):
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data):
+        self.data += data
+
+
+def read(data, limit=2 ** 16, **kwargs):
+    async def run():
+        reader = asyncio.StreamReader(limit=limit)
+        reader.feed_data(data)
+        reader.feed_eof()
+        return await read_request(reader, **kwargs)
+
+    return asyncio.run(run())
+
+
+def test_read_request():
+    method, target, headers, body = read(
+        b"post /route?x=1 HTTP/1.1\r\nContent-Type: application/json\r\n"
+        b"Content-Length: 2\r\n\r\n{}"
+    )
+    assert (method, target, body) == ("POST", "/route?x=1", b"{}")
+    assert headers == {"content-type": "application/json", "content-length": "2"}
+
+
+def test_read_request_closed():
+    assert read(b"") is None
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"GET\r\n\r\n",
+        b"GET / HTTP/1.1\r\nContent-Length: two\r\n\r\n",
+        b"GET / HTTP/1.1\r\nContent-Length: 11\r\n\r\n01234567890",
+        b"GET /" + b"x" * 200 + b" HTTP/1.1\r\n\r\n",
+    ],
+)
+def test_read_request_bad(data):
+    with pytest.raises(BadRequest):
+        read(data, limit=100, max_body=10)
+
+
+def test_write_response():
+    writer = BufferWriter()
+    write_response(
+        writer, (429, "application/json", b"{}"), {"Retry-After": "1"}, keep_alive=True
+    )
+    head, _, body = writer.data.partition(b"\r\n\r\n")
+    assert head.decode().split("\r\n") == [
+        "HTTP/1.1 429 Too Many Requests",
+        "Content-Type: application/json",
+        "Content-Length: 2",
+        "Connection: keep-alive",
+        "Retry-After: 1",
+    ]
+    assert body == b"{}"
@@ -0,0 +1,58 @@
+import pytest
+
+from pyzayo.loadtest import LoadTest, MockZayoServer, make_dataset
+
+
+@pytest.fixture
+def dataset():
+    return make_dataset(5)
+
+
+def run_load_test(dataset, served, mix, rate=None, case_nums=None):
+    server = MockZayoServer(served, rate=rate, latency=0, jitter=0)
+    server.start()
+    try:
+        return LoadTest(
+            server.base_url,
+            server.auth_url,
+            case_nums=case_nums or [rec["caseNumber"] for rec in dataset["cases"]],
+            circuit_ids=[rec["circuitId"] for rec in dataset["impacts"]],
+            clients=2,
+            duration=0.5,
+            mix=mix,
+            dataset=dataset,
+        ).run(server_stats=server.stats)
+    finally:
+        server.stop()
+
+
+def test_expected_records_ok(dataset):
+    result = run_load_test(dataset, dataset, {"cases": 1, "details": 1, "impacts": 1})
+    assert result.results
+    assert {op.outcome for op in result.results} == {"ok"}
+
+
+def test_missing_records_are_errors(dataset):
+    served = dict(dataset, cases=dataset["cases"][:-1])
+    result = run_load_test(dataset, served, {"cases": 1})
+    assert result.results
+    assert {op.outcome for op in result.results} == {"error"}
+    assert result.summary()["operations"]["cases"]["error_rate"] == 1
+
+
+def test_missing_case_details_are_errors(dataset):
+    case_num = dataset["cases"][0]["caseNumber"]
+    served = dict(
+        dataset,
+        impacts=[rec for rec in dataset["impacts"] if rec["caseNumber"] != case_num],
+    )
+    result = run_load_test(dataset, served, {"details": 1}, case_nums=[case_num])
+    assert result.results
+    assert {op.outcome for op in result.results} == {"error"}
+
+
+def test_throttled_operations_counted(dataset):
+    result = run_load_test(dataset, dataset, {"services": 1}, rate=1)
+    summary = result.summary()
+    assert result.server_stats["throttled"] > 0
+    assert summary["operations"]["services"]["throttle_rate"] > 0
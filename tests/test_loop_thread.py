@@ -0,0 +1,74 @@
+import asyncio
+import threading
+
+import pytest
+
+from pyzayo.loop_thread import LoopThread
+
+
+@pytest.fixture()
+def loop_thread():
+    lt = LoopThread(name="test-loop")
+    yield lt
+    lt.close()
+
+
+def test_run_returns_result(loop_thread):
+    async def add(a, b):
+        await asyncio.sleep(0)
+        return a + b
+
+    assert loop_thread.run(add(1, 2)) == 3
+
+
+def test_run_raises_coroutine_exception(loop_thread):
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        loop_thread.run(fail())
+
+
+def test_coroutines_run_in_loop_thread(loop_thread):
+    async def thread_name():
+        return threading.current_thread().name
+
+    assert loop_thread.run(thread_name()) == "test-loop"
+
+
+def test_run_from_many_threads(loop_thread):
+    async def square(value):
+        await asyncio.sleep(0.001)
+        return value * value
+
+    results = [None] * 20
+
+    def worker(num):
+        results[num] = loop_thread.run(square(num))
+
+    threads = [threading.Thread(target=worker, args=(num,)) for num in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [num * num for num in range(20)]
+
+
+def test_run_within_loop_thread_raises(loop_thread):
+    async def nested():
+        async def inner():
+            return 1
+
+        loop_thread.run(inner())
+
+    with pytest.raises(RuntimeError):
+        loop_thread.run(nested())
+
+
+def test_close_stops_thread():
+    lt = LoopThread()
+    assert lt.is_running
+    lt.close()
+    assert not lt.is_running
+    lt.close()
@@ -0,0 +1,55 @@
+import sqlite3
+
+import pytest
+from click.testing import CliRunner
+
+from pyzayo.mirror import ZayoMirror
+from pyzayo.cli.cli_mirror import cli_query
+
+
+@pytest.fixture()
+def dbpath(tmp_path):
+    path = str(tmp_path / "mirror.db")
+    with ZayoMirror(path) as mirror:
+        mirror.db.execute("INSERT INTO cases (case_num, status) VALUES ('C-1', 'Open')")
+        mirror.db.commit()
+    return path
+
+
+def test_query_read_only(dbpath):
+    with ZayoMirror(dbpath, read_only=True) as mirror:
+        assert mirror.query("SELECT case_num, status FROM cases") == [
+            {"case_num": "C-1", "status": "Open"}
+        ]
+        with pytest.raises(sqlite3.OperationalError):
+            mirror.query("DELETE FROM cases")
+
+
+def test_read_only_missing_file(tmp_path):
+    path = tmp_path / "missing.db"
+    with pytest.raises(FileNotFoundError):
+        ZayoMirror(str(path), read_only=True)
+    assert not path.exists()
+
+
+def test_cli_query_missing_database(tmp_path):
+    path = tmp_path / "missing.db"
+    res = CliRunner().invoke(cli_query, ["--db", str(path), "SELECT 1"])
+    assert res.exit_code == 1
+    assert "Mirror database not found" in res.output
+    assert not path.exists()
+
+
+def test_cli_query_sql_error(dbpath):
+    res = CliRunner().invoke(cli_query, ["--db", dbpath, "SELECT * FROM nosuch"])
+    assert res.exit_code == 1
+    assert "Query failed" in res.output
+    assert "Traceback" not in res.output
+
+
+def test_cli_query_jsonl(dbpath):
+    res = CliRunner().invoke(
+        cli_query, ["--db", dbpath, "--format", "jsonl", "SELECT case_num FROM cases"]
+    )
+    assert res.exit_code == 0, res.output
+    assert res.output.strip() == '{"case_num": "C-1"}'
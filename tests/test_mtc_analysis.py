@@ -0,0 +1,94 @@
+from datetime import date, datetime, time
+
+from pyzayo.mtc_models import CaseRecord, ImpactRecord
+from pyzayo.mtc_analysis import (
+    case_windows,
+    find_conflicts,
+    group_by_clli,
+    group_by_circuits,
+)
+
+from api_records import case_record, impact_record
+
+
+def case(case_num, pdate, from_time, to_time, status="Scheduled", **pdates):
+    return CaseRecord.parse_obj(
+        case_record(case_num, pdate, from_time, to_time, status, **pdates)
+    )
+
+
+def impact(case_num, circuit_id, clli_a="DNVRCO01", clli_z="CHCGIL01"):
+    return ImpactRecord.parse_obj(impact_record(case_num, circuit_id, clli_a, clli_z))
+
+
+def test_case_windows_overnight_and_dates():
+    windows = case_windows(
+        case("C-1", "2026-03-01", "22:00", "04:00", pdate_2="2026-03-08")
+    )
+    assert [(w.start, w.end) for w in windows] == [
+        (datetime(2026, 3, 1, 22), datetime(2026, 3, 2, 4)),
+        (datetime(2026, 3, 8, 22), datetime(2026, 3, 9, 4)),
+    ]
+    assert {w.case_num for w in windows} == {"C-1"}
+
+
+def test_find_conflicts_by_circuit_groups():
+    cases = [
+        case("C-1", "2026-03-01", "22:00", "04:00"),
+        case("C-2", "2026-03-02", "01:00", "03:00"),
+        case("C-3", "2026-03-02", "04:00", "06:00"),
+    ]
+    impacts = [
+        impact("C-1", "CIR-A"),
+        impact("C-2", "CIR-B"),
+        impact("C-3", "CIR-B"),
+    ]
+    group_by = group_by_circuits({"diverse": ["cir-a", "cir-b"]}, normalize=str.upper)
+
+    conflicts = find_conflicts(cases, impacts, group_by)
+    assert len(conflicts) == 1
+
+    conflict = conflicts[0]
+    assert (conflict.group, conflict.case_a, conflict.case_b) == (
+        "diverse",
+        "C-1",
+        "C-2",
+    )
+    assert (conflict.circuit_a, conflict.circuit_b) == ("CIR-A", "CIR-B")
+    assert (conflict.start, conflict.end) == (
+        datetime(2026, 3, 2, 1),
+        datetime(2026, 3, 2, 3),
+    )
+
+
+def test_find_conflicts_ignores_same_circuit_and_inactive_cases():
+    cases = [
+        case("C-1", "2026-03-01", "00:00", "06:00"),
+        case("C-2", "2026-03-01", "01:00", "02:00"),
+        case("C-3", "2026-03-01", "01:00", "02:00", status="Maint Completed"),
+    ]
+    impacts = [
+        impact("C-1", "CIR-A"),
+        impact("C-2", "CIR-A"),
+        impact("C-3", "CIR-B"),
+    ]
+    assert find_conflicts(cases, impacts, group_by_clli) == []
+
+
+def test_find_conflicts_by_clli_ordered():
+    cases = [
+        case("C-1", "2026-03-01", "00:00", "06:00"),
+        case("C-2", "2026-03-01", "05:00", "07:00"),
+    ]
+    impacts = [
+        impact("C-1", "CIR-A", clli_a="AAAA", clli_z="ZZZZ"),
+        impact("C-2", "CIR-B", clli_a="BBBB", clli_z="AAAA"),
+    ]
+    conflicts = find_conflicts(cases, impacts, group_by_clli)
+    assert [c.group for c in conflicts] == ["AAAA"]
+    assert conflicts[0].end == datetime.combine(date(2026, 3, 1), time(6))
+
+
+def test_group_by_circuits_unknown_circuit():
+    group_by = group_by_circuits({"g1": ["CIR-A"]})
+    assert list(group_by(impact("C-1", "CIR-X"))) == []
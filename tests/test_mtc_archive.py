@@ -0,0 +1,140 @@
+import asyncio
+import gzip
+import hashlib
+import os
+
+import pytest
+
+from pyzayo.mtc_archive import EmailArchive, ARCHIVE_INDEX_FILE
+
+
+BODIES = {
+    "TTN-1": {"MNN-1-1": "<html>planned</html>", "MNN-1-2": "<html>reminder</html>"},
+    "TTN-2": {"MNN-2-1": "<html>planned</html>", "MNN-2-2": "<html>complete</html>"},
+}
+
+
+class FakeClient(object):
+    """ serves the notifications of the cases, yielding to the loop per request """
+
+    def __init__(self, bodies=BODIES):
+        self.bodies = bodies
+        self.requested = []
+
+    async def _fetch_notifications(self, case_num):
+        await asyncio.sleep(0)
+        return [{"name": name} for name in self.bodies[case_num]]
+
+    async def _fetch_notification_details(self, name):
+        await asyncio.sleep(0)
+        self.requested.append(name)
+        case_num = "TTN-" + name.split("-")[1]
+        return {
+            "name": name,
+            "notificationType": "Scheduled",
+            "lastModifiedDate": "2026-01-01T00:00:00Z",
+            "subject": f"maintenance {case_num}",
+            "emailBody": self.bodies[case_num][name],
+        }
+
+
+def archive_cases(directory, client, case_nums=tuple(BODIES), **kwargs):
+    archive = EmailArchive(str(directory), **kwargs)
+    try:
+        return archive, asyncio.run(archive.aarchive(client, case_nums))
+    finally:
+        archive.close()
+
+
+def email_files(directory):
+    return sorted(
+        name
+        for _, _, names in os.walk(directory)
+        for name in names
+        if name != ARCHIVE_INDEX_FILE
+    )
+
+
+def digest(body):
+    return hashlib.sha256(body.encode()).hexdigest()
+
+
+def test_archive_counts_and_files(tmp_path):
+    archive, counts = archive_cases(tmp_path, FakeClient())
+    assert counts == dict(cases=2, notifications=4, archived=4, skipped=0, duplicates=1)
+    bodies = {body for notifs in BODIES.values() for body in notifs.values()}
+    assert email_files(tmp_path) == sorted(f"{digest(body)}.html" for body in bodies)
+
+    entry = archive.index["MNN-2-1"]
+    assert entry["case_num"] == "TTN-2"
+    assert entry["file"] == archive.index["MNN-1-1"]["file"]
+    with open(tmp_path / entry["file"]) as ifile:
+        assert ifile.read() == "<html>planned</html>"
+
+
+def test_archive_compressed(tmp_path):
+    archive, _ = archive_cases(tmp_path, FakeClient(), ["TTN-1"], compress=True)
+    entry = archive.index["MNN-1-1"]
+    assert entry["file"].endswith(".html.gz")
+    with gzip.open(tmp_path / entry["file"]) as ifile:
+        assert ifile.read() == b"<html>planned</html>"
+
+
+def test_archive_resumed_from_index(tmp_path):
+    archive_cases(tmp_path, FakeClient(), ["TTN-1"])
+
+    client = FakeClient()
+    archive, counts = archive_cases(tmp_path, client)
+    assert counts == dict(cases=2, notifications=4, archived=2, skipped=2, duplicates=1)
+    assert sorted(client.requested) == ["MNN-2-1", "MNN-2-2"]
+    assert len(archive) == 4
+    assert len(email_files(tmp_path)) == 3
+
+    client = FakeClient()
+    _, counts = archive_cases(tmp_path, client)
+    assert counts["skipped"] == 4 and counts["archived"] == 0
+    assert client.requested == []
+
+
+def test_duplicate_waits_for_write_in_flight(tmp_path, monkeypatch):
+    archive = EmailArchive(str(tmp_path))
+    writes = []
+
+    def slow_write(filename, content):
+        writes.append(filename)
+        assert not archive.index
+        EmailArchive._write_email(archive, filename, content)
+
+    monkeypatch.setattr(archive, "_write_email", slow_write)
+
+    async def add_both():
+        details = {"name": "MNN-1", "emailBody": "same"}
+        return await asyncio.gather(
+            archive.add("TTN-1", details),
+            archive.add("TTN-2", dict(details, name="MNN-2")),
+        )
+
+    assert asyncio.run(add_both()) == [False, True]
+    archive.close()
+    assert len(writes) == 1
+    assert os.path.exists(tmp_path / archive.index["MNN-2"]["file"])
+
+
+def test_failed_write_rolled_back(tmp_path, monkeypatch):
+    archive = EmailArchive(str(tmp_path))
+
+    def failed_write(filename, content):
+        raise OSError("disk full")
+
+    details = {"name": "MNN-1", "emailBody": "body"}
+
+    monkeypatch.setattr(archive, "_write_email", failed_write)
+    with pytest.raises(OSError):
+        asyncio.run(archive.add("TTN-1", details))
+    assert "MNN-1" not in archive
+    assert archive._files == {} and archive._writes == {}
+    monkeypatch.undo()
+
+    assert asyncio.run(archive.add("TTN-1", details)) is False
+    archive.close()
+    assert os.path.exists(tmp_path / archive.index["MNN-1"]["file"])
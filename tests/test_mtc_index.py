@@ -0,0 +1,84 @@
+from datetime import datetime
+
+import pytest
+
+from pyzayo.mtc_models import CaseRecord, ImpactRecord
+from pyzayo.mtc_index import MaintenanceIndex
+
+from api_records import case_record, impact_record
+
+
+CASES = [
+    case_record("C-1", "2026-12-20"),
+    case_record("C-2", "2027-01-10", "00:00", "23:00"),
+    case_record("C-3", "2026-12-22", status="Closed"),
+]
+
+IMPACTS = [
+    impact_record("C-1", "/OGYX/123456/ZYO/"),
+    impact_record("C-2", "/OGYX/123456/ZYO/"),
+    impact_record("C-3", "/OGYX/123457/ZYO/"),
+]
+
+
+@pytest.fixture()
+def index():
+    return MaintenanceIndex(
+        map(CaseRecord.parse_obj, CASES), map(ImpactRecord.parse_obj, IMPACTS)
+    )
+
+
+def test_inactive_cases_not_indexed(index):
+    assert set(index.cases) == {"C-1", "C-2"}
+    assert index.windows("/OGYX/123457/ZYO/") == []
+
+
+def test_windows_normalized_and_sorted(index):
+    assert "ogyx 123456 zyo" in index
+    windows = index.windows("OGYX/123456/ZYO")
+    assert [win.case_num for win in windows] == ["C-1", "C-2"]
+
+
+def test_query_time_span(index):
+    circuit_ids = ["/OGYX/123456/ZYO/", "/OGYX/999999/ZYO/"]
+
+    found = index.query(
+        circuit_ids, start=datetime(2026, 12, 15), end=datetime(2027, 1, 5)
+    )
+    assert list(found) == ["/OGYX/123456/ZYO/"]
+    assert [win.case_num for win in found["/OGYX/123456/ZYO/"]] == ["C-1"]
+
+    # the window of C-1 ends at 04:00 the day after its primary date.
+    found = index.query(
+        circuit_ids, start=datetime(2026, 12, 21, 3), end=datetime(2026, 12, 21, 5)
+    )
+    assert [win.case_num for win in found["/OGYX/123456/ZYO/"]] == ["C-1"]
+
+    found = index.query(
+        circuit_ids, start=datetime(2026, 12, 21, 4), end=datetime(2027, 1, 10)
+    )
+    assert found == {}
+
+
+def test_add_cases_rebuilds_windows(index):
+    span = datetime(2026, 1, 1), datetime(2028, 1, 1)
+    assert index.query(["/OGYX/123457/ZYO/"], *span) == {}
+
+    index.add_cases([CaseRecord.parse_obj(case_record("C-3", "2026-12-22"))])
+    found = index.query(["/OGYX/123457/ZYO/"], *span)
+    assert [win.case_num for win in found["/OGYX/123457/ZYO/"]] == ["C-3"]
+
+
+class FakeClient(object):
+    def iter_case_pages(self):
+        yield CASES[:2]
+        yield CASES[2:]
+
+    def iter_impact_pages(self):
+        yield IMPACTS
+
+
+def test_from_client():
+    index = MaintenanceIndex.from_client(FakeClient())
+    assert set(index.cases) == {"C-1", "C-2"}
+    assert len(index) == 1
@@ -0,0 +1,166 @@
+import asyncio
+import io
+import json
+
+import pytest
+
+from pyzayo.mtc_mixin import ZayoMatenanceMixin
+from pyzayo.mtc_watch import (
+    CaseEventKinds,
+    JsonlEventWriter,
+    case_state,
+    diff_cases,
+)
+
+from api_records import case_record
+
+
+def case(case_num, status="Scheduled", pdate="2026-12-01"):
+    return case_record(case_num, pdate, status=status)
+
+
+def kinds(events):
+    return [(event.kind, event.case_num) for event in events]
+
+
+def test_diff_cases_events():
+    states = dict()
+    assert kinds(diff_cases(states, [case("C-1"), case("C-2")])) == [
+        ("new", "C-1"),
+        ("new", "C-2"),
+    ]
+    assert diff_cases(states, [case("C-1"), case("C-2")]) == []
+
+    events = diff_cases(
+        states,
+        [
+            case("C-1", status="Closed"),
+            case("C-2", status="Maint Started", pdate="2026-12-02"),
+        ],
+    )
+    assert kinds(events) == [
+        ("closed", "C-1"),
+        ("status", "C-2"),
+        ("rescheduled", "C-2"),
+    ]
+    assert events[2].old.schedule[0] == "2026-12-01"
+    assert events[2].new == case_state(case("C-2", "Maint Started", "2026-12-02"))
+
+
+def test_diff_cases_removed_only_when_complete():
+    states = dict()
+    diff_cases(states, [case("C-1"), case("C-2")])
+
+    assert diff_cases(states, [case("C-1")]) == []
+    assert "C-2" in states
+
+    events = diff_cases(states, [case("C-1")], complete=True)
+    assert kinds(events) == [(CaseEventKinds.removed, "C-2")]
+    assert events[0].new is None and events[0].old.status == "Scheduled"
+    assert "C-2" not in states
+
+
+def test_jsonl_event_writer():
+    ofile = io.StringIO()
+    states = {"C-1": case_state(case("C-1"))}
+    write = JsonlEventWriter(ofile)
+    for event in diff_cases(states, [], complete=True):
+        write(event)
+
+    line = json.loads(ofile.getvalue())
+    assert line["kind"] == "removed"
+    assert line["status"] is None and line["schedule"] is None
+
+
+class FakeWatchClient(ZayoMatenanceMixin):
+    """ serves the case listing from memory, counting the requests """
+
+    def __init__(self, cases):
+        self.cases = cases
+        self.requests = list()
+
+    async def _arun(self, coro):
+        return await coro
+
+    async def _fetch_page_data(self, url, payload):
+        top = payload["paging"]["top"]
+        self.requests.append(top)
+        return {
+            "metadata": {"totalRecordCount": len(self.cases)},
+            "records": self.cases[:top],
+        }
+
+    async def _fetch_records(self, url, **params):
+        self.requests.append("all")
+        return list(self.cases)
+
+
+def watch(client, changes, **params):
+    """ apply each change to the cases before its poll, returning the events """
+    fetch_page_data = client._fetch_page_data
+    changes = iter(changes)
+
+    async def fetch(url, payload):
+        change = next(changes, None)
+        if change:
+            change(client.cases)
+        return await fetch_page_data(url, payload)
+
+    async def consume():
+        return [
+            event
+            async for event in client.watch_cases(interval=0, jitter=0, **params)
+        ]
+
+    client._fetch_page_data = fetch
+    return asyncio.run(consume())
+
+
+def test_watch_cases_small_head_and_removed():
+    client = FakeWatchClient([case(f"C-{num}") for num in range(20)])
+
+    events = watch(
+        client,
+        [
+            None,
+            None,
+            lambda cases: cases.pop(),
+            lambda cases: cases.__setitem__(0, case("C-0", status="Closed")),
+        ],
+        max_polls=4,
+        full_every=100,
+        head_count=5,
+    )
+
+    assert kinds(events) == [("removed", "C-19"), ("closed", "C-0")]
+    # baseline, steady state, count changed, steady state.
+    assert client.requests == [5, "all", 5, 5, "all", 5]
+
+
+def test_watch_cases_complete_head():
+    client = FakeWatchClient([case("C-1"), case("C-2")])
+    events = watch(
+        client, [None, lambda cases: cases.pop()], max_polls=2, head_count=5
+    )
+    assert kinds(events) == [("removed", "C-2")]
+    assert client.requests == [5, 5]
+
+
+@pytest.mark.parametrize("full_every", [None, 0])
+def test_watch_cases_never_forced_full(full_every):
+    client = FakeWatchClient([case(f"C-{num}") for num in range(20)])
+    events = watch(client, [], max_polls=4, full_every=full_every, head_count=5)
+    assert events == []
+    assert client.requests == [5, "all", 5, 5, 5]
+
+
+def test_watch_cases_forced_full_every():
+    client = FakeWatchClient([case(f"C-{num}") for num in range(20)])
+    watch(client, [], max_polls=5, full_every=2, head_count=5)
+    assert client.requests == [5, "all", 5, 5, "all", 5, 5, "all"]
+
+
+def test_watch_cases_negative_full_every():
+    client = FakeWatchClient([case("C-1")])
+    with pytest.raises(ValueError):
+        watch(client, [], max_polls=1, full_every=-1)
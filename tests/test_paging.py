@@ -0,0 +1,116 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from pyzayo import consts
+from pyzayo.client import ZayoClient
+from pyzayo.paging import PageSizer
+
+
+def page_size(sizer, total=10000, probe=None, url="route"):
+    return asyncio.run(sizer.page_size(url, total=total, concurrency=4, probe=probe))
+
+
+def accepts_up_to(limit, probed):
+    async def probe(size):
+        probed.append(size)
+        return size <= limit
+
+    return probe
+
+
+def test_candidates_sorted_with_min_size():
+    sizer = PageSizer(candidates=(100, 1000, 20), min_size=50)
+    assert sizer.candidates == [1000, 100, 50]
+
+
+def test_small_pull_not_probed():
+    probed = []
+    assert page_size(PageSizer(), total=40, probe=accepts_up_to(1000, probed)) == 50
+    assert probed == []
+
+
+def test_probe_cached():
+    sizer, probed = PageSizer(), []
+    assert page_size(sizer, probe=accepts_up_to(250, probed)) == 250
+    assert probed == [1000, 500, 250]
+    assert sizer.limits == {"route": 250}
+
+    assert page_size(sizer, probe=accepts_up_to(250, probed)) == 250
+    assert probed == [1000, 500, 250]
+
+
+def test_probe_error_not_cached():
+    sizer = PageSizer()
+
+    async def probe(size):
+        raise RuntimeError("throttled")
+
+    assert page_size(sizer, probe=probe) == sizer.min_size
+    assert sizer.limits == {}
+
+
+def test_best_size_from_latency_model():
+    sizer = PageSizer()
+    sizer.limits["route"] = 1000
+    assert sizer.best_size("route", total=300, concurrency=4) == 1000
+
+    for records in (1000, 1000, 200):
+        sizer.observe("route", records, 0.1 + 0.002 * records)
+
+    # small pulls complete sooner in concurrent smaller pages.
+    assert sizer.best_size("route", total=300, concurrency=4) == 100
+    assert sizer.best_size("route", total=100000, concurrency=4) == 1000
+
+
+def test_reject():
+    sizer = PageSizer()
+    sizer.reject("route", 1000, returned=300)
+    assert sizer.limits["route"] == 250
+    sizer.reject("route", 100)
+    assert sizer.limits["route"] == 50
+
+
+class SizedTransport(httpx.MockTransport):
+    """ serves the records, answering pages larger than `max_top` with `status` """
+
+    requires_auth = False
+
+    def __init__(self, records, max_top, status):
+        super().__init__(self.handle)
+        self.records = records
+        self.max_top = max_top
+        self.status = status
+
+    def handle(self, request):
+        paging = json.loads(request.content or b"{}").get("paging") or {}
+        skip, top = paging.get("skip", 0), paging.get("top", 50)
+        if top > self.max_top:
+            return httpx.Response(self.status, json={"error": "top"})
+
+        data = {
+            "metadata": {"totalRecordCount": len(self.records)},
+            "records": self.records[skip : skip + top],
+        }
+        return httpx.Response(200, json={"data": data})
+
+
+RECORDS = [{"caseNumber": f"C-{num}"} for num in range(600)]
+
+
+@pytest.mark.parametrize("status", [400, 413, 422])
+def test_client_probe_rejected_size(status):
+    transport = SizedTransport(RECORDS, max_top=500, status=status)
+    with ZayoClient(transport=transport) as client:
+        assert client.get_cases() == RECORDS
+        assert client.page_sizer.limits == {consts.ZAYO_SM_ROUTE_MTC_CASES: 500}
+
+
+@pytest.mark.parametrize("status", [401, 429, 503])
+def test_client_probe_other_errors_not_cached(status):
+    transport = SizedTransport(RECORDS, max_top=500, status=status)
+    with ZayoClient(transport=transport) as client:
+        assert client.get_cases() == RECORDS
+        assert client.page_sizer.limits == {}
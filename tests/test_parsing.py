@@ -0,0 +1,66 @@
+import pytest
+from pydantic import ValidationError
+
+from pyzayo.mtc_models import ImpactRecord
+from pyzayo.parsing import parse_pages, parse_records
+
+from api_records import impact_record
+
+
+def impact(num):
+    return impact_record(f"TTN-{num:010d}", f"/OGYX/{100000 + num}/ZYO/")
+
+
+def make_pages(n_pages, per_page=3, consumed=None):
+    for page_num in range(n_pages):
+        if consumed is not None:
+            consumed.append(page_num)
+        yield [impact(page_num * per_page + num) for num in range(per_page)]
+
+
+def case_nums(pages):
+    return [[rec.case_num for rec in page] for page in pages]
+
+
+def test_parse_pages_in_thread():
+    pages = list(parse_pages(ImpactRecord, make_pages(3)))
+    assert all(isinstance(rec, ImpactRecord) for page in pages for rec in page)
+    assert case_nums(pages) == [
+        [f"TTN-{num:010d}" for num in range(page * 3, page * 3 + 3)]
+        for page in range(3)
+    ]
+
+
+@pytest.mark.parametrize("processes", [None, 1, 2])
+def test_parse_pages_order(processes):
+    expected = case_nums(parse_pages(ImpactRecord, make_pages(7)))
+    pages = parse_pages(ImpactRecord, make_pages(7), processes=processes)
+    assert case_nums(pages) == expected
+
+
+def test_parse_pages_window():
+    consumed = []
+    pages = parse_pages(
+        ImpactRecord, make_pages(10, consumed=consumed), processes=2, window=3
+    )
+    first = next(pages)
+    assert [rec.case_num for rec in first] == [f"TTN-{num:010d}" for num in range(3)]
+    assert consumed == [0, 1, 2]
+
+    assert len(list(pages)) == 9
+    assert consumed == list(range(10))
+
+
+def test_parse_records():
+    records = parse_records(ImpactRecord, make_pages(4, per_page=2), processes=2)
+    assert [rec.case_num for rec in records] == [
+        f"TTN-{num:010d}" for num in range(8)
+    ]
+    assert parse_records(ImpactRecord, []) == []
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_parse_pages_invalid_record(processes):
+    pages = [[impact(0)], [{"caseNumber": "TTN-0000000001"}]]
+    with pytest.raises(ValidationError):
+        parse_records(ImpactRecord, pages, processes=processes)
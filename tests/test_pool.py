@@ -0,0 +1,80 @@
+import json
+
+import httpx
+import pytest
+
+from pyzayo.pool import ZayoClientPool, ACCOUNT_KEY, _tag_record, load_accounts
+
+
+class FakeTransport(httpx.MockTransport):
+    requires_auth = False
+    adaptive_paging = False
+
+    def __init__(self, records):
+        super().__init__(self.handle)
+        self.records = records
+        self.closed = 0
+
+    def handle(self, request):
+        paging = json.loads(request.content or b"{}").get("paging") or {}
+        skip, top = paging.get("skip", 0), paging.get("top", 50)
+        data = {
+            "metadata": {"totalRecordCount": len(self.records)},
+            "records": self.records[skip : skip + top],
+        }
+        return httpx.Response(200, json={"data": data})
+
+    async def aclose(self):
+        self.closed += 1
+
+
+ACCOUNTS = {
+    "east": {"client_id": "a", "client_secret": "x"},
+    "west": {"client_id": "b", "client_secret": "y", "rate": "50"},
+}
+
+
+@pytest.fixture()
+def transport():
+    return FakeTransport([{"caseNumber": f"C-{num}"} for num in range(3)])
+
+
+def test_fan_out_records_tagged(transport):
+    with ZayoClientPool(ACCOUNTS, transport=transport) as pool:
+        cases = pool.get_cases()
+
+    assert sorted((rec[ACCOUNT_KEY], rec["caseNumber"]) for rec in cases) == [
+        (account, f"C-{num}") for account in ("east", "west") for num in range(3)
+    ]
+
+
+def test_client_close_keeps_shared_transport(transport):
+    pool = ZayoClientPool(ACCOUNTS, transport=transport)
+    pool["east"].close()
+    assert transport.closed == 0
+
+    assert len(pool["west"].get_cases()) == 3
+
+    pool.close()
+    assert transport.closed == 1
+
+
+def test_tag_record_copies():
+    rec = {"caseNumber": "C-1"}
+    assert _tag_record(rec, "east") == {"caseNumber": "C-1", ACCOUNT_KEY: "east"}
+    assert ACCOUNT_KEY not in rec
+
+
+def test_load_accounts(tmp_path):
+    path = tmp_path / "accounts.ini"
+    path.write_text("[east]\nclient_id = a\nclient_secret = x\nrate = 5\n")
+    assert load_accounts(str(path)) == {
+        "east": {"client_id": "a", "client_secret": "x", "rate": "5"}
+    }
+
+    path.write_text("[west]\nclient_id = b\n")
+    with pytest.raises(ValueError, match="client_secret"):
+        load_accounts(str(path))
+
+    with pytest.raises(FileNotFoundError):
+        load_accounts(str(tmp_path / "missing.ini"))
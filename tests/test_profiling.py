@@ -0,0 +1,79 @@
+import io
+
+import pytest
+
+from pyzayo import profiling
+
+
+@pytest.fixture()
+def profiler():
+    profiler = profiling.enable()
+    yield profiler
+    profiling.disable()
+
+
+@profiling.timed("work")
+def work(value):
+    return value * 2
+
+
+def test_disabled_records_nothing():
+    assert profiling.active() is None
+    with profiling.phase("parse"):
+        pass
+    assert work(2) == 4
+    profiling.count("retries")
+    assert profiling.phase("parse") is profiling.phase("http")
+
+
+def test_phases_and_counters(profiler):
+    assert profiling.active() is profiler
+    with profiling.phase("parse"):
+        pass
+    with pytest.raises(ValueError):
+        with profiling.phase("parse"):
+            raise ValueError()
+    assert work(2) == 4
+    profiling.count("retries")
+    profiling.count("bytes.wire", 100)
+    profiling.count("bytes.wire", 20)
+
+    assert profiler.phases["parse"][0] == 2
+    assert profiler.phases["work"][0] == 1
+    calls, total, longest = profiler.phases["parse"]
+    assert 0 <= longest <= total
+    assert profiler.counters == {"retries": 1, "bytes.wire": 120}
+
+
+def test_disable_stops_recording(profiler):
+    assert profiling.disable() is profiler
+    assert profiler.stopped is not None
+    with profiling.phase("parse"):
+        pass
+    profiling.count("retries")
+    assert profiler.phases == {} and profiler.counters == {}
+
+
+def test_report(profiler):
+    profiler.add_phase("http", 0.25)
+    profiler.add_phase("http", 0.5)
+    profiler.add_phase("parse", 0.1)
+    profiler.add_count("retries", 2)
+    start = profiler.started
+    profiler.add_request("POST", "maintenance-cases", 200, start, 0.5, 2048)
+    profiler.add_request("GET", "existing-services", None, start + 0.25, 0.25, 0)
+    profiler.stop()
+
+    ofile = io.StringIO()
+    profiler.report(ofile)
+    lines = ofile.getvalue().splitlines()
+
+    assert lines[1].startswith("Profile: ")
+    assert lines[3].split()[:3] == ["phase", "calls", "total"]
+    assert lines[4].split() == ["http", "2", "0.750", "375.0", "500.0"]
+    assert lines[5].split() == ["parse", "1", "0.100", "100.0", "100.0"]
+    assert lines[6].split() == ["retries", "2"]
+    assert lines[8] == "Requests (2)"
+    assert lines[9].startswith("  +  0.000s   0.500s |#")
+    assert lines[9].endswith("| POST maintenance-cases 200 2.0kB")
+    assert lines[10].endswith("| GET existing-services error 0.0kB")
@@ -0,0 +1,49 @@
+from pyzayo.projection import make_projection
+
+
+def service():
+    return {
+        "serviceName": "service-1",
+        "components": [
+            {
+                "circuitId": "A",
+                "locations": [{"name": "a", "clli": "X"}, {"name": "z"}],
+            },
+            {"circuitId": "B", "locations": None},
+            {"circuitId": "C"},
+        ],
+    }
+
+
+def test_top_level_field():
+    rec = {"name": "N-1", "emailBody": "<html/>"}
+    make_projection(["emailBody"])(rec)
+    assert rec == {"name": "N-1"}
+
+
+def test_dotted_path_through_lists():
+    rec = service()
+    make_projection(["components.locations"])(rec)
+    assert rec["components"] == [
+        {"circuitId": "A"},
+        {"circuitId": "B"},
+        {"circuitId": "C"},
+    ]
+
+
+def test_nested_path_through_lists():
+    rec = service()
+    make_projection(["components.locations.clli", "serviceName"])(rec)
+    assert "serviceName" not in rec
+    assert rec["components"][0]["locations"] == [{"name": "a"}, {"name": "z"}]
+    assert rec["components"][1] == {"circuitId": "B", "locations": None}
+
+
+def test_missing_keys():
+    rec = service()
+    make_projection(["missing", "components.missing.name", "serviceName.x"])(rec)
+    assert rec == service()
+
+    rec = {}
+    make_projection(["components.locations"])(rec)
+    assert rec == {}
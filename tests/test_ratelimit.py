@@ -0,0 +1,49 @@
+import asyncio
+import time
+
+import pytest
+
+from pyzayo.ratelimit import TokenBucket
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_default_burst():
+    assert TokenBucket(2.5).burst == 3
+    assert TokenBucket(0.5).burst == 1
+    assert TokenBucket(5, burst=10).burst == 10
+
+
+def test_burst_without_waiting():
+    bucket = TokenBucket(rate=1, burst=5)
+
+    async def run():
+        for _ in range(5):
+            await bucket.acquire()
+
+    start = time.monotonic()
+    asyncio.run(run())
+    assert time.monotonic() - start < 0.5
+    assert bucket.waited == 0
+
+
+def test_sustained_rate():
+    bucket = TokenBucket(rate=100, burst=1)
+
+    async def run():
+        async def acquire():
+            async with bucket:
+                pass
+
+        await asyncio.gather(*(acquire() for _ in range(6)))
+
+    start = time.monotonic()
+    asyncio.run(run())
+    elapsed = time.monotonic() - start
+
+    # the first token is in the bucket, the other five accrue at 100/s.
+    assert elapsed >= 0.045
+    assert bucket.waited == pytest.approx(0.05, abs=0.01)
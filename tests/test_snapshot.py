@@ -0,0 +1,144 @@
+import pytest
+
+from pyzayo.snapshot import Snapshot, SnapshotWriter, SnapshotError, save_snapshot
+
+
+@pytest.fixture()
+def snapshot(tmp_path):
+    path = str(tmp_path / "test.snap")
+    writer = SnapshotWriter(path)
+    for num in range(10):
+        writer.add(
+            "cases",
+            {
+                "caseNumber": f"C-{num}",
+                "status": "Closed" if num % 2 else "Scheduled",
+                "primaryDate": f"2026-01-{10 - num:02d}",
+                "city": "Denver" if num < 5 else "Chicago",
+            },
+        )
+    writer.close()
+
+    snap = Snapshot(path)
+    yield snap
+    snap.close()
+
+
+def case_nums(recs):
+    return [rec["caseNumber"] for rec in recs]
+
+
+def test_lookup(snapshot):
+    assert case_nums(snapshot.lookup("cases", "caseNumber", "C-3")) == ["C-3"]
+    assert snapshot.lookup("cases", "caseNumber", "C-99") == []
+
+
+def test_select_indexed_filter_ordered(snapshot):
+    total, recs = snapshot.select(
+        "cases", filters={"status": "Scheduled"}, order_by=["primaryDate asc"]
+    )
+    assert total == 5
+    assert case_nums(recs) == ["C-8", "C-6", "C-4", "C-2", "C-0"]
+
+
+def test_select_pages_scan_once(snapshot, monkeypatch):
+    decoded = []
+    record = Snapshot.record
+
+    def counted(self, collection, pos):
+        decoded.append(pos)
+        return record(self, collection, pos)
+
+    monkeypatch.setattr(Snapshot, "record", counted)
+
+    filters = {"city": "Denver"}
+    pages = [
+        snapshot.select("cases", filters=filters, skip=skip, top=2)
+        for skip in range(0, 6, 2)
+    ]
+    assert [total for total, _ in pages] == [5, 5, 5]
+    assert [case_nums(recs) for _, recs in pages] == [
+        ["C-0", "C-1"],
+        ["C-2", "C-3"],
+        ["C-4"],
+    ]
+    # one scan of the 10 records, then only the records of each page.
+    assert len(decoded) == 10 + 5
+
+
+def test_select_unindexed_order_desc(snapshot):
+    total, recs = snapshot.select(
+        "cases", filters={"status": "Closed"}, order_by=["city desc"], top=3
+    )
+    assert total == 5
+    assert [rec["city"] for rec in recs] == ["Denver", "Denver", "Chicago"]
+
+
+def test_not_a_snapshot(tmp_path):
+    path = tmp_path / "bad.snap"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(SnapshotError):
+        Snapshot(str(path))
+
+
+class FakeClient(object):
+    def iter_case_pages(self):
+        yield [{"caseNumber": "C-1", "status": "Scheduled"}]
+        yield [{"caseNumber": "C-2", "status": "Closed"}]
+
+    def iter_impact_pages(self):
+        yield [{"caseNumber": "C-1", "circuitId": "/OGYX/1/ZYO/"}]
+
+    def iter_service_pages(self):
+        return iter(())
+
+    def get_cases_notifications(self, by_case_nums):
+        assert by_case_nums == ["C-1"]
+        return {"C-1": ([{"name": "N-1"}], [{"name": "N-1", "emailBody": "x"}])}
+
+
+def test_save_snapshot_progress(tmp_path):
+    progress = []
+    path = str(tmp_path / "saved.snap")
+    counts = save_snapshot(
+        FakeClient(), path, on_progress=lambda *args: progress.append(args)
+    )
+    assert counts == {
+        "cases": 2,
+        "impacts": 1,
+        "notifications": 1,
+        "notification_details": 1,
+    }
+    assert progress == [("cases", 1), ("cases", 2), ("impacts", 1)]
+
+    snap = Snapshot(path)
+    notifs = snap.lookup("notifications", "caseNumber", "C-1")
+    assert [rec["name"] for rec in notifs] == ["N-1"]
+    assert snap.lookup("notification_details", "name", "N-1")[0]["emailBody"] == "x"
+    snap.close()
+
+
+class FailingClient(FakeClient):
+    def iter_impact_pages(self):
+        yield [{"caseNumber": "C-1", "circuitId": "/OGYX/1/ZYO/"}]
+        raise RuntimeError("429 Too Many Requests")
+
+
+def test_failed_save_keeps_snapshot(tmp_path):
+    path = str(tmp_path / "saved.snap")
+    save_snapshot(FakeClient(), path)
+
+    with pytest.raises(RuntimeError):
+        save_snapshot(FailingClient(), path)
+
+    assert [p.name for p in tmp_path.iterdir()] == ["saved.snap"]
+    snap = Snapshot(path)
+    assert len(snap.lookup("impacts", "caseNumber", "C-1")) == 1
+    assert len(snap.lookup("notifications", "caseNumber", "C-1")) == 1
+    snap.close()
+
+
+def test_failed_save_no_snapshot(tmp_path):
+    with pytest.raises(RuntimeError):
+        save_snapshot(FailingClient(), str(tmp_path / "saved.snap"))
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,55 @@
+from pyzayo.svcinv_store import ServiceInventory
+from pyzayo.svcinv_join import ServiceJoin
+
+from api_records import impact_record as impact
+
+
+def service(name, circuit_id):
+    return {"serviceName": name, "components": [{"circuitId": circuit_id}]}
+
+
+INVENTORY = ServiceInventory(
+    [
+        [
+            service("svc0", "/OGYX/100000/ZYO/"),
+            service("svc1", "/OGYX/100001/ZYO/"),
+            service("svc1-dup", "/OGYX/100001/ZYO/"),
+        ]
+    ]
+)
+
+
+def test_service_normalized_lookup():
+    join = ServiceJoin(INVENTORY)
+    assert join.service("ogyx 100000 zyo")["service_name"] == "svc0"
+    assert join.service("/OGYX/100001/ZYO/")["service_name"] == "svc1"
+    assert join.service("/OGYX/999999/ZYO/") is None
+
+
+def test_join_impacts():
+    impacts = [impact("C-1", "/OGYX/100000/ZYO/"), impact("C-1", "/XXXX/1/")]
+    joined = [
+        (imp["circuitId"], svc and svc["service_name"])
+        for imp, svc in ServiceJoin(INVENTORY).join_impacts(impacts)
+    ]
+    assert joined == [("/OGYX/100000/ZYO/", "svc0"), ("/XXXX/1/", None)]
+
+
+def test_case_services():
+    impacts = [
+        impact("C-1", "/OGYX/100000/ZYO/"),
+        impact("C-1", "/OGYX/100001/ZYO/"),
+        impact("C-2", "/OGYX/999999/ZYO/"),
+    ]
+    services = ServiceJoin(INVENTORY).case_services(impacts)
+    assert {
+        case_num: [svc["service_name"] for svc in svcs]
+        for case_num, svcs in services.items()
+    } == {"C-1": ["svc0", "svc1"]}
+
+
+def test_custom_normalize_shares_inventory_map():
+    join_a = ServiceJoin(INVENTORY, normalize=str.lower)
+    join_b = ServiceJoin(INVENTORY, normalize=str.lower)
+    assert join_a._circuit_rows is join_b._circuit_rows
+    assert join_a.service("/ogyx/100000/zyo/")["service_name"] == "svc0"
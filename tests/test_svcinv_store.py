@@ -0,0 +1,104 @@
+import math
+
+import pytest
+
+from pyzayo import svcinv_store
+from pyzayo.svcinv_store import ServiceInventory, parse_bandwidth
+from pyzayo.circuit_id import normalize_circuit_id
+
+
+def service(name, status, group, circuit_id, bandwidth, state_a, state_z):
+    return {
+        "serviceName": name,
+        "status": status,
+        "productGroup": group,
+        "components": [
+            {
+                "circuitId": circuit_id,
+                "bandwidth": bandwidth,
+                "locations": [
+                    {"state": state_a, "clli": f"{state_a}CLLI"},
+                    {"state": state_z, "clli": f"{state_z}CLLI"},
+                ],
+            }
+        ],
+    }
+
+
+SERVICES = [
+    service("svc0", "Active", "Waves", "/OGYX/100000/ZYO/", "10 Gbps", "CO", "IL"),
+    service("svc1", "Active", "Dark Fiber", "/OGYX/100001/ZYO/", "n/a", "TX", "CO"),
+    service("svc2", "Disconnected", "Waves", "/OGYX/100002/ZYO/", "100M", "NY", "IL"),
+    service("svc3", "Active", "Waves", None, "1 Gbps", "NY", "TX"),
+]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def inventory(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(svcinv_store, "np", None)
+    elif svcinv_store.np is None:
+        pytest.skip("numpy is not installed")
+    return ServiceInventory([SERVICES[:2], SERVICES[2:]])
+
+
+def names(view):
+    return [row["service_name"] for row in view]
+
+
+@pytest.mark.parametrize(
+    "value, mbps", [("10 Gbps", 1e4), ("100Mbps", 100.0), ("512 kbps", 0.512)]
+)
+def test_parse_bandwidth(value, mbps):
+    assert parse_bandwidth(value) == pytest.approx(mbps)
+
+
+def test_parse_bandwidth_unknown():
+    assert math.isnan(parse_bandwidth("n/a"))
+    assert math.isnan(parse_bandwidth(None))
+
+
+def test_rows(inventory):
+    assert len(inventory) == 4
+    row = inventory.row(0)
+    assert row["circuit_id"] == "/OGYX/100000/ZYO/"
+    assert row["bandwidth_mbps"] == 1e4
+    assert dict(row)["z_state"] == "IL"
+    with pytest.raises(IndexError):
+        inventory.row(4)
+
+
+def test_filters(inventory):
+    active = inventory.by_status("Active")
+    assert names(active) == ["svc0", "svc1", "svc3"]
+    assert names(active.by_product_group("Waves")) == ["svc0", "svc3"]
+    assert names(inventory.by_location(state="CO")) == ["svc0", "svc1"]
+    assert names(active.by_location(state="IL")) == ["svc0"]
+    assert names(inventory.by_status("Pending")) == []
+
+
+def test_group_counts(inventory):
+    assert inventory.group_counts("status") == {"Active": 3, "Disconnected": 1}
+    assert inventory.by_location(state="IL").group_counts("product_group") == {
+        "Waves": 2
+    }
+
+
+def test_total_bandwidth_ignores_unknown(inventory):
+    assert inventory.by_status("Active").total_bandwidth_mbps() == 11e3
+
+
+def test_find_circuit_normalized(inventory):
+    assert inventory.find_circuit("OGYX/100002/ZYO")["service_name"] == "svc2"
+    assert inventory.find_circuit("/OGYX/999999/ZYO/") is None
+
+
+def test_circuit_map_lazy_and_shared(inventory):
+    assert not inventory._circuit_maps
+    circuit_map = inventory.circuit_map()
+    assert inventory.circuit_map() is circuit_map
+    assert set(circuit_map.values()) == {0, 1, 2}
+
+    inventory.ingest([SERVICES[0]])
+    assert not inventory._circuit_maps
+    assert inventory.circuit_map()[normalize_circuit_id("/OGYX/100000/ZYO/")] == 0